@@ -0,0 +1,64 @@
+"""Time to open the data screen, re-sort it and filter it for a long session.
+
+Runs the screen headless and waits for each refresh to finish.
+Run with `python benchmarks/bench_data_screen.py [n]`.
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from textual.app import App
+
+from mentalmath.data.data_screen import DataScreen
+from mentalmath.data.session_log import SessionLog
+
+SORT_KEYS = "ttooeeqq"
+FILTERS = ("op=÷", "op=÷, mistakes>0", "time>p90", "left=7", "left=7, time>p90", "")
+
+
+def make_log(n: int) -> SessionLog:
+    rng = random.Random(0)
+    log = SessionLog()
+    for _ in range(n):
+        log.append(
+            rng.choice("+-×÷"),
+            rng.randint(1, 999),
+            rng.randint(1, 99),
+            rng.uniform(0.3, 9.0),
+            rng.randint(0, 3),
+            out_of_time=False,
+        )
+    return log
+
+
+async def run(log: SessionLog) -> None:
+    app = App()
+    async with app.run_test(size=(100, 40)) as pilot:
+        start = time.perf_counter()
+        await app.push_screen(DataScreen(log))
+        await pilot.pause()
+        print(f"{'open':<8}{(time.perf_counter() - start) * 1e3:>10,.1f} ms")
+        for key in SORT_KEYS:
+            start = time.perf_counter()
+            await pilot.press(key)
+            await pilot.pause()
+            print(f"{'sort ' + key:<8}{(time.perf_counter() - start) * 1e3:>10,.1f} ms")
+        screen = app.screen
+        for text in FILTERS:
+            start = time.perf_counter()
+            screen.filter_input.value = text
+            await pilot.pause()
+            elapsed = (time.perf_counter() - start) * 1e3
+            print(f"filter {text!r:<24}{elapsed:>10,.1f} ms")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n:,} answers")
+    asyncio.run(run(make_log(n)))
+
+
+if __name__ == "__main__":
+    main()
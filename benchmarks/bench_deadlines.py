@@ -0,0 +1,77 @@
+"""Idle CPU use and timeout accuracy of the question screen.
+
+Runs the app headless, leaves a question unanswered and reports the CPU
+share used while waiting, then lets a short timer expire repeatedly and
+reports how late each timeout fired. Run with
+`python benchmarks/bench_deadlines.py`.
+"""
+
+import asyncio
+import statistics
+import time
+
+from mentalmath.main import MentalMathApp
+from mentalmath.questions.question_screen import QuestionScreen
+
+OP_MAXES = {"multiplication": 99}
+IDLE_SECONDS = 3.0
+TIMEOUT = 0.25
+TIMEOUTS = 20
+
+
+async def open_quiz(
+    app: MentalMathApp, timer: str | None, vanish: str | None
+) -> QuestionScreen:
+    screen = QuestionScreen(OP_MAXES, TIMEOUTS + 10, timer, vanish=vanish)
+    app.run_worker(app.push_screen_wait(screen))
+    while not hasattr(screen, "qui") or not screen.qui.is_mounted:
+        await asyncio.sleep(0.01)
+    return screen
+
+
+async def idle_cpu(timer: str | None, vanish: str | None) -> float:
+    app = MentalMathApp()
+    async with app.run_test():
+        await open_quiz(app, timer, vanish)
+        await asyncio.sleep(0.5)
+        start = time.process_time()
+        await asyncio.sleep(IDLE_SECONDS)
+        return (time.process_time() - start) / IDLE_SECONDS
+
+
+async def timeout_lateness() -> list[float]:
+    app = MentalMathApp()
+    lateness = []
+    async with app.run_test():
+        qui = (await open_quiz(app, str(TIMEOUT), None)).qui
+        out_of_time = qui.out_of_time
+
+        def record() -> None:
+            deadline = qui.session.start_time + TIMEOUT
+            lateness.append(time.monotonic() - deadline)
+            out_of_time()
+
+        qui.out_of_time = record
+        # The first question's deadline was set before the patch.
+        await asyncio.sleep(TIMEOUT * (TIMEOUTS + 1.5))
+    return lateness
+
+
+def main() -> None:
+    for label, timer, vanish in (
+        ("no timer", None, None),
+        ("vanish", None, "1"),
+        ("timer", "10", None),
+    ):
+        share = asyncio.run(idle_cpu(timer, vanish))
+        print(f"idle CPU, {label:<9} {share * 100:6.2f}%")
+    lateness = sorted(asyncio.run(timeout_lateness()))
+    print(
+        f"timeout lateness over {len(lateness)} questions: "
+        f"median {statistics.median(lateness) * 1e3:.2f} ms, "
+        f"max {lateness[-1] * 1e3:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Exporting answers to each format, from a session log and from the history.
+
+Fills a SessionLog and a history database with n answers, exports both to
+CSV, JSON Lines and .npy columns in a temporary directory, and prints
+answers per second and the most memory the export allocated on top of the
+data it read, which should stay flat as n grows.
+Run with `python benchmarks/bench_export.py [n ...]`.
+"""
+
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+from mentalmath.data.export import (
+    HISTORY_COLUMNS,
+    SESSION_COLUMNS,
+    session_chunks,
+    write_export,
+)
+from mentalmath.data.history import INSERT_ANSWER, HistoryStore
+from mentalmath.data.session_log import SessionLog
+
+OPERATIONS: tuple[str, ...] = ("addition", "multiplication", "division", "square_root")
+TARGETS: tuple[str, ...] = ("answers.csv", "answers.jsonl", "columns")
+
+
+def filled(n: int, history: HistoryStore) -> SessionLog:
+    """A session log of n answers, also written to the history database."""
+    rng = random.Random(0)
+    log = SessionLog()
+    for i in range(n):
+        log.append(
+            OPERATIONS[i % len(OPERATIONS)],
+            rng.randint(1, 999),
+            rng.randint(1, 99),
+            rng.uniform(0.5, 10),
+            rng.random() < 0.2,
+            rng.random() < 0.05,
+        )
+    session_id = uuid.uuid4().hex
+    with history.connect() as connection:
+        connection.executemany(
+            INSERT_ANSWER,
+            (
+                (session_id, *row, row[0] * 0.01)
+                for rows in session_chunks(log)
+                for row in rows
+            ),
+        )
+    return log
+
+
+def exports(log: SessionLog, history: HistoryStore) -> dict[str, Callable]:
+    """Functions exporting the session log and the history to a path."""
+    return {
+        "session": lambda path: write_export(
+            session_chunks(log), SESSION_COLUMNS, str(path)
+        ),
+        "history": lambda path: write_export(
+            history.answer_chunks(), HISTORY_COLUMNS, str(path)
+        ),
+    }
+
+
+def measure(export: Callable[[Path], int], path: Path) -> tuple[float, float]:
+    """Answers per second and peak MB allocated while exporting to path."""
+    start = time.perf_counter()
+    count = export(path)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    export(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count / seconds, peak / 2**20
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            history = HistoryStore(root / "history.sqlite3")
+            log = filled(n, history)
+            sources = exports(log, history)
+            print(f"{n:,} answers")
+            for source, export in sources.items():
+                for target in TARGETS:
+                    rate, peak = measure(export, root / f"{source}-{target}")
+                    print(f"  {source:<8}{target:<15}{rate:>12,.0f}/s{peak:>8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Questions per second for scalar new() against new_batch().
+
+Run with `python benchmarks/bench_generation.py [n]`.
+"""
+
+import random
+import sys
+import time
+
+from mentalmath.config import CONFIG
+
+TOP = 999
+SPECIAL = 7
+
+
+def rate(n: int, seconds: float) -> str:
+    return f"{n / seconds:>14,.0f}/s"
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'operation':<26}{'new()':>16}{'new_batch()':>16}")
+    for name, cls in CONFIG.OPERATIONS.items():
+        question = cls(rng=random.Random(0), num=SPECIAL)
+        start = time.perf_counter()
+        for _ in range(n):
+            question.new(TOP)
+        scalar = time.perf_counter() - start
+
+        question = cls(rng=random.Random(0), num=SPECIAL)
+        start = time.perf_counter()
+        question.new_batch(TOP, n)
+        batch = time.perf_counter() - start
+        print(f"{name:<26}{rate(n, scalar)}{rate(n, batch)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Grading throughput and peak memory as the answer sheet grows.
+
+Writes a JSON Lines worksheet and a fully answered CSV sheet of increasing
+length to a temporary directory, grades it to /dev/null, and prints rows per
+second and the process's peak resident memory so far, which should stay
+flat. Also compares decoding the worksheet a batch at a time with one
+json.loads per line.
+Run with `python benchmarks/bench_grade.py [--workers N] [--max N]`.
+"""
+
+import argparse
+import csv
+import json
+import os
+import resource
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+
+from mentalmath.grading import BATCH_SIZE, parse_records, write_grades
+from mentalmath.worksheet import write_worksheet
+
+OP_MAXES = {
+    "multiplication": 99,
+    "division": 999,
+    "square_root": 99,
+    "fraction_multiplication": 20,
+    "complex_multiplication": 20,
+    "calendar": 1,
+}
+
+
+def make_sheets(directory: Path, n: int) -> tuple[Path, Path]:
+    """A worksheet of n questions and an answer sheet answering all of them."""
+    questions, key = directory / "questions.jsonl", directory / "key.jsonl"
+    with open(questions, "w") as output, open(key, "w") as answers:
+        write_worksheet(OP_MAXES, n, 0, output, answers, "jsonl")
+    sheet = directory / "answers.csv"
+    with open(key) as answers, open(sheet, "w", newline="") as output:
+        writer = csv.writer(output)
+        writer.writerow(("number", "answer", "time"))
+        for line in answers:
+            row = json.loads(line)
+            writer.writerow((row["number"], row["answer"], row["number"] % 9 + 1))
+    return questions, sheet
+
+
+def parse_seconds(questions: Path) -> tuple[float, float]:
+    """Seconds to decode the worksheet in batches and line by line."""
+    with open(questions) as file:
+        start = time.perf_counter()
+        while lines := list(islice(file, BATCH_SIZE)):
+            parse_records(lines, "questions", 1)
+        batched = time.perf_counter() - start
+    with open(questions) as file:
+        start = time.perf_counter()
+        for line in file:
+            json.loads(line)
+        per_line = time.perf_counter() - start
+    return batched, per_line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--backend", default="interpreter")
+    parser.add_argument("--max", type=int, default=3_000_000)
+    args = parser.parse_args()
+    n = 100_000
+    print(f"{'rows':>12}{'graded':>14}{'batch parse':>14}{'per line':>12}{'peak':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        while n <= args.max:
+            questions, sheet = make_sheets(Path(directory), n)
+            batched, per_line = parse_seconds(questions)
+            with (
+                open(questions) as question_file,
+                open(sheet, newline="") as answer_file,
+                open(os.devnull, "w", newline="") as output,
+            ):
+                start = time.perf_counter()
+                grades = write_grades(
+                    question_file, answer_file, output, args.workers, args.backend
+                )
+                seconds = time.perf_counter() - start
+            assert grades.results["right"] == n
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(
+                f"{n:>12,}{n / seconds:>12,.0f}/s{n / batched:>12,.0f}/s"
+                f"{n / per_line:>10,.0f}/s{peak:>7.1f} MB"
+            )
+            n *= 3
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Cost of saving answers to the SQLite history store.
+
+Times HistoryStore.append() on the caller's side, which is all the quiz
+waits for, and how long the writer thread takes to get everything to disk.
+Run with `python benchmarks/bench_history.py [n]`.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mentalmath.data.history import HistoryStore
+from mentalmath.questions.session import QuizSession
+
+OP_MAXES = {"addition": 999, "multiplication": 99, "square": 99, "mod": 999}
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as directory:
+        store = HistoryStore(Path(directory) / "history.sqlite3")
+        store.start()
+        session = QuizSession(OP_MAXES, n, history=store)
+        clock = 0.0
+        start = time.perf_counter()
+        while (question := session.next_question(clock)) is not None:
+            clock += 1.0
+            session.submit(str(question.correct), clock)
+        queued = time.perf_counter() - start
+        store.flush()
+        written = time.perf_counter() - start
+        store.close()
+        connection = store.connect()
+        (rows,) = connection.execute("SELECT count(*) FROM answers").fetchone()
+        connection.close()
+
+    print(f"{n:,} answers, {rows:,} rows written")
+    print(f"quiz loop with history: {n / queued:>12,.0f} answers/s")
+    print(f"written to disk:        {n / written:>12,.0f} answers/s")
+
+
+if __name__ == "__main__":
+    main()
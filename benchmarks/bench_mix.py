@@ -0,0 +1,59 @@
+"""Cost of picking the next question's operation.
+
+Compares the old `random.choice(list(op_maxes.keys()))`, weighted
+`random.choices`, and an OperationMix alias table, for mixes of a few
+operations up to every operation in the menu.
+Run with `python benchmarks/bench_mix.py [n]`.
+"""
+
+import random
+import sys
+import timeit
+from collections.abc import Callable
+
+from mentalmath.config import CONFIG
+from mentalmath.questions.mix import OperationMix
+
+LABELS: tuple[str, ...] = ("choice(list)", "choices", "alias")
+
+
+def pickers(
+    rng: random.Random, op_maxes: dict[str, int], weights: dict[str, float]
+) -> tuple[Callable[[], str], ...]:
+    """One way of picking an operation for each of LABELS."""
+    weight_list = list(weights.values())
+    mix = OperationMix(op_maxes, weights)
+    return (
+        lambda: rng.choice(list(op_maxes.keys())),
+        lambda: rng.choices(list(op_maxes), weight_list)[0],
+        lambda: mix.choose(rng),
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    names = CONFIG.OPERATIONS.menu_names()
+    rng = random.Random(0)
+    print(f"{'operations':>10}" + "".join(f"{label:>16}" for label in LABELS))
+    for size in (3, 8, len(names)):
+        op_maxes = dict.fromkeys(names[:size], 99)
+        weights = {name: rng.uniform(0.5, 5) for name in op_maxes}
+        cases = pickers(rng, op_maxes, weights)
+        row = f"{size:>10}"
+        for case in cases:
+            seconds = min(timeit.repeat(case, number=n, repeat=3)) / n
+            row += f"{seconds * 1e9:>13.0f} ns"
+        print(row)
+    rebuild = OperationMix(names)
+    rounds = n // 10
+
+    def reweight() -> None:
+        rebuild.update({names[0]: rng.uniform(0.5, 5)})
+        rebuild.choose(rng)
+
+    seconds = timeit.timeit(reweight, number=rounds) / rounds
+    print(f"\nReweight and rebuild, {len(names)} operations: {seconds * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
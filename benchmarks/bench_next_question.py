@@ -0,0 +1,62 @@
+"""Time taken on the UI thread to fetch the next question.
+
+Compares generating inline, as QuestionUI did before prefetching, with
+taking a question off a QuestionPrefetcher kept full by a worker thread.
+Run with `python benchmarks/bench_next_question.py [n]`.
+"""
+
+import statistics
+import sys
+import threading
+import time
+
+from mentalmath.questions.prefetch import QuestionPrefetcher
+
+OP_MAXES = {
+    "multiplication": 99,
+    "division": 999,
+    "fraction_addition": 99,
+    "complex_multiplication": 99,
+    "calendar": 1,
+}
+
+
+def summarize(label: str, samples: list[float]) -> None:
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99)]
+    print(
+        f"{label:<12} median {statistics.median(samples) * 1e6:7.2f} µs"
+        f"   p99 {p99 * 1e6:7.2f} µs"
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    prefetch = QuestionPrefetcher(OP_MAXES)
+
+    inline = []
+    for _ in range(n):
+        start = time.perf_counter()
+        with prefetch.lock:
+            prefetch.generate()
+        inline.append(time.perf_counter() - start)
+
+    worker = threading.Thread(target=prefetch.fill)
+    worker.start()
+    prefetched = []
+    for _ in range(n):
+        # Give the worker the slice of time a person takes to answer.
+        while not prefetch.full:
+            time.sleep(0)
+        start = time.perf_counter()
+        prefetch.get()
+        prefetched.append(time.perf_counter() - start)
+    prefetch.stop()
+    worker.join()
+
+    summarize("inline", inline)
+    summarize("prefetched", prefetched)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Micro-benchmarks for generating and checking every operation.
+
+Times new() and verify_correct() (right and wrong answers) for each class in
+CONFIG.OPERATIONS over a range of maximums, plus the answer parsers and
+random_date(). Results are seconds per call, keyed by benchmark name.
+
+    python benchmarks/bench_operations.py --save baseline.json
+    python benchmarks/bench_operations.py --compare baseline.json --threshold 25
+
+Comparing exits with status 1 if any benchmark got slower than the threshold.
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+
+from mentalmath.config import CONFIG
+from mentalmath.operations import (
+    ComplexMultiplication,
+    Division,
+    QuestionInfo,
+    complex_number_parser,
+    parse_division,
+    parse_fraction,
+    random_date,
+)
+
+TOPS: tuple[int, ...] = (10, 10**3, 10**6, 10**9, 10**12, 10**18)
+# Exponents past this make the answers themselves the benchmark.
+POWERS_MAX_TOP: int = 10**3
+SPECIAL: int = 7
+TARGET_SECONDS: float = 0.02
+REPEAT: int = 5
+
+
+def per_call(fn: Callable[[], object]) -> float:
+    """Best time per call over REPEAT runs of about TARGET_SECONDS each."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while timer.timeit(number) < TARGET_SECONDS:
+        number *= 10
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def answer_for(question: QuestionInfo) -> str:
+    correct = question.correct
+    if isinstance(question, Division):
+        return f"{correct[0]} r {correct[1]}"
+    if isinstance(question, ComplexMultiplication):
+        sign = "+" if correct.imag >= 0 else "-"
+        return f"{int(correct.real)} {sign} {abs(int(correct.imag))}i"
+    if isinstance(correct, tuple):
+        return f"{correct[0]} / {correct[1]}"
+    if isinstance(correct, float):
+        return f"{correct:.2f}"
+    return str(correct)
+
+
+def tops_for(name: str) -> tuple[int, ...]:
+    if name == "calendar":
+        return (1,)
+    if name == "powers":
+        return tuple(top for top in TOPS if top <= POWERS_MAX_TOP)
+    return TOPS
+
+
+def operation_benchmarks() -> Iterator[tuple[str, Callable[[], object]]]:
+    for name, cls in CONFIG.OPERATIONS.items():
+        for top in tops_for(name):
+            question = cls(rng=random.Random(0), num=SPECIAL)
+            yield f"{name}.new[{top:.0e}]", lambda q=question, t=top: q.new(t)
+            question.new(top)
+            right = answer_for(question)
+            yield (
+                f"{name}.verify_right[{top:.0e}]",
+                lambda q=question, a=right: q.verify_correct(a),
+            )
+            yield (
+                f"{name}.verify_wrong[{top:.0e}]",
+                lambda q=question: q.verify_correct("x"),
+            )
+
+
+def parser_benchmarks() -> Iterator[tuple[str, Callable[[], object]]]:
+    yield "complex_number_parser", lambda: complex_number_parser("-12 + 345i")
+    yield "parse_fraction", lambda: parse_fraction("123 / 4567")
+    yield "parse_division", lambda: parse_division("1234 r 56")
+    rng = random.Random(0)
+    yield "random_date", lambda: random_date(rng)
+    yield "random_date[1-9999]", lambda: random_date(rng, 1, 9999)
+
+
+def run() -> dict[str, float]:
+    results = {}
+    for name, fn in (*operation_benchmarks(), *parser_benchmarks()):
+        results[name] = per_call(fn)
+        print(f"{name:<48}{results[name] * 1e9:>12,.0f} ns", flush=True)
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Names of benchmarks more than threshold percent slower than baseline."""
+    slower = []
+    for name, seconds in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        change = (seconds - before) / before * 100
+        if change > threshold:
+            slower.append(name)
+            print(
+                f"SLOWER {name}: {before * 1e9:,.0f} -> {seconds * 1e9:,.0f} ns "
+                f"(+{change:.0f}%)"
+            )
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="JSON baseline to check")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=25.0,
+        help="percent slowdown that fails --compare (default: 25)",
+    )
+    args = parser.parse_args()
+
+    results = run()
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+        print(f"No benchmark more than {args.threshold:.0f}% slower.")
+
+
+if __name__ == "__main__":
+    main()
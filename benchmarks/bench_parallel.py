@@ -0,0 +1,59 @@
+"""Worksheet generation on each parallel backend: serial, subinterpreters, processes.
+
+Renders the same seeded worksheet in chunks with mentalmath.parallel and
+prints questions per second and the speed-up over serial, and checks every
+backend gives the same output. Run on a machine with several cores.
+Run with `python benchmarks/bench_parallel.py [questions] [workers]`.
+"""
+
+import hashlib
+import os
+import sys
+import time
+import warnings
+
+from mentalmath import parallel
+from mentalmath.worksheet import chunks, render_chunk
+
+OP_MAXES = {
+    "multiplication": 99,
+    "division": 999,
+    "square_root": 99,
+    "fraction_multiplication": 20,
+    "calendar": 1,
+}
+
+
+def run(n: int, workers: int, backend: str) -> tuple[float, str, str]:
+    """Seconds taken, a digest of the output, and the backend actually used."""
+    digest = hashlib.blake2b()
+    work = chunks(OP_MAXES, n, 0, "csv", False)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        start = time.perf_counter()
+        for questions, _ in parallel.ordered_map(render_chunk, work, workers, backend):
+            digest.update(questions.encode())
+        seconds = time.perf_counter() - start
+    used = "process (fallback)" if caught else backend
+    return seconds, digest.hexdigest(), used
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    print(f"{n:,} questions, {workers} workers, {os.cpu_count()} CPUs")
+    serial, expected, _ = run(n, 1, "serial")
+    print(f"  {'serial':<20}{n / serial:>12,.0f}/s")
+    for backend in ("interpreter", "process"):
+        if backend == "interpreter" and parallel.InterpreterPoolExecutor is None:
+            print(f"  {backend:<20}not available in this Python")
+            continue
+        seconds, digest, used = run(n, workers, backend)
+        print(
+            f"  {used:<20}{n / seconds:>12,.0f}/s {serial / seconds:>6.2f}x"
+            f"   same output: {digest == expected}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Parses per second for the answer scanners and the parsing they replaced.
+
+The regex and int()/float() versions that verify_correct used before
+mentalmath.parsing come from tests/test_parsing.py, which checks that both
+agree. Run from the repository root with `python -m benchmarks.bench_parsing`.
+"""
+
+import timeit
+
+from tests.test_parsing import PAIRS, SAMPLES, reference
+
+
+def throughput() -> None:
+    for name, (old, new) in PAIRS.items():
+        texts = SAMPLES[name] * 250
+        for label, fn in (("before", old), ("after", new)):
+            seconds = min(
+                timeit.repeat(
+                    lambda f=fn, ts=texts: [reference(f, t) for t in ts],
+                    number=20,
+                    repeat=5,
+                )
+            )
+            print(f"{name:<10} {label:<7} {len(texts) * 20 / seconds:>12,.0f} parses/s")
+
+
+def main() -> None:
+    throughput()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Cost of choosing and rescheduling facts as the number tracked grows.
+
+Fills a FactScheduler with n multiplication facts on a fake clock, then
+times next_due() followed by review(), which is what every question costs,
+and loading the facts back from a history database.
+Run with `python benchmarks/bench_scheduler.py`.
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from mentalmath.data.history import HistoryStore
+from mentalmath.questions.scheduler import FactScheduler
+
+SIZES: tuple[int, ...] = (1_000, 10_000, 100_000)
+ROUNDS: int = 20_000
+
+
+def filled(n: int, clock: list[float], history: HistoryStore) -> FactScheduler:
+    """A scheduler tracking n multiplication facts, all due within an hour."""
+    side = int(n**0.5) + 1
+    scheduler = FactScheduler(
+        {"multiplication": side}, history=history, clock=lambda: clock[0]
+    )
+    rng = random.Random(0)
+    cls = scheduler.operations["multiplication"]
+    for i in range(n):
+        question = cls()
+        question.ask(i // side + 1, i % side + 1)
+        clock[0] = rng.uniform(-3600, 0)
+        scheduler.review(question, rng.uniform(1, 10), rng.random() < 0.2, False)
+    clock[0] = 0.0
+    return scheduler
+
+
+def main() -> None:
+    print(f"{'facts':>8}{'next + review':>16}{'load':>12}")
+    for n in SIZES:
+        with tempfile.TemporaryDirectory() as directory:
+            history = HistoryStore(Path(directory) / "history.sqlite3")
+            history.start()
+            clock = [0.0]
+            scheduler = filled(n, clock, history)
+            history.flush()
+            rng = random.Random(1)
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                clock[0] += 1
+                question = scheduler.next_due()
+                if question is not None:
+                    scheduler.review(question, rng.uniform(1, 10), 0, False)
+            per_question = (time.perf_counter() - start) / ROUNDS
+            history.flush()
+            start = time.perf_counter()
+            reloaded = FactScheduler({"multiplication": n}, history=history)
+            reloaded.load()
+            load = time.perf_counter() - start
+            history.close()
+        assert len(reloaded.facts) == n
+        print(f"{n:>8,}{per_question * 1e6:>13.1f} µs{load * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Scripted answers per second through a headless QuizSession.
+
+Every question is answered wrong once and then right, with a fake clock.
+Run with `python benchmarks/bench_session.py [n]`.
+"""
+
+import sys
+import time
+
+from mentalmath.questions.session import QuizSession
+
+OP_MAXES = {"addition": 999, "multiplication": 99, "square": 99, "mod": 999}
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    session = QuizSession(OP_MAXES, n)
+    clock = 0.0
+    start = time.perf_counter()
+    while (question := session.next_question(clock)) is not None:
+        clock += 1.0
+        session.submit("x", clock)
+        clock += 0.5
+        session.submit(str(question.correct), clock)
+    elapsed = time.perf_counter() - start
+    answers = 2 * n
+    print(f"{n:,} questions, {answers:,} answers in {elapsed:.2f} s")
+    print(f"{answers / elapsed:,.0f} answers/s, {n / elapsed:,.0f} questions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Memory per answer and summary time: dict[int, AnswerData] against SessionLog.
+
+The operands are made before measuring, since both layouts hold the same
+objects for them. The summary is the set of statistics EndScreen shows:
+recomputed from the dict, and read from the running statistics that the
+log keeps up to date as answers are appended.
+Run with `python benchmarks/bench_session_log.py [n]`.
+"""
+
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Sequence
+
+from mentalmath.data.running_stats import RunningStats
+from mentalmath.data.session_log import SessionLog
+from mentalmath.operations import AnswerData
+
+SYMBOLS = ("+", "-", "×", "÷", "mod")
+
+Row = tuple[str, int, int, float, int, bool]
+
+
+def make_rows(n: int) -> list[Row]:
+    rng = random.Random(0)
+    return [
+        (
+            rng.choice(SYMBOLS),
+            rng.randint(1, 999),
+            rng.randint(1, 999),
+            rng.uniform(0.5, 10.0),
+            rng.randint(0, 2),
+            rng.random() < 0.1,
+        )
+        for _ in range(n)
+    ]
+
+
+def build_dict(rows: list[Row]) -> dict[int, AnswerData]:
+    data = {}
+    for number, (op, left, right, t, errors, late) in enumerate(rows, 1):
+        data[number] = AnswerData(op, left, right, t, errors, out_of_time=late)
+    return data
+
+
+def build_log(rows: list[Row]) -> SessionLog:
+    log = SessionLog()
+    for row in rows:
+        log.append(*row)
+    return log
+
+
+def allocated(build: Callable[[], object]) -> tuple[object, int]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return built, size
+
+
+def recompute(times: Sequence[float], out_of_time: Iterable[bool]) -> tuple:
+    return (
+        sum(times),
+        sum(out_of_time),
+        statistics.mean(times),
+        statistics.stdev(times),
+        statistics.median(times),
+        min(times),
+        max(times),
+    )
+
+
+def running(stats: RunningStats) -> tuple:
+    return (
+        stats.total,
+        stats.out_of_time,
+        stats.mean,
+        stats.stdev,
+        stats.median,
+        stats.minimum,
+        stats.maximum,
+    )
+
+
+def timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_rows(n)
+    data, dict_bytes = allocated(lambda: build_dict(rows))
+    log, log_bytes = allocated(lambda: build_log(rows))
+
+    dict_summary = timed(
+        lambda: recompute(
+            [a.time for a in data.values()], [a.out_of_time for a in data.values()]
+        )
+    )
+    log_summary = timed(lambda: running(log.stats))
+
+    print(f"{n:,} answers{'dict[int, AnswerData]':>26}{'SessionLog':>14}")
+    print(f"{'bytes per answer':<20}{dict_bytes / n:>22,.1f}{log_bytes / n:>14,.1f}")
+    print(
+        f"{'summary (ms)':<20}{dict_summary * 1e3:>22,.3f}{log_summary * 1e3:>14,.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
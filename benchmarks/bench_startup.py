@@ -0,0 +1,56 @@
+"""Cold-start time to the main menu and to a first question, against a budget.
+
+Each run starts a fresh interpreter, imports the app and runs it headless
+until the main menu is painted, then does the same for a quiz given with
+--ops until its first question is shown. Exits with status 1 if either
+median is over the budget.
+
+    python benchmarks/bench_startup.py --runs 7 --budget 800
+"""
+
+import argparse
+import statistics
+import sys
+
+from mentalmath.startup import (
+    STARTUP_BUDGET_MS,
+    time_to_first_question,
+    time_to_main_menu,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh starts to time")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=STARTUP_BUDGET_MS,
+        help="milliseconds either median start may take (default: %(default).0f)",
+    )
+    args = parser.parse_args()
+
+    imports, ready, asked = [], [], []
+    for _ in range(args.runs):
+        imported, painted = time_to_main_menu()
+        imports.append(imported * 1e3)
+        ready.append(painted * 1e3)
+        asked.append(time_to_first_question()[1] * 1e3)
+        print(
+            f"import {imports[-1]:>7.0f} ms   main menu {ready[-1]:>7.0f} ms   "
+            f"first question {asked[-1]:>7.0f} ms"
+        )
+    median = max(statistics.median(ready), statistics.median(asked))
+    print(
+        f"median: import {statistics.median(imports):.0f} ms, "
+        f"main menu {statistics.median(ready):.0f} ms, "
+        f"first question {statistics.median(asked):.0f} ms"
+    )
+    if median > args.budget:
+        print(f"OVER BUDGET: {median:.0f} ms > {args.budget:.0f} ms")
+        sys.exit(1)
+    print(f"Within the {args.budget:.0f} ms budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Generating questions on several threads: one shared RNG or a stream each.
+
+The shared case is what every generator did with the module-global random,
+plus the lock a worker needs to keep draws whole; the streamed case gives
+each thread its own generator from mentalmath.seeding. Also checks that a
+seeded run gives the same questions twice.
+Run with `python benchmarks/bench_streams.py [threads] [questions per thread]`.
+"""
+
+import random
+import sys
+import threading
+import time
+
+from mentalmath.operations import Division, Multiplication
+from mentalmath.seeding import new_seed, stream
+
+TOP: int = 999
+
+
+def generate(rng: random.Random, lock: threading.Lock | None, n: int) -> list[str]:
+    questions = [Multiplication(rng=rng), Division(rng=rng)]
+    displays = []
+    for i in range(n):
+        question = questions[i & 1]
+        if lock is None:
+            question.new(TOP)
+        else:
+            with lock:
+                question.new(TOP)
+        displays.append(question.display)
+    return displays
+
+
+def run(threads: int, n: int, shared: bool, seed: int) -> tuple[float, list[list[str]]]:
+    lock = threading.Lock() if shared else None
+    shared_rng = random.Random(seed)
+    results: list[list[str]] = [[] for _ in range(threads)]
+
+    def work(i: int) -> None:
+        rng = shared_rng if shared else stream(seed, "worker", i)
+        results[i] = generate(rng, lock, n)
+
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    seed = new_seed()
+    shared, _ = run(threads, n, True, seed)
+    streamed, first = run(threads, n, False, seed)
+    _, second = run(threads, n, False, seed)
+    total = threads * n
+    print(f"{threads} threads, {n:,} questions each")
+    print(f"  shared RNG and lock  {total / shared:>12,.0f}/s")
+    print(f"  stream per thread    {total / streamed:>12,.0f}/s")
+    print(f"  same questions on a second seeded run: {first == second}")
+
+
+if __name__ == "__main__":
+    main()
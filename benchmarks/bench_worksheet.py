@@ -0,0 +1,42 @@
+"""Worksheet throughput and peak memory as the worksheet grows.
+
+Writes CSV worksheets of increasing length to /dev/null and prints questions
+per second and the process's peak resident memory so far, which should stay
+flat. Pass --workers to shard generation over processes.
+Run with `python benchmarks/bench_worksheet.py [--workers N] [--max N]`.
+"""
+
+import argparse
+import os
+import resource
+import time
+
+from mentalmath.worksheet import write_worksheet
+
+OP_MAXES = {
+    "multiplication": 99,
+    "division": 999,
+    "square_root": 99,
+    "fraction_multiplication": 20,
+    "calendar": 1,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--max", type=int, default=3_000_000)
+    args = parser.parse_args()
+    n = 100_000
+    with open(os.devnull, "w", newline="") as output:
+        while n <= args.max:
+            start = time.perf_counter()
+            write_worksheet(OP_MAXES, n, 0, output, None, "csv", args.workers)
+            seconds = time.perf_counter() - start
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{n:>12,} questions {n / seconds:>12,.0f}/s   peak {peak:6.1f} MB")
+            n *= 3
+
+
+if __name__ == "__main__":
+    main()
@@ -1,84 +1,43 @@
-from calendar import Calendar
 from typing import TYPE_CHECKING
 
-from mentalmath.operations import (
-    Addition,
-    Calendar,
-    CelsiusToFahrenheit,
-    ComplexMultiplication,
-    Division,
-    FahrenheitToCelsius,
-    FractionAddition,
-    FractionMultiplication,
-    KilogramsToPounds,
-    KilometersToMiles,
-    MilesToKilometers,
-    Mod,
-    Multiplication,
-    PerfectSquareRoot,
-    PoundsToKilograms,
-    Powers,
-    QuestionInfo,
-    Square,
-    SquareRoot,
-    Subtraction,
-    TimesTables,
-    default,
-)
+from mentalmath.registry import OperationRegistry, OperationSpec
 
 if TYPE_CHECKING:
     from textual.binding import BindingType
 
 
+# Menu order; the special operations have buttons on the special screen.
+BUILTIN_OPERATIONS: tuple[OperationSpec, ...] = (
+    OperationSpec("addition", "mentalmath.operations:Addition"),
+    OperationSpec("subtraction", "mentalmath.operations:Subtraction"),
+    OperationSpec("multiplication", "mentalmath.operations:Multiplication"),
+    OperationSpec("division", "mentalmath.operations:Division"),
+    OperationSpec("square", "mentalmath.operations:Square"),
+    OperationSpec("square_root", "mentalmath.operations:SquareRoot"),
+    OperationSpec("perfect_square_root", "mentalmath.operations:PerfectSquareRoot"),
+    OperationSpec("mod", "mentalmath.operations:Mod"),
+    OperationSpec(
+        "complex_multiplication", "mentalmath.operations:ComplexMultiplication"
+    ),
+    OperationSpec("fraction_addition", "mentalmath.operations:FractionAddition"),
+    OperationSpec(
+        "fraction_multiplication", "mentalmath.operations:FractionMultiplication"
+    ),
+    OperationSpec("fahrenheit_to_celsius", "mentalmath.operations:FahrenheitToCelsius"),
+    OperationSpec("celsius_to_fahrenheit", "mentalmath.operations:CelsiusToFahrenheit"),
+    OperationSpec("kilometers_to_miles", "mentalmath.operations:KilometersToMiles"),
+    OperationSpec("miles_to_kilometers", "mentalmath.operations:MilesToKilometers"),
+    OperationSpec("pounds_to_kilograms", "mentalmath.operations:PoundsToKilograms"),
+    OperationSpec("kilograms_to_pounds", "mentalmath.operations:KilogramsToPounds"),
+    OperationSpec("times_tables", "mentalmath.operations:TimesTables", special=True),
+    OperationSpec("calendar", "mentalmath.operations:Calendar", special=True),
+    OperationSpec("powers", "mentalmath.operations:Powers", special=True),
+)
+
+
 class Config:
     def __init__(self) -> None:
-        self.QUESTIONDATA: dict[str, QuestionInfo] = {
-            "addition": Addition,
-            "subtraction": Subtraction,
-            "multiplication": Multiplication,
-            "division": Division,
-            "square": Square,
-            "square_root": SquareRoot,
-            "perfect_square_root": PerfectSquareRoot,
-            "mod": Mod,
-            "complex_multiplication": ComplexMultiplication,
-            "fraction_addition": FractionAddition,
-            "fraction_multiplication": FractionMultiplication,
-            "fahrenheit_to_celsius": FahrenheitToCelsius,
-            "celsius_to_fahrenheit": CelsiusToFahrenheit,
-            "kilometers_to_miles": KilometersToMiles,
-            "miles_to_kilometers": MilesToKilometers,
-            "pounds_to_kilograms": PoundsToKilograms,
-            "kilograms_to_pounds": KilogramsToPounds,
-        }
-        self.ALLOPERATIONS: dict[str, QuestionInfo] = {
-            "addition": Addition,
-            "subtraction": Subtraction,
-            "multiplication": Multiplication,
-            "square": Square,
-            "square_root": SquareRoot,
-            "perfect_square_root": PerfectSquareRoot,
-            "mod": Mod,
-            "complex_multiplication": ComplexMultiplication,
-            "fraction_addition": FractionAddition,
-            "fraction_multiplication": FractionMultiplication,
-            "fahrenheit_to_celsius": FahrenheitToCelsius,
-            "celsius_to_fahrenheit": CelsiusToFahrenheit,
-            "kilometers_to_miles": KilometersToMiles,
-            "miles_to_kilometers": MilesToKilometers,
-            "pounds_to_kilograms": PoundsToKilograms,
-            "kilograms_to_pounds": KilogramsToPounds,
-            "times_tables": TimesTables,
-            "powers": Powers,
-            "division": Division,
-            "calendar": Calendar,
-        }
-        self.SPECIAL = {
-            "times_tables": TimesTables,
-            "default": default,
-            "calendar": Calendar,
-            "powers": Powers,
-        }
+        self.OPERATIONS = OperationRegistry(BUILTIN_OPERATIONS)
         self.DEFAULT_BINDINGS: list[BindingType] = [
             ("q", "quit", "Quit"),
             ("d", "toggle_dark", "Toggle dark mode"),
@@ -1,19 +1,23 @@
-from statistics import mean, median, stdev
+import time
 from typing import TYPE_CHECKING, ClassVar
 
 from rich.text import Text
-from textual import on
-from textual.containers import Center, Container, Grid, VerticalScroll
+from textual import on, work
+from textual.containers import Center, Container, Grid, Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
-from textual.widgets import Button, DataTable, Footer, Label
+from textual.widgets import Button, DataTable, Footer, Input, Label
 
-from mentalmath.config import CONFIG
+from mentalmath.data.export import SESSION_COLUMNS, session_chunks, write_export
+from mentalmath.data.log_index import FilterError, LogIndex, parse_filter
+from mentalmath.data.log_table import LogTable
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from textual.app import ComposeResult
     from textual.binding import BindingType
 
-    from mentalmath.operations import AnswerData
+    from mentalmath.data.session_log import SessionLog
 
 
 class DataScreen(Screen):
@@ -24,49 +28,80 @@ class DataScreen(Screen):
         ("t", "sort_by_time", "Sort by time"),
         ("o", "sort_by_op", "Sort by operation"),
         ("e", "sort_by_err", "Sort by errors"),
+        ("x", "export", "Export"),
     ]
 
-    def __init__(self, data: dict[int, AnswerData]) -> None:
+    def __init__(self, data: SessionLog) -> None:
         super().__init__()
         self.data = data
+        self.index: LogIndex | None = None
+        self.mask: int | None = None
+        self.filtered: dict[str, Sequence[int]] = {}
+        self.sort_column = "question"
+        self.sort_reverse = False
 
     def compose(self) -> ComposeResult:
         self.sort_qnum = Button("Sort by question", id="sort_q_btn", classes="sort_btn")
         self.sort_time = Button("Sort by time", id="sort_time_btn", classes="sort_btn")
         self.sort_op = Button("Sort by operation", id="sort_op_btn", classes="sort_btn")
         self.sort_err = Button("Sort by errors", id="sort_err_btn", classes="sort_btn")
-        self.table = DataTable(zebra_stripes=True, cursor_type="none")
+        self.filter_input = Input(
+            placeholder="Filter, e.g. op=÷, mistakes>0, time>p90, left=7",
+            id="filter_input",
+        )
+        self.filter_summary = Label(id="filter_summary")
+        self.table = LogTable(self.data)
         self.exit_button = Button("Exit", id="exit_data_screen", classes="back_button")
-        with VerticalScroll():
+        with Vertical():
             with Grid(id="sorting_buttons"):
                 yield self.sort_qnum
                 yield self.sort_time
                 yield self.sort_op
                 yield self.sort_err
-            yield Center(self.table)
+            yield self.filter_input
+            yield self.filter_summary
+            yield self.table
             yield self.exit_button
         yield Footer()
 
     def on_mount(self) -> None:
-        self.table.add_columns(
-            ("question", "question"),
-            ("left", "left"),
-            ("op", "operation"),
-            ("right", "right"),
-            ("time", "time"),
-            ("mistakes", "mistakes"),
+        self.show_summary()
+
+    @on(Input.Changed, "#filter_input")
+    def apply_filter(self, event: Input.Changed) -> None:
+        """Show only the rows matching the filter, as it is typed."""
+        try:
+            conditions = parse_filter(event.value)
+            if conditions and self.index is None:
+                self.index = LogIndex(self.data)
+            mask = self.index.filter(conditions) if conditions else None
+        except FilterError as error:
+            self.filter_summary.update(f"Filter: {error}")
+            return
+        self.mask = mask
+        self.filtered.clear()
+        self.show_rows()
+        self.show_summary()
+
+    def show_summary(self) -> None:
+        if self.mask is None:
+            stats = self.data.stats
+            count, average, median = stats.count, stats.mean, stats.median
+            p90 = stats.quantile(0.9)
+        else:
+            count, average, median, p90 = self.index.summary(self.mask)
+        self.filter_summary.update(
+            f"Showing {count:,} of {len(self.data):,} answers   "
+            f"average {average:.2f}   median {median:.2f}   p90 {p90:.2f}"
         )
-        for question_number, data in self.data.items():
-            row = [
-                question_number,
-                data.left,
-                data.operation,
-                data.right,
-                round(data.time, 2),
-                data.number_of_errors,
-            ]
-            # styled_row = [Text(str(cell), justify="right") for cell in row]
-            self.table.add_row(*row)
+
+    def show_rows(self) -> None:
+        order = self.data.sort_order(self.sort_column)
+        if self.mask is not None:
+            if self.sort_column not in self.filtered:
+                self.filtered[self.sort_column] = self.index.rows(self.mask, order)
+            order = self.filtered[self.sort_column]
+        self.table.show(order, reverse=self.sort_reverse)
 
     @on(Button.Pressed)
     def close_data_screen(self, event: Button.Pressed) -> None:
@@ -87,26 +122,34 @@ class DataScreen(Screen):
     def action_go_back(self) -> None:
         self.app.pop_screen()
 
+    def action_export(self) -> None:
+        self.app.push_screen(ExportScreen(self.data))
+
     sort_time_reverse = False
 
+    def sort(self, column: str, reverse: bool) -> None:
+        self.sort_column = column
+        self.sort_reverse = reverse
+        self.show_rows()
+
     def action_sort_by_time(self) -> None:
         self.sort_time_reverse = not self.sort_time_reverse
-        self.table.sort("time", reverse=self.sort_time_reverse)
+        self.sort("time", reverse=self.sort_time_reverse)
 
     def action_sort_by_op(self) -> None:
-        self.table.sort("operation", reverse=False)
+        self.sort("operation", reverse=False)
 
     sort_q_reverse = False
 
     def action_sort_by_q(self) -> None:
         self.sort_q_reverse = not self.sort_q_reverse
-        self.table.sort("question", reverse=self.sort_q_reverse)
+        self.sort("question", reverse=self.sort_q_reverse)
 
     sort_err_reverse = False
 
     def action_sort_by_err(self) -> None:
         self.sort_err_reverse = not self.sort_err_reverse
-        self.table.sort("mistakes", reverse=self.sort_err_reverse)
+        self.sort("mistakes", reverse=self.sort_err_reverse)
 
 
 class EndScreen(ModalScreen):
@@ -116,20 +159,25 @@ class EndScreen(ModalScreen):
         ("d", "goto_data_screen", "Data"),
         ("escape", "mainmenu", "Exit to main menu"),
         ("r", "repeat", "Repeat"),
+        ("x", "export", "Export"),
     ]
     CSS_PATH = "../styles/endscreen.tcss"
 
     def action_mainmenu(self) -> None:
         self.dismiss("")
 
-    def __init__(self, data: dict[int, AnswerData], used_timer: bool) -> None:
+    def __init__(
+        self, data: SessionLog, used_timer: bool, seed: int | None = None
+    ) -> None:
         super().__init__()
         self.data = data
         self.used_timer = used_timer
+        self.seed = seed
 
     def compose(self) -> ComposeResult:
-        total_time = sum([a.time for a in self.data.values()])
-        total_out_of_time = sum([a.out_of_time for a in self.data.values()])
+        stats = self.data.stats
+        total_time = stats.total
+        total_out_of_time = stats.out_of_time
         oot_message: str = (
             f"Ran out of time on {total_out_of_time} questions.\n"
             if self.used_timer
@@ -137,13 +185,16 @@ class EndScreen(ModalScreen):
         )
         number_of_questions = len(self.data)
         self.summary_table = DataTable(id="summary_data")
+        message = Label(
+            f"Completed {number_of_questions} questions in {total_time:.2f} seconds.\n"
+            + oot_message
+            + "Again?",
+            id="question",
+        )
+        if self.seed is not None:
+            message.border_subtitle = f"seed {self.seed}"
         yield Grid(
-            Label(
-                f"Completed {number_of_questions} questions in {total_time:.2f} seconds.\n"
-                + oot_message
-                + "Again?",
-                id="question",
-            ),
+            message,
             Container(Center(self.summary_table), id="summary_data_container"),
             Button("Data", variant="default", id="view_data_button"),
             Button("Exit to menu", variant="warning", id="no_repeat"),
@@ -153,18 +204,9 @@ class EndScreen(ModalScreen):
         yield Footer()
 
     def on_mount(self) -> None:
-        times = [x.time for x in self.data.values()]
-        average = mean(times)
-        std_dev = stdev(times) if len(times) > 1 else 0
-        data_median = median(times)
-        minimum = min(times)
-        maximum = max(times)
-        data_range = maximum - minimum
-        self.summary_table.add_columns(
-            "average", "std dev", "median", "minimum", "maximum", "range"
-        )
-        row = [average, std_dev, data_median, minimum, maximum, data_range]
-        styled_row = [Text(f"{cell:.2f}", justify="right") for cell in row]
+        summary = self.data.stats.summary()
+        self.summary_table.add_columns(*summary)
+        styled_row = [Text(f"{cell:.2f}", justify="right") for cell in summary.values()]
         self.summary_table.add_row(*styled_row)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -177,5 +219,78 @@ class EndScreen(ModalScreen):
     def action_goto_data_screen(self) -> None:
         self.app.push_screen(DataScreen(data=self.data))
 
+    def action_export(self) -> None:
+        self.app.push_screen(ExportScreen(self.data))
+
     def action_repeat(self) -> None:
         self.dismiss("yes_repeat")
+
+
+class ExportScreen(ModalScreen):
+    """Asks where to save a session's answers, then writes them there.
+
+    The format comes from the extension: .csv, .jsonl, or none for a folder
+    of .npy columns. Answers are written a chunk at a time on a worker
+    thread, however long the session was.
+    """
+
+    CSS_PATH = "../styles/export_screen.tcss"
+    BINDINGS: ClassVar[list[BindingType]] = [("escape", "back", "Back")]
+
+    def __init__(self, data: SessionLog) -> None:
+        super().__init__()
+        self.data = data
+
+    def compose(self) -> ComposeResult:
+        with Container(id="export_container"):
+            yield Label(
+                "Export answers to a .csv or .jsonl file, or a folder of .npy columns"
+            )
+            self.path_input = Input(
+                value=time.strftime("mmath-%Y%m%d-%H%M%S.csv"), id="export_path"
+            )
+            yield self.path_input
+            with Horizontal():
+                yield Button("Back", classes="back_button")
+                yield Container()
+                self.export_button = Button("Export", classes="next_button")
+                yield self.export_button
+        yield Footer()
+
+    def action_back(self) -> None:
+        self.dismiss()
+
+    @on(Input.Submitted)
+    def on_input_submitted(self) -> None:
+        self.start_export()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if "next_button" in event.button.classes:
+            self.start_export()
+        if "back_button" in event.button.classes:
+            self.action_back()
+
+    def start_export(self) -> None:
+        path = self.path_input.value.strip()
+        if path and not self.export_button.disabled:
+            self.export_button.disabled = True
+            self.export(path)
+
+    @work(thread=True, exit_on_error=False)
+    def export(self, path: str) -> None:
+        try:
+            count = write_export(session_chunks(self.data), SESSION_COLUMNS, path)
+        except (OSError, ValueError) as error:
+            self.app.call_from_thread(self.failed, str(error))
+            return
+        self.app.call_from_thread(
+            self.exported, f"Exported {count:,} answers to {path}"
+        )
+
+    def failed(self, message: str) -> None:
+        self.notify(message, title="Export failed", severity="error")
+        self.export_button.disabled = False
+
+    def exported(self, message: str) -> None:
+        self.notify(message)
+        self.dismiss()
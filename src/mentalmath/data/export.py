@@ -0,0 +1,241 @@
+import csv
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import ExitStack, closing
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, TextIO
+
+if TYPE_CHECKING:
+    from mentalmath.data.session_log import SessionLog
+
+# Answers read and written at a time; memory use is a chunk or two.
+CHUNK_SIZE: int = 4096
+SESSION_COLUMNS: tuple[str, ...] = (
+    "question_number",
+    "operation",
+    "left",
+    "right",
+    "time",
+    "number_of_errors",
+    "out_of_time",
+)
+HISTORY_COLUMNS: tuple[str, ...] = ("session_id", *SESSION_COLUMNS, "answered_at")
+FORMATS: dict[str, str] = {".csv": "csv", ".jsonl": "jsonl"}
+# Array typecodes of the columns .npy exports store as numbers; the others
+# are stored as codes into a list of their distinct values.
+NUMERIC_COLUMNS: dict[str, str] = {
+    "question_number": "q",
+    "time": "d",
+    "number_of_errors": "q",
+    "out_of_time": "B",
+    "answered_at": "d",
+}
+CODE_TYPECODE: str = "i"
+NPY_TYPES: dict[str, str] = {"q": "i8", "d": "f8", "B": "b1", "i": "i4"}
+NPY_MAGIC: bytes = b"\x93NUMPY\x01\x00"
+# Room for the header of any length of column, a multiple of 64 bytes.
+NPY_HEADER_SIZE: int = 128
+
+
+def session_chunks(log: SessionLog) -> Iterator[list[tuple]]:
+    """A session's answers as rows of SESSION_COLUMNS, CHUNK_SIZE at a time."""
+    symbols = log.symbols
+    for start in range(0, len(log), CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, len(log))
+        yield list(
+            zip(
+                range(start + 1, stop + 1),
+                [symbols[code] for code in log.operation_codes[start:stop]],
+                log.left[start:stop],
+                log.right[start:stop],
+                log.times[start:stop],
+                log.errors[start:stop],
+                log.out_of_time[start:stop],
+                strict=True,
+            )
+        )
+
+
+def npy_header(typecode: str, count: int) -> bytes:
+    """A version 1.0 .npy header for a column of count values."""
+    byteorder = "|" if typecode == "B" else "<" if sys.byteorder == "little" else ">"
+    header = (
+        f"{{'descr': '{byteorder}{NPY_TYPES[typecode]}', "
+        f"'fortran_order': False, 'shape': ({count},), }}"
+    )
+    length = NPY_HEADER_SIZE - len(NPY_MAGIC) - 2
+    return (
+        NPY_MAGIC
+        + struct.pack("<H", length)
+        + header.ljust(length - 1).encode("latin1")
+        + b"\n"
+    )
+
+
+class NpyColumn:
+    """One column streamed into a .npy file.
+
+    The length isn't known until the end, so the header is written padded
+    to NPY_HEADER_SIZE and rewritten with the real shape on close.
+    """
+
+    def __init__(self, file: BinaryIO, typecode: str) -> None:
+        self.typecode = typecode
+        self.count = 0
+        self.file = file
+        self.file.write(npy_header(typecode, 0))
+
+    def write(self, values: Sequence) -> None:
+        self.file.write(array(self.typecode, values).tobytes())
+        self.count += len(values)
+
+    def close(self) -> None:
+        """Write the real shape into the header; the caller closes the file."""
+        self.file.seek(0)
+        self.file.write(npy_header(self.typecode, self.count))
+
+
+class CodedColumn(NpyColumn):
+    """A column of text or mixed values, stored as codes into its values.
+
+    The distinct values go to <name>.categories.json in order of first
+    appearance, so pandas.Categorical.from_codes rebuilds the column.
+    """
+
+    def __init__(self, file: BinaryIO, path: Path) -> None:
+        super().__init__(file, CODE_TYPECODE)
+        self.categories_path = path.with_suffix(".categories.json")
+        self.codes: dict[object, int] = {}
+
+    def write(self, values: Sequence) -> None:
+        codes = self.codes
+        super().write([codes.setdefault(value, len(codes)) for value in values])
+
+    def close(self) -> None:
+        super().close()
+        with open(self.categories_path, "w") as file:
+            json.dump(list(self.codes), file, ensure_ascii=False)
+
+
+class NpyExport:
+    """Rows written as a directory with one .npy file per column.
+
+    The column files are opened together; if one can't be, those already
+    opened are closed and removed again.
+    """
+
+    def __init__(self, directory: Path, columns: Sequence[str]) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.columns: list[NpyColumn] = []
+        created: list[Path] = []
+        try:
+            with ExitStack() as stack:
+                for name in columns:
+                    path = directory / f"{name}.npy"
+                    file = stack.enter_context(open(path, "wb"))
+                    created.append(path)
+                    typecode = NUMERIC_COLUMNS.get(name)
+                    column = (
+                        CodedColumn(file, path)
+                        if typecode is None
+                        else NpyColumn(file, typecode)
+                    )
+                    self.columns.append(column)
+                self.files = stack.pop_all()
+        except OSError:
+            for path in created:
+                path.unlink(missing_ok=True)
+            raise
+
+    def write(self, rows: list[tuple]) -> None:
+        if not rows:
+            return
+        for column, values in zip(self.columns, zip(*rows, strict=True), strict=True):
+            column.write(values)
+
+    def close(self) -> None:
+        with self.files:
+            for column in self.columns:
+                column.close()
+
+
+class CsvExport:
+    def __init__(self, file: TextIO, columns: Sequence[str]) -> None:
+        self.writer = csv.writer(file)
+        self.writer.writerow(columns)
+
+    def write(self, rows: list[tuple]) -> None:
+        self.writer.writerows(rows)
+
+    def close(self) -> None:
+        pass
+
+
+class JsonlExport:
+    def __init__(self, file: TextIO, columns: Sequence[str]) -> None:
+        self.file = file
+        self.columns = columns
+
+    def write(self, rows: list[tuple]) -> None:
+        columns = self.columns
+        self.file.write(
+            "".join(
+                json.dumps(dict(zip(columns, row, strict=True)), ensure_ascii=False)
+                + "\n"
+                for row in rows
+            )
+        )
+
+    def close(self) -> None:
+        pass
+
+
+def export_format_for(path: str, requested: str | None) -> str:
+    """The requested format, or the one path's extension names.
+
+    Standard output gets CSV, and a path without an extension is taken as a
+    directory for .npy columns.
+    """
+    if requested is not None:
+        return requested
+    if path == "-":
+        return "csv"
+    suffix = Path(path).suffix.lower()
+    if suffix in FORMATS:
+        return FORMATS[suffix]
+    if not suffix:
+        return "npy"
+    raise ValueError(f"can't tell what format {path} should be; use --format")
+
+
+def write_export(
+    chunks: Iterable[list[tuple]],
+    columns: Sequence[str],
+    path: str,
+    output_format: str | None = None,
+) -> int:
+    """Stream chunks of rows to path and return how many rows were written.
+
+    A path of - writes CSV or JSON Lines to standard output.
+    """
+    output_format = export_format_for(path, output_format)
+    if output_format == "npy" and path == "-":
+        raise ValueError(".npy columns need a directory, not standard output")
+    with ExitStack() as stack:
+        if output_format == "npy":
+            exporter = NpyExport(Path(path), columns)
+        else:
+            file = sys.stdout
+            if path != "-":
+                file = stack.enter_context(open(path, "w", newline=""))
+            exporter_type = CsvExport if output_format == "csv" else JsonlExport
+            exporter = exporter_type(file, columns)
+        stack.enter_context(closing(exporter))
+        count = 0
+        for rows in chunks:
+            exporter.write(rows)
+            count += len(rows)
+    return count
@@ -0,0 +1,311 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from mentalmath.data.session_log import AnswerRow
+    from mentalmath.operations import AnswerData
+    from mentalmath.questions.scheduler import Fact
+
+# Largest number of queued statements written in one transaction.
+BATCH_SIZE: int = 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    operations TEXT NOT NULL,
+    number_of_questions INTEGER NOT NULL,
+    question_timer REAL
+);
+CREATE TABLE IF NOT EXISTS answers (
+    session_id TEXT NOT NULL REFERENCES sessions (id),
+    question_number INTEGER NOT NULL,
+    operation TEXT NOT NULL,
+    "left",
+    "right",
+    time REAL NOT NULL,
+    number_of_errors INTEGER NOT NULL,
+    out_of_time INTEGER NOT NULL,
+    answered_at REAL NOT NULL,
+    PRIMARY KEY (session_id, question_number)
+);
+CREATE INDEX IF NOT EXISTS answers_by_operands
+    ON answers (operation, "left", "right");
+CREATE INDEX IF NOT EXISTS answers_by_answered_at ON answers (answered_at);
+CREATE TABLE IF NOT EXISTS facts (
+    operation TEXT NOT NULL,
+    "left",
+    "right",
+    due REAL NOT NULL,
+    interval REAL NOT NULL,
+    ease REAL NOT NULL,
+    reviews INTEGER NOT NULL,
+    lapses INTEGER NOT NULL,
+    PRIMARY KEY (operation, "left", "right")
+) WITHOUT ROWID;
+"""
+
+INSERT_SESSION = "INSERT INTO sessions VALUES (?, ?, ?, ?, ?)"
+INSERT_ANSWER = "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+SAVE_FACT = "INSERT OR REPLACE INTO facts VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+SELECT_FACTS = "SELECT * FROM facts WHERE operation = ?"
+SELECT_ANSWERS = (
+    'SELECT session_id, question_number, operation, "left", "right", time,'
+    " number_of_errors, out_of_time, answered_at FROM answers"
+)
+# Answers fetched from the database at a time when reading them back.
+READ_SIZE: int = 4096
+# Integers SQLite can store; operands outside this range are stored as text.
+MIN_INTEGER: int = -(2**63)
+MAX_INTEGER: int = 2**63 - 1
+# Seconds between checks that the writer is still alive while flushing.
+FLUSH_POLL: float = 0.1
+
+
+def history_path() -> Path:
+    """$MMATH_HISTORY, or history.sqlite3 in the user's data directory."""
+    if path := os.environ.get("MMATH_HISTORY"):
+        return Path(path)
+    data_home = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(data_home) / "mentalmath" / "history.sqlite3"
+
+
+def to_column(operand: object) -> object:
+    """An operand as SQLite can store it, with integers past 64 bits as text."""
+    if isinstance(operand, int) and not MIN_INTEGER <= operand <= MAX_INTEGER:
+        return str(operand)
+    return operand
+
+
+def from_column(value: object) -> object:
+    """An operand read back from the database, undoing to_column."""
+    digits = value.lstrip("-") if isinstance(value, str) else ""
+    if digits.isascii() and digits.isdecimal():
+        number = int(value)
+        if not MIN_INTEGER <= number <= MAX_INTEGER:
+            return number
+    return value
+
+
+class HistoryStore:
+    """Every answer from every quiz, kept in a SQLite database.
+
+    Writes go through a queue to a single writer thread, which commits
+    whatever has piled up in one transaction, so recording an answer never
+    waits on the disk. If the database can't be opened the error is kept in
+    `error` and answers are dropped rather than interrupting the quiz.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = history_path() if path is None else Path(path)
+        self.pending: queue.SimpleQueue[tuple[str, tuple] | threading.Event | None] = (
+            queue.SimpleQueue()
+        )
+        self.writer = threading.Thread(
+            target=self.write_loop, name="history-writer", daemon=True
+        )
+        self.error: Exception | None = None
+
+    def start(self) -> None:
+        self.writer.start()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection to the database, creating it if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def new_session(
+        self,
+        op_maxes: dict[str, int],
+        number_of_questions: int,
+        question_timer: float | None = None,
+    ) -> str:
+        """Queue a new session and return its id."""
+        session_id = uuid.uuid4().hex
+        self.pending.put(
+            (
+                INSERT_SESSION,
+                (
+                    session_id,
+                    time.time(),
+                    json.dumps(op_maxes),
+                    number_of_questions,
+                    question_timer,
+                ),
+            )
+        )
+        return session_id
+
+    def append(
+        self, session_id: str, question_number: int, answer: AnswerData | AnswerRow
+    ) -> None:
+        """Queue an answer to be written."""
+        self.pending.put(
+            (
+                INSERT_ANSWER,
+                (
+                    session_id,
+                    question_number,
+                    answer.operation,
+                    to_column(answer.left),
+                    to_column(answer.right),
+                    answer.time,
+                    answer.number_of_errors,
+                    answer.out_of_time,
+                    time.time(),
+                ),
+            )
+        )
+
+    def save_fact(
+        self, operation: str, left: object, right: object, fact: Fact
+    ) -> None:
+        """Queue a fact's scheduling state to be written."""
+        self.pending.put(
+            (
+                SAVE_FACT,
+                (
+                    operation,
+                    to_column(left),
+                    to_column(right),
+                    fact.due,
+                    fact.interval,
+                    fact.ease,
+                    fact.reviews,
+                    fact.lapses,
+                ),
+            )
+        )
+
+    def load_facts(self, operations: Iterable[str]) -> list[tuple]:
+        """Every saved fact of the given operations, after pending writes.
+
+        Rows are (operation, left, right, due, interval, ease, reviews,
+        lapses). Returns nothing if the database can't be read.
+        """
+        self.flush()
+        try:
+            connection = self.connect()
+        except (OSError, sqlite3.Error) as error:
+            self.error = error
+            return []
+        try:
+            rows = []
+            for operation in operations:
+                for name, left, right, *state in connection.execute(
+                    SELECT_FACTS, (operation,)
+                ):
+                    rows.append((name, from_column(left), from_column(right), *state))
+            return rows
+        except sqlite3.Error as error:
+            self.error = error
+            return []
+        finally:
+            connection.close()
+
+    def answer_chunks(
+        self, operation: str | None = None, since: float | None = None
+    ) -> Iterator[list[tuple]]:
+        """Saved answers in the order they were given, READ_SIZE at a time.
+
+        Rows hold session_id, question_number, operation, left, right, time,
+        number_of_errors, out_of_time and answered_at, and can be limited to
+        one operation or to answers given since a Unix time. The database is
+        opened read-only, and errors reading it are raised.
+        """
+        self.flush()
+        conditions, parameters = [], []
+        if operation is not None:
+            conditions.append("operation = ?")
+            parameters.append(operation)
+        if since is not None:
+            conditions.append("answered_at >= ?")
+            parameters.append(since)
+        sql = SELECT_ANSWERS
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY answered_at, question_number"
+        uri = self.path.absolute().as_uri() + "?mode=ro"
+        with closing(sqlite3.connect(uri, uri=True)) as connection:
+            cursor = connection.execute(sql, parameters)
+            while rows := cursor.fetchmany(READ_SIZE):
+                yield rows
+
+    def flush(self) -> None:
+        """Block until everything queued so far has been written.
+
+        Returns early if the writer stops before getting that far.
+        """
+        if not self.writer.is_alive():
+            return
+        done = threading.Event()
+        self.pending.put(done)
+        while not done.wait(FLUSH_POLL):
+            if not self.writer.is_alive():
+                return
+
+    def close(self) -> None:
+        """Write what is queued and stop the writer."""
+        if self.writer.is_alive():
+            self.pending.put(None)
+            self.writer.join()
+
+    def write_loop(self) -> None:
+        try:
+            connection = self.connect()
+        except (OSError, sqlite3.Error) as error:
+            self.error = error
+            connection = None
+        running = True
+        while running:
+            batch = [self.pending.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            statements, flushed = [], []
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    flushed.append(item)
+                else:
+                    statements.append(item)
+            if connection is not None and statements:
+                self.write(connection, statements)
+            for done in flushed:
+                done.set()
+        if connection is not None:
+            connection.close()
+
+    def write(
+        self, connection: sqlite3.Connection, statements: list[tuple[str, tuple]]
+    ) -> None:
+        """Run the statements in one transaction, grouping repeats.
+
+        A failure, from the database or from binding a value it can't hold,
+        is kept in `error` and the batch dropped; the writer carries on.
+        """
+        try:
+            with connection:
+                for sql, group in groupby(statements, key=itemgetter(0)):
+                    connection.executemany(sql, [params for _, params in group])
+        except (sqlite3.Error, OverflowError, ValueError, TypeError) as error:
+            self.error = error
@@ -0,0 +1,263 @@
+import operator
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from itertools import compress
+from math import fsum
+
+from mentalmath.data.running_stats import interpolated_quantile
+from mentalmath.data.session_log import SessionLog
+from mentalmath.parsing import scan_decimal, scan_integer
+
+COMPARISONS: dict[str, Callable[[object, object], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+COLUMN_NAMES: dict[str, str] = {
+    "q": "question",
+    "question": "question",
+    "op": "operation",
+    "operation": "operation",
+    "left": "left",
+    "right": "right",
+    "time": "time",
+    "t": "time",
+    "mistakes": "mistakes",
+    "errors": "mistakes",
+    "e": "mistakes",
+}
+# Ways to type the operation symbols that are awkward on a keyboard.
+SYMBOL_ALIASES: dict[str, str] = {
+    "x": "×",
+    "*": "×",
+    "times": "×",
+    "multiplication": "×",
+    "/": "÷",
+    "division": "÷",
+    "-": "−",
+    "subtraction": "−",
+    "addition": "+",
+    "power": "^",
+    "square": "^",
+    "calendar": "cal",
+}
+CONDITION = re.compile(r"\s*([a-z]+)\s*(<=|>=|!=|=|<|>)\s*(.*?)\s*", re.IGNORECASE)
+# Turns the binary digits of a bitmap into one 0 or 1 byte per row.
+FLAG_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class FilterError(ValueError): ...
+
+
+@dataclass
+class Condition:
+    column: str
+    comparison: str
+    value: str
+
+
+def parse_filter(text: str) -> list[Condition]:
+    """Split 'op=÷, mistakes>0, time>p90' into conditions."""
+    conditions = []
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        match = CONDITION.fullmatch(part)
+        if match is None:
+            raise FilterError(f"can't read {part.strip()!r}")
+        name, comparison, value = match.groups()
+        column = COLUMN_NAMES.get(name.lower())
+        if column is None:
+            raise FilterError(f"no column called {name!r}")
+        if not value:
+            raise FilterError(f"{name}{comparison} needs a value")
+        conditions.append(Condition(column, comparison, value))
+    return conditions
+
+
+def parse_value(text: str) -> float | str:
+    value = scan_integer(text)
+    if value is None:
+        value = scan_decimal(text)
+    return text if value is None else value
+
+
+def bitmap(rows: Sequence[int], size: int) -> int:
+    """A bitmap with bit i set for every row i."""
+    packed = bytearray((size + 7) // 8)
+    for row in rows:
+        packed[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(packed, "little")
+
+
+def row_flags(mask: int, size: int) -> bytes:
+    """One byte per row, 1 where the row's bit is set in mask."""
+    return format(mask, "b").zfill(size)[::-1].encode().translate(FLAG_BYTES)
+
+
+def comparable(a: object, b: object) -> bool:
+    return isinstance(a, str) == isinstance(b, str)
+
+
+class LogIndex:
+    """Bitmaps over the rows of a SessionLog, for combining filters quickly.
+
+    Row i of the log is bit i of every bitmap. Operations and mistake counts
+    are bucketed when the index is built; times are searched through the
+    log's cached time order; operands are bucketed by value the first time a
+    filter asks for them. A filter is the AND of its conditions' bitmaps.
+    """
+
+    def __init__(self, log: SessionLog) -> None:
+        self.data = log
+        self.size = len(log)
+        self.all_rows = (1 << self.size) - 1
+        self.operations = self.bucket(log.symbols, log.operation_codes)
+        self.mistakes = self.bucket(None, log.errors)
+        self.time_order = log.sort_order("time")
+        self.sorted_times = array("d", map(log.times.__getitem__, self.time_order))
+        self.operands: dict[str, dict[object, int]] = {}
+
+    def bucket(self, names: Sequence | None, column: Sequence[int]) -> dict:
+        """Bitmaps of the rows holding each distinct value of a column."""
+        rows: dict[int, list[int]] = {}
+        for row, value in enumerate(column):
+            rows.setdefault(value, []).append(row)
+        return {
+            value if names is None else names[value]: bitmap(found, self.size)
+            for value, found in rows.items()
+        }
+
+    def operand_buckets(self, column: str) -> dict[object, int]:
+        buckets = self.operands.get(column)
+        if buckets is None:
+            values = self.data.left if column == "left" else self.data.right
+            rows: dict[object, list[int]] = {}
+            for row, value in enumerate(values):
+                rows.setdefault(value, []).append(row)
+            buckets = {value: bitmap(found, self.size) for value, found in rows.items()}
+            self.operands[column] = buckets
+        return buckets
+
+    def symbol(self, text: str) -> str:
+        """The operation symbol meant by text, ignoring case."""
+        name = text.lower()
+        if name in SYMBOL_ALIASES:
+            return SYMBOL_ALIASES[name]
+        for symbol in self.operations:
+            if symbol.lower() == name:
+                return symbol
+        return text
+
+    def time_value(self, text: str) -> float:
+        stats = self.data.stats
+        named = {
+            "mean": stats.mean,
+            "median": stats.median,
+            "p50": stats.median,
+            "p90": stats.quantile(0.9),
+            "p99": stats.quantile(0.99),
+        }
+        if text.lower() in named:
+            return named[text.lower()]
+        value = scan_decimal(text)
+        if value is None:
+            raise FilterError(
+                f"time needs a number or mean/median/p90/p99, not {text!r}"
+            )
+        return value
+
+    def time_rows(self, comparison: str, value: float) -> int:
+        times = self.sorted_times
+        low, high = bisect_left(times, value), bisect_right(times, value)
+        ranges = {
+            "=": (low, high),
+            "<": (0, low),
+            "<=": (0, high),
+            ">": (high, self.size),
+            ">=": (low, self.size),
+        }
+        if comparison == "!=":
+            return self.all_rows & ~self.time_rows("=", value)
+        start, stop = ranges[comparison]
+        return bitmap(self.time_order[start:stop], self.size)
+
+    def question_rows(self, comparison: str, number: int) -> int:
+        # Question k is row k - 1, so "question > k" is every bit from k up.
+        number = max(0, min(number, self.size + 1))
+        below = (1 << max(number - 1, 0)) - 1
+        at = 1 << (number - 1) if 1 <= number <= self.size else 0
+        masks = {
+            "=": at,
+            "!=": self.all_rows & ~at,
+            "<": below,
+            "<=": below | at,
+            ">": self.all_rows & ~(below | at),
+            ">=": self.all_rows & ~below,
+        }
+        return masks[comparison]
+
+    def matching(
+        self, buckets: dict[object, int], comparison: str, value: object
+    ) -> int:
+        """OR of the buckets whose value compares true against value."""
+        if comparison == "=":
+            return buckets.get(value, 0)
+        compare = COMPARISONS[comparison]
+        mask = 0
+        for key, rows in buckets.items():
+            if comparable(key, value) and compare(key, value):
+                mask |= rows
+        return mask
+
+    def condition_rows(self, condition: Condition) -> int:
+        column, comparison, text = (
+            condition.column,
+            condition.comparison,
+            condition.value,
+        )
+        if column == "time":
+            return self.time_rows(comparison, self.time_value(text))
+        if column == "operation":
+            return self.matching(self.operations, comparison, self.symbol(text))
+        value = parse_value(text)
+        if column in ("left", "right"):
+            return self.matching(self.operand_buckets(column), comparison, value)
+        if not isinstance(value, int):
+            raise FilterError(f"{column} needs a whole number, not {text!r}")
+        if column == "question":
+            return self.question_rows(comparison, value)
+        return self.matching(self.mistakes, comparison, value)
+
+    def filter(self, conditions: list[Condition]) -> int:
+        mask = self.all_rows
+        for condition in conditions:
+            mask &= self.condition_rows(condition)
+        return mask
+
+    def rows(self, mask: int, order: Sequence[int]) -> Sequence[int]:
+        """The rows of order that are set in mask, keeping their order."""
+        if mask == self.all_rows:
+            return order
+        flags = row_flags(mask, self.size)
+        if isinstance(order, range):
+            return array("L", compress(order, flags))
+        return array("L", compress(order, map(flags.__getitem__, order)))
+
+    def summary(self, mask: int) -> tuple[int, float, float, float]:
+        """Count, mean, median and p90 of the times of the rows in mask."""
+        times = [self.data.times[row] for row in self.rows(mask, self.time_order)]
+        if not times:
+            return (0, 0.0, 0.0, 0.0)
+        return (
+            len(times),
+            fsum(times) / len(times),
+            interpolated_quantile(times, 0.5),
+            interpolated_quantile(times, 0.9),
+        )
@@ -0,0 +1,127 @@
+from typing import TYPE_CHECKING, ClassVar
+
+from rich.segment import Segment
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from mentalmath.data.session_log import SessionLog
+
+HEADERS: tuple[str, ...] = ("question", "left", "op", "right", "time", "mistakes")
+CELL_PADDING: int = 1
+
+
+def cell_text(value: object) -> str:
+    """Format a cell the way DataTable does."""
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+
+class LogTable(ScrollView):
+    """Read-only table of a SessionLog that only renders the rows on screen.
+
+    Rows are shown in the order given to show(), which is usually one of the
+    log's cached sort orders, so sorting never touches the rows themselves.
+    """
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {
+        "log-table--header",
+        "log-table--even-row",
+    }
+    DEFAULT_CSS = """
+        LogTable {
+            background: $surface;
+            color: $foreground;
+            width: auto;
+            height: 1fr;
+            max-width: 100%;
+            & > .log-table--header {
+                text-style: bold;
+                background: $panel;
+                color: $foreground;
+            }
+            & > .log-table--even-row {
+                background: $surface-lighten-1 50%;
+            }
+        }
+    """
+
+    def __init__(self, log: SessionLog, id: str | None = None) -> None:
+        super().__init__(id=id)
+        self.data = log
+        self.order: Sequence[int] = range(len(log))
+        self.reverse = False
+        self.widths = [len(header) for header in HEADERS]
+
+    def on_mount(self) -> None:
+        log = self.data
+        if len(log):
+            columns = (
+                (str(len(log)),),
+                map(cell_text, log.left),
+                log.symbols,
+                map(cell_text, log.right),
+                (cell_text(max(log.times)),),
+                (str(max(log.errors)),),
+            )
+            self.widths = [
+                max(width, max(map(len, column)))
+                for width, column in zip(self.widths, columns, strict=True)
+            ]
+        self.update_virtual_size()
+
+    def update_virtual_size(self) -> None:
+        width = sum(self.widths) + 2 * CELL_PADDING * len(self.widths)
+        self.virtual_size = Size(width, len(self.order) + 1)
+
+    def show(self, order: Sequence[int], reverse: bool = False) -> None:
+        """Display the log rows at the given indexes, last first if reverse."""
+        resized = len(order) != len(self.order)
+        self.order = order
+        self.reverse = reverse
+        if resized:
+            self.update_virtual_size()
+        self.refresh()
+
+    def row_cells(self, index: int) -> tuple[object, ...]:
+        log = self.data
+        return (
+            index + 1,
+            log.left[index],
+            log.operation(index),
+            log.right[index],
+            round(log.times[index], 2),
+            log.errors[index],
+        )
+
+    def line_text(self, cells: Sequence[object]) -> str:
+        pad = " " * CELL_PADDING
+        return "".join(
+            f"{pad}{cell_text(cell):<{width}}{pad}"
+            for cell, width in zip(cells, self.widths, strict=True)
+        )
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        base_style = self.rich_style
+        if y == 0:
+            style = base_style + self.get_component_rich_style("log-table--header")
+            text = self.line_text(HEADERS)
+        else:
+            position = scroll_y + y - 1
+            if position >= len(self.order):
+                return Strip.blank(width, base_style)
+            if self.reverse:
+                index = self.order[len(self.order) - 1 - position]
+            else:
+                index = self.order[position]
+            style = base_style
+            if position % 2:
+                style += self.get_component_rich_style("log-table--even-row")
+            text = self.line_text(self.row_cells(index))
+        return Strip([Segment(text, style)]).crop_extend(
+            scroll_x, scroll_x + width, style
+        )
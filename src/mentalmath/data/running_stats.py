@@ -0,0 +1,160 @@
+from bisect import bisect_right, insort
+from math import inf, sqrt
+
+# Quantiles of the answer times tracked for every session.
+QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99)
+# Values kept exactly before a P2Quantile switches to its markers.
+EXACT_COUNT: int = 512
+
+
+def interpolated_quantile(ordered: list[float], p: float) -> float:
+    """The p quantile of a sorted list, interpolating between neighbours."""
+    position = p * (len(ordered) - 1)
+    below = int(position)
+    if below + 1 == len(ordered):
+        return ordered[below]
+    return ordered[below] + (position - below) * (ordered[below + 1] - ordered[below])
+
+
+class P2Quantile:
+    """Streaming estimate of one quantile in constant memory.
+
+    This is the P² algorithm of Jain and Chlamtac (1985): five markers track
+    the minimum, the maximum, the quantile and the points halfway to it, and
+    each new value nudges the inner markers along a parabola through their
+    neighbours. The first EXACT_COUNT values are kept and sorted, so short
+    sessions get exact answers and the markers start from real order
+    statistics instead of the first five values.
+    """
+
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self.increments = (0, p / 2, p, (1 + p) / 2, 1)
+        self.exact: list[float] | None = []
+        self.heights: list[float] = []
+        self.positions: list[int] = []
+        self.count = 0
+
+    def start_markers(self) -> None:
+        """Place the five markers on the sorted values seen so far."""
+        ordered = self.exact
+        count = self.count
+        positions = [round(1 + (count - 1) * f) for f in self.increments]
+        for i in range(1, 5):
+            positions[i] = max(positions[i], positions[i - 1] + 1)
+        for i in range(4, -1, -1):
+            positions[i] = min(positions[i], count - 4 + i)
+        self.positions = positions
+        self.heights = [ordered[n - 1] for n in positions]
+        self.exact = None
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        if self.exact is not None:
+            insort(self.exact, x)
+            if self.count == EXACT_COUNT:
+                self.start_markers()
+            return
+        heights = self.heights
+        if x < heights[0]:
+            heights[0] = x
+        elif x > heights[4]:
+            heights[4] = x
+        positions = self.positions
+        for i in range(bisect_right(heights, x, 1, 4), 5):
+            positions[i] += 1
+        last = self.count - 1
+        for i in (1, 2, 3):
+            offset = 1 + last * self.increments[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self.parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self.linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def parabolic(self, i: int, step: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def linear(self, i: int, step: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    @property
+    def value(self) -> float:
+        if self.exact is not None:
+            return interpolated_quantile(self.exact, self.p) if self.exact else 0.0
+        return self.heights[2]
+
+
+class RunningStats:
+    """Summary of a session's answer times, updated as each answer comes in.
+
+    The mean and variance use Welford's method and the quantiles use
+    P2Quantile, so every statistic the end screen shows is ready in constant
+    time however long the session was.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = inf
+        self.maximum = -inf
+        self.out_of_time = 0
+        self.operation_counts: dict[str, int] = {}
+        self.quantiles = {p: P2Quantile(p) for p in QUANTILES}
+
+    def add(self, time: float, operation: str, out_of_time: bool) -> None:
+        self.count += 1
+        self.total += time
+        delta = time - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (time - self.mean)
+        self.minimum = min(self.minimum, time)
+        self.maximum = max(self.maximum, time)
+        self.out_of_time += out_of_time
+        self.operation_counts[operation] = self.operation_counts.get(operation, 0) + 1
+        for estimator in self.quantiles.values():
+            estimator.add(time)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, or 0 with fewer than two answers."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return sqrt(self.variance)
+
+    @property
+    def range(self) -> float:
+        return self.maximum - self.minimum if self.count else 0.0
+
+    def quantile(self, p: float) -> float:
+        return self.quantiles[p].value
+
+    @property
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+    def summary(self) -> dict[str, float]:
+        """The statistics the end screen shows, by column heading."""
+        return {
+            "average": self.mean,
+            "std dev": self.stdev,
+            "median": self.median,
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "range": self.range,
+        }
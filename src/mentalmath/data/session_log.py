@@ -0,0 +1,145 @@
+from array import array
+from collections.abc import Callable, Iterator, Mapping, Sequence
+
+from mentalmath.data.running_stats import RunningStats
+from mentalmath.operations import AnswerData
+
+
+class AnswerRow:
+    """One answer in a SessionLog, read through the AnswerData attributes."""
+
+    __slots__ = ("index", "log")
+
+    def __init__(self, log: SessionLog, index: int) -> None:
+        self.log = log
+        self.index = index
+
+    @property
+    def operation(self) -> str:
+        return self.log.symbols[self.log.operation_codes[self.index]]
+
+    @property
+    def left(self) -> float | str:
+        return self.log.left[self.index]
+
+    @property
+    def right(self) -> float | str | None:
+        return self.log.right[self.index]
+
+    @property
+    def time(self) -> float:
+        return self.log.times[self.index]
+
+    @property
+    def number_of_errors(self) -> int:
+        return self.log.errors[self.index]
+
+    @property
+    def out_of_time(self) -> bool:
+        return bool(self.log.out_of_time[self.index])
+
+    def to_answer_data(self) -> AnswerData:
+        return AnswerData(
+            self.operation,
+            self.left,
+            self.right,
+            self.time,
+            self.number_of_errors,
+            out_of_time=self.out_of_time,
+        )
+
+    def __repr__(self) -> str:
+        return repr(self.to_answer_data()).replace("AnswerData", "AnswerRow", 1)
+
+
+class SessionLog(Mapping[int, AnswerRow]):
+    """The answers of one quiz, stored column by column.
+
+    Times, mistakes and out-of-time flags live in typed arrays and operation
+    symbols are interned to one byte each, so a long session costs a few
+    dozen bytes per answer instead of a dataclass and its __dict__. It reads
+    like the old dict[int, AnswerData]: keys are question numbers from 1 and
+    values are AnswerRow views. `stats` keeps the summary up to date.
+    """
+
+    def __init__(self) -> None:
+        self.symbols: list[str] = []
+        self.symbol_codes: dict[str, int] = {}
+        self.operation_codes = array("B")
+        self.left: list[float | str] = []
+        self.right: list[float | str | None] = []
+        self.times = array("d")
+        self.errors = array("L")
+        self.out_of_time = array("B")
+        self.stats = RunningStats()
+        self.sort_orders: dict[str, Sequence[int]] = {}
+
+    def intern(self, symbol: str) -> int:
+        code = self.symbol_codes.get(symbol)
+        if code is None:
+            code = self.symbol_codes[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return code
+
+    def append(
+        self,
+        operation: str,
+        left: float | str,
+        right: float | str | None,
+        time: float,
+        number_of_errors: int,
+        out_of_time: bool,
+    ) -> AnswerRow:
+        """Record the next answer and return its row."""
+        self.operation_codes.append(self.intern(operation))
+        self.left.append(left)
+        self.right.append(right)
+        self.times.append(time)
+        self.errors.append(number_of_errors)
+        self.out_of_time.append(out_of_time)
+        self.stats.add(time, operation, out_of_time)
+        if self.sort_orders:
+            self.sort_orders.clear()
+        return AnswerRow(self, len(self.times) - 1)
+
+    def clear(self) -> None:
+        """Forget every answer, keeping the interned symbols."""
+        del self.operation_codes[:], self.left[:], self.right[:]
+        del self.times[:], self.errors[:], self.out_of_time[:]
+        self.stats = RunningStats()
+        self.sort_orders.clear()
+
+    def operation(self, index: int) -> str:
+        return self.symbols[self.operation_codes[index]]
+
+    def sort_keys(self) -> dict[str, Callable[[int], object]]:
+        return {
+            "time": self.times.__getitem__,
+            "operation": self.operation,
+            "mistakes": self.errors.__getitem__,
+        }
+
+    def sort_order(self, column: str) -> Sequence[int]:
+        """Row indexes sorted by a column, computed once until the log changes.
+
+        Ties keep question order, and "question" is the log's own order.
+        """
+        if column == "question":
+            return range(len(self))
+        order = self.sort_orders.get(column)
+        if order is None:
+            key = self.sort_keys()[column]
+            order = array("L", sorted(range(len(self)), key=key))
+            self.sort_orders[column] = order
+        return order
+
+    def __getitem__(self, question_number: int) -> AnswerRow:
+        if not 1 <= question_number <= len(self.times):
+            raise KeyError(question_number)
+        return AnswerRow(self, question_number - 1)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, len(self.times) + 1))
+
+    def __len__(self) -> int:
+        return len(self.times)
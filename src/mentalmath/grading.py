@@ -0,0 +1,274 @@
+import csv
+import json
+import sys
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import ExitStack
+from itertools import islice
+from typing import TextIO
+
+from mentalmath.config import CONFIG
+from mentalmath.data.running_stats import RunningStats
+from mentalmath.parallel import ordered_map
+
+# Questions read, parsed and graded at a time; memory use is a few batches.
+BATCH_SIZE: int = 4096
+RESULT_HEADER: tuple[str, ...] = (
+    "number",
+    "operation",
+    "question",
+    "answer",
+    "correct_answer",
+    "result",
+)
+RESULTS: tuple[str, ...] = ("right", "wrong", "unanswered")
+
+# A question record, the answer given to it if any, and how long it took.
+Row = tuple[dict[str, object], str | None, float | None]
+
+
+def parse_records(lines: list[str], name: str, first_line: int) -> list[dict]:
+    """Decode a batch of JSON Lines with a single json.loads call.
+
+    If that fails, or doesn't give one object per line, the lines are decoded
+    one at a time so the error names the line at fault.
+    """
+    filled = [line for line in lines if line.strip()]
+    try:
+        records = json.loads("[" + ",".join(filled) + "]")
+    except json.JSONDecodeError:
+        pass
+    else:
+        if len(records) == len(filled) and all(
+            isinstance(record, dict) for record in records
+        ):
+            return records
+    records = []
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            problem = str(error)
+        else:
+            if isinstance(record, dict):
+                records.append(record)
+                continue
+            problem = "not a JSON object"
+        raise ValueError(f"{name}, line {line_number}: {problem}")
+    return records
+
+
+def read_questions(file: TextIO, name: str) -> Iterator[list[dict]]:
+    """The question records of a JSON Lines worksheet, a batch at a time."""
+    first_line = 1
+    while lines := list(islice(file, BATCH_SIZE)):
+        yield parse_records(lines, name, first_line)
+        first_line += len(lines)
+
+
+def read_answers(file: TextIO, name: str) -> Iterator[tuple[int, str, float | None]]:
+    """(number, answer, time) for each row of an answer sheet.
+
+    The sheet is CSV with a header naming a number and an answer column, and
+    optionally a time column with the seconds each answer took.
+    """
+    reader = csv.reader(file)
+    header = [column.strip().lower() for column in next(reader, [])]
+    if "number" not in header or "answer" not in header:
+        raise ValueError(f"{name} needs a header with number and answer columns")
+    number_column, answer_column = header.index("number"), header.index("answer")
+    time_column = header.index("time") if "time" in header else None
+    return answer_rows(reader, name, number_column, answer_column, time_column)
+
+
+def answer_rows(
+    reader: Iterator[list[str]],
+    name: str,
+    number_column: int,
+    answer_column: int,
+    time_column: int | None,
+) -> Iterator[tuple[int, str, float | None]]:
+    for row_number, row in enumerate(reader, 2):
+        if not row:
+            continue
+        try:
+            number = int(row[number_column])
+            time = None
+            if time_column is not None and row[time_column].strip():
+                time = float(row[time_column])
+            yield number, row[answer_column], time
+        except IndexError, ValueError:
+            raise ValueError(f"{name}, row {row_number}: bad row {row}") from None
+
+
+def matched(
+    questions: Iterator[list[dict]], answers: Iterator[tuple[int, str, float | None]]
+) -> Iterator[list[Row]]:
+    """Batches of questions with their answers, matched by question number.
+
+    Both files are read in question order, so they are joined as they stream
+    past and neither has to fit in memory. Questions with no answer row are
+    unanswered.
+    """
+    answer = next(answers, None)
+    for records in questions:
+        rows = []
+        for question in records:
+            number = question["number"]
+            if answer is not None and answer[0] < number:
+                raise ValueError(
+                    f"answer {answer[0]} has no question, or is out of order"
+                )
+            if answer is not None and answer[0] == number:
+                rows.append((question, answer[1], answer[2]))
+                answer = next(answers, None)
+            else:
+                rows.append((question, None, None))
+        yield rows
+    if answer is not None:
+        raise ValueError(f"answer {answer[0]} has no question")
+
+
+def grade_batch(rows: list[Row]) -> list[tuple]:
+    """Check a batch of answers with each operation's own verify_correct.
+
+    Every row becomes its number, operation, question, the answer given,
+    the correct answer, its result, and the time it took.
+    """
+    checkers = {}
+    results = []
+    for question, answer, time in rows:
+        try:
+            name = question["operation"]
+            checker = checkers.get(name)
+            if checker is None:
+                checker = checkers[name] = CONFIG.OPERATIONS[name]()
+            checker.restore(
+                question["left"],
+                question["right"],
+                checker.decode_correct(question["correct"]),
+            )
+        except KeyError as error:
+            raise ValueError(
+                f"question {question.get('number')} has no {error}; "
+                "grade worksheets written with --format jsonl"
+            ) from None
+        answer = "" if answer is None else answer.strip()
+        if not answer:
+            result = "unanswered"
+        elif checker.verify_correct(answer):
+            result = "right"
+        else:
+            result = "wrong"
+        correct = checker.answer_text(checker.correct)
+        results.append(
+            (
+                question["number"],
+                name,
+                question["question"],
+                answer,
+                correct,
+                result,
+                time,
+            )
+        )
+    return results
+
+
+class Grades:
+    """Results of a graded answer sheet, overall and by operation.
+
+    Times, when the answer sheet has them, go into the same RunningStats a
+    quiz session keeps, so the summary has the end screen's statistics.
+    """
+
+    def __init__(self) -> None:
+        self.results: Counter[str] = Counter()
+        self.by_operation: dict[str, Counter[str]] = {}
+        self.stats = RunningStats()
+
+    def add(self, operation: str, result: str, time: float | None) -> None:
+        self.results[result] += 1
+        counts = self.by_operation.get(operation)
+        if counts is None:
+            counts = self.by_operation[operation] = Counter()
+        counts[result] += 1
+        if time is not None:
+            self.stats.add(time, operation, False)
+
+    @property
+    def count(self) -> int:
+        return self.results.total()
+
+    def summary(self) -> str:
+        count = self.count
+        right, wrong, unanswered = (self.results[result] for result in RESULTS)
+        share = right / count if count else 0.0
+        heading = (
+            f"Graded {count} questions: {right} right ({share:.1%}), "
+            f"{wrong} wrong, {unanswered} unanswered."
+        )
+        lines = [heading]
+        width = max(map(len, self.by_operation), default=0)
+        for operation, counts in self.by_operation.items():
+            total = counts.total()
+            lines.append(
+                f"  {operation:<{width}}  {counts['right']:>8} / {total:<8}"
+                f"{counts['right'] / total:>7.1%}"
+            )
+        stats = self.stats
+        if stats.count:
+            lines.append(
+                f"Timed {stats.count} answers, {stats.total:.2f} seconds in all."
+            )
+            summary = stats.summary()
+            lines.append("  " + "".join(f"{heading:>10}" for heading in summary))
+            lines.append(
+                "  " + "".join(f"{value:>10.2f}" for value in summary.values())
+            )
+        return "\n".join(lines)
+
+
+def write_grades(
+    questions: TextIO,
+    answers: TextIO,
+    output: TextIO,
+    workers: int = 1,
+    backend: str = "interpreter",
+    questions_name: str = "questions",
+    answers_name: str = "answers",
+) -> Grades:
+    """Grade an answer sheet against its worksheet, writing a CSV row for each."""
+    writer = csv.writer(output)
+    writer.writerow(RESULT_HEADER)
+    grades = Grades()
+    work = matched(
+        read_questions(questions, questions_name),
+        read_answers(answers, answers_name),
+    )
+    for results in ordered_map(grade_batch, work, workers, backend):
+        for *row, time in results:
+            writer.writerow(row)
+            grades.add(row[1], row[5], time)
+    return grades
+
+
+def run_grade(
+    questions: str,
+    answers: str,
+    output: str | None = None,
+    workers: int = 1,
+    backend: str = "interpreter",
+) -> Grades:
+    """The `mmath grade` command: open the files and grade the answer sheet."""
+    with ExitStack() as stack:
+        question_file = stack.enter_context(open(questions))
+        answer_file = stack.enter_context(open(answers, newline=""))
+        out = sys.stdout
+        if output is not None:
+            out = stack.enter_context(open(output, "w", newline=""))
+        return write_grades(
+            question_file, answer_file, out, workers, backend, questions, answers
+        )
@@ -33,7 +33,11 @@ TIMER_VANISH_MD = """\
 You can optionally set a **timer** for each question or make the question **vanish** after a certain period. \
 The timer will make the question automatically continue to the next question after the time is up. \
 Vanish will make the question disappear after a \
-time limit. Entering an incorrect answer will make the question reappear.
+time limit. Entering an incorrect answer will make the question reappear. \
+With **auto submit** on, a correct answer is accepted as soon as it is typed, without pressing **enter**. \
+The optional **weight** beside each maximum sets how often that operation comes up compared to the others. \
+With **review facts** on, questions you missed or answered slowly, such as 7 × 8, come back sooner, \
+and ones you know well come back less often, across sessions.
 """
 
 ARITHMETIC_MD = """\
@@ -1,3 +1,6 @@
+import argparse
+import sys
+from datetime import datetime
 from typing import TYPE_CHECKING, ClassVar
 
 from textual import on, work
@@ -7,12 +10,13 @@ from textual.theme import Theme
 from textual.widgets import Button, Footer, Input, Static
 
 from mentalmath.menus.mainmenu import MainMenu
-from mentalmath.menus.maxes_screen import InputMaxesScreen
-from mentalmath.questions.question_screen import QuestionScreen
-from mentalmath.special.special_screen import SelectSpecialScreen
 
 if TYPE_CHECKING:
     from textual.binding import BindingType
+    from textual.widget import Widget
+
+    from mentalmath.data.history import HistoryStore
+    from mentalmath.presets import QuizSettings
 
 
 class Logo(Static):
@@ -58,14 +62,24 @@ mmath_theme = Theme(
 class MentalMathApp(App):
     CSS_PATH = "styles/main.tcss"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        history: HistoryStore | None = None,
+        seed: int | None = None,
+        quiz: QuizSettings | None = None,
+    ) -> None:
         super().__init__()
+        self.history = history
+        self.seed = seed
+        self.quiz = quiz
 
     def compose(self) -> ComposeResult:
+        if self.quiz is None:
+            yield from self.main_menu()
+
+    def main_menu(self) -> list[Widget]:
         self.mainmenu = MainMenu(id="mainmenu")
-        yield Center(Logo(id="logo"))
-        yield self.mainmenu
-        yield Footer()
+        return [Center(Logo(id="logo")), self.mainmenu, Footer()]
 
     def on_mount(self) -> None:
         # Register the theme
@@ -74,6 +88,25 @@ class MentalMathApp(App):
         # Set the app's theme
         self.theme = "mmath"
 
+        if self.history is None:
+            from mentalmath.data.history import HistoryStore
+
+            self.history = HistoryStore()
+        self.history.start()
+        if self.quiz is not None:
+            self.start_quick_quiz(self.quiz)
+
+    def session_seed(self) -> int:
+        """The seed for the next quiz: --seed if given, otherwise a new one."""
+        if self.seed is None:
+            from mentalmath.seeding import new_seed
+
+            return new_seed()
+        return self.seed
+
+    def on_unmount(self) -> None:
+        self.history.close()
+
     BINDINGS: ClassVar[list[BindingType]] = [
         ("q", "quit", "Quit"),
         ("d", "toggle_dark", "Toggle dark mode"),
@@ -98,13 +131,22 @@ class MentalMathApp(App):
             await self.start_quiz()
 
     async def configure_maxes(self) -> None:
+        from mentalmath.menus.maxes_screen import InputMaxesScreen
+
         screen = InputMaxesScreen(self.mainmenu.ops.selection_list.selected)
-        self.operation_maxes, self.timer, self.vanish = await self.push_screen_wait(
-            screen
-        )
+        (
+            self.operation_maxes,
+            self.weights,
+            self.timer,
+            self.vanish,
+            self.auto_submit,
+            self.review,
+        ) = await self.push_screen_wait(screen)
 
     async def start_quiz(self) -> None:
         """Pushes the QuestionScreen with the operation_maxes and numq"""
+        from mentalmath.questions.question_screen import QuestionScreen
+
         number_of_questions = int(self.mainmenu.input_numq.value)
         self.clear_screen()
         await self.push_screen_wait(
@@ -113,9 +155,37 @@ class MentalMathApp(App):
                 number_of_questions,
                 self.timer,
                 vanish=self.vanish,
+                auto_submit=self.auto_submit,
+                weights=self.weights,
+                review=self.review,
             )
         )
 
+    @work
+    async def start_quick_quiz(self, quiz: QuizSettings) -> None:
+        """Go straight to the quiz given on the command line, past the menus.
+
+        The main menu is only built under the quiz once its first question
+        is up, so that building it doesn't hold the question back.
+        """
+        from mentalmath.questions.question_screen import QuestionScreen
+
+        self.call_after_refresh(self.mount_main_menu)
+        await self.push_screen_wait(
+            QuestionScreen(
+                quiz.op_maxes,
+                quiz.number_of_questions,
+                quiz.timer,
+                vanish=quiz.vanish,
+                special=quiz.special,
+                auto_submit=quiz.auto_submit,
+                review=quiz.review,
+            )
+        )
+
+    def mount_main_menu(self) -> None:
+        self.screen_stack[0].mount_all(self.main_menu())
+
     def clear_screen(self) -> None:
         self.mainmenu.ops.selection_list.deselect_all()
         self.mainmenu.input_numq.clear()
@@ -123,14 +193,234 @@ class MentalMathApp(App):
     @on(Button.Pressed)
     def go_to_specials(self, event: Button.Pressed) -> None:
         if event.button.id == "go_to_specials":
+            from mentalmath.special.special_screen import SelectSpecialScreen
+
             self.push_screen(SelectSpecialScreen())
 
 
-app = MentalMathApp()
+def quiz_settings(args: argparse.Namespace) -> QuizSettings | None:
+    """The quiz asked for with --ops or --preset, saved if --save-preset is given.
+
+    Flags given alongside --preset override what the preset says.
+    """
+    from mentalmath.presets import (
+        DEFAULT_QUESTIONS,
+        QuizSettings,
+        load_preset,
+        parse_operations,
+        save_preset,
+    )
+
+    if args.ops is None and args.preset is None:
+        if args.save_preset is not None:
+            raise ValueError("--save-preset needs --ops or --preset")
+        return None
+    changes = {
+        "op_maxes": None if args.ops is None else parse_operations(args.ops),
+        "number_of_questions": args.number,
+        "timer": args.timer,
+        "vanish": args.vanish,
+        "auto_submit": args.auto_submit,
+        "review": args.review,
+        "special": args.special,
+    }
+    if args.preset is None:
+        settings = QuizSettings({}, DEFAULT_QUESTIONS).updated(**changes)
+    else:
+        settings = load_preset(args.preset).updated(**changes)
+    settings.check()
+    if args.save_preset is not None:
+        save_preset(args.save_preset, settings)
+    return settings
 
 
 def main() -> None:
-    app = MentalMathApp()
+    parser = argparse.ArgumentParser(prog="mmath", description="Mental math drills.")
+    parser.add_argument(
+        "--ops",
+        help="start a quiz straight away with these operations and maximums, "
+        "like multiplication=99,division=999",
+    )
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        help="how many questions the quiz has (default: 20)",
+    )
+    parser.add_argument("--timer", type=float, help="seconds for each question")
+    parser.add_argument(
+        "--vanish", type=float, help="hide each question after this many seconds"
+    )
+    parser.add_argument(
+        "--auto-submit",
+        action=argparse.BooleanOptionalAction,
+        help="submit answers as soon as they are right",
+    )
+    parser.add_argument(
+        "--review",
+        action=argparse.BooleanOptionalAction,
+        help="bring back facts that are due for review",
+    )
+    parser.add_argument(
+        "--special", type=int, help="the number for times_tables and powers"
+    )
+    parser.add_argument("--preset", help="start the quiz saved under this name")
+    parser.add_argument(
+        "--save-preset", metavar="NAME", help="save the quiz under this name"
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="print where startup time goes and exit",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed every quiz with this number, to repeat one exactly",
+    )
+    subcommands = parser.add_subparsers(dest="command")
+    worksheet = subcommands.add_parser(
+        "worksheet", help="write questions and an answer key for printing"
+    )
+    worksheet.add_argument(
+        "operations",
+        help="operations and their maximums, like multiplication=99,division=999",
+    )
+    worksheet.add_argument(
+        "-n", "--number", type=int, default=100, help="how many questions"
+    )
+    worksheet.add_argument(
+        "-o", "--output", help="file to write, or standard output if not given"
+    )
+    worksheet.add_argument(
+        "--answers",
+        help="write the answer key to this file instead of beside each question",
+    )
+    worksheet.add_argument(
+        "--format",
+        choices=("csv", "jsonl", "text"),
+        help="output format, by default taken from the output file's extension",
+    )
+    worksheet.add_argument(
+        "--workers", type=int, default=1, help="workers to generate with"
+    )
+    worksheet.add_argument(
+        "--backend",
+        choices=("interpreter", "process", "serial"),
+        default="interpreter",
+        help="run workers in subinterpreters (falling back to processes), "
+        "in processes, or not at all",
+    )
+    worksheet.add_argument(
+        "--special", type=int, help="the number for times_tables and powers"
+    )
+    worksheet.add_argument(
+        "--seed",
+        type=int,
+        default=argparse.SUPPRESS,
+        help="seed the worksheet with this number, to repeat it exactly",
+    )
+    grade = subcommands.add_parser(
+        "grade", help="mark a CSV answer sheet against a JSON Lines worksheet"
+    )
+    grade.add_argument("questions", help="the worksheet, written with --format jsonl")
+    grade.add_argument(
+        "answers", help="CSV with number and answer columns, and optionally time"
+    )
+    grade.add_argument(
+        "-o", "--output", help="file for the results, or standard output if not given"
+    )
+    grade.add_argument("--workers", type=int, default=1, help="workers to grade with")
+    grade.add_argument(
+        "--backend",
+        choices=("interpreter", "process", "serial"),
+        default="interpreter",
+        help="run workers in subinterpreters (falling back to processes), "
+        "in processes, or not at all",
+    )
+    export = subcommands.add_parser(
+        "export", help="write every answer in the history to a file"
+    )
+    export.add_argument(
+        "output",
+        help="a .csv or .jsonl file, - for standard output, "
+        "or a folder for .npy columns",
+    )
+    export.add_argument(
+        "--format",
+        choices=("csv", "jsonl", "npy"),
+        help="output format, by default taken from the output's extension",
+    )
+    export.add_argument("--operation", help="only export answers to this operation")
+    export.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="only export answers given since this date, like 2026-01-31",
+    )
+    args = parser.parse_args()
+    if args.command == "export":
+        import sqlite3
+
+        from mentalmath.data.export import HISTORY_COLUMNS, write_export
+        from mentalmath.data.history import HistoryStore
+
+        history = HistoryStore()
+        if not history.path.exists():
+            export.error(f"no history at {history.path}")
+        since = None if args.since is None else args.since.timestamp()
+        try:
+            count = write_export(
+                history.answer_chunks(args.operation, since),
+                HISTORY_COLUMNS,
+                args.output,
+                args.format,
+            )
+        except (ValueError, OSError, sqlite3.Error) as error:
+            export.error(str(error))
+        print(f"exported {count:,} answers", file=sys.stderr)
+        return
+    if args.command == "grade":
+        from mentalmath.grading import run_grade
+
+        try:
+            grades = run_grade(
+                args.questions, args.answers, args.output, args.workers, args.backend
+            )
+        except (ValueError, OSError) as error:
+            grade.error(str(error))
+        print(grades.summary(), file=sys.stderr)
+        return
+    if args.command == "worksheet":
+        from mentalmath.seeding import new_seed
+        from mentalmath.worksheet import run_worksheet
+
+        seed = new_seed() if args.seed is None else args.seed
+        try:
+            run_worksheet(
+                args.operations,
+                args.number,
+                seed,
+                args.output,
+                args.answers,
+                args.format,
+                args.workers,
+                args.special,
+                args.backend,
+            )
+        except ValueError as error:
+            worksheet.error(str(error))
+        print(f"seed {seed}", file=sys.stderr)
+        return
+    if args.startup_profile:
+        from mentalmath.startup import print_startup_profile
+
+        print_startup_profile()
+        return
+    try:
+        quiz = quiz_settings(args)
+    except (ValueError, OSError) as error:
+        parser.error(str(error))
+    app = MentalMathApp(seed=args.seed, quiz=quiz)
     app.run()
 
 
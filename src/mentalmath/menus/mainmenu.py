@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, ClassVar
 
-from textual import on
+from textual import on, work
 from textual.containers import Center, Vertical
 from textual.events import Key
 from textual.validation import Number
@@ -13,9 +13,6 @@ from textual.widgets import (
 from textual.widgets.selection_list import Selection
 
 from mentalmath.config import CONFIG
-from mentalmath.help_screen import HelpScreen
-from mentalmath.operations import display_text
-from mentalmath.special.special_screen import SelectSpecialScreen
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
@@ -27,11 +24,26 @@ class SelectOperations(Vertical):
         self.selection_list = SelectionList(
             *(
                 Selection(op.replace("_", " ").lower(), op, id=op)
-                for op in CONFIG.QUESTIONDATA
+                for op in CONFIG.OPERATIONS.menu_names()
             )
         )
         yield self.selection_list
 
+    def on_mount(self) -> None:
+        self.discover_plugins()
+
+    @work(thread=True, exit_on_error=False)
+    def discover_plugins(self) -> None:
+        """Add operations from installed plugins once the menu is showing."""
+        found = [spec.name for spec in CONFIG.OPERATIONS.discover() if not spec.special]
+        if found:
+            self.app.call_from_thread(self.add_operations, found)
+
+    def add_operations(self, names: list[str]) -> None:
+        self.selection_list.add_options(
+            Selection(op.replace("_", " ").lower(), op, id=op) for op in names
+        )
+
     @on(Key)
     def vim_bindings(self, event: Key) -> None:
         if event.key == "j":
@@ -96,7 +108,11 @@ class MainMenu(Widget):
         self._update_button_state()
 
     def action_special_screen(self) -> None:
+        from mentalmath.special.special_screen import SelectSpecialScreen
+
         self.app.push_screen(SelectSpecialScreen())
 
     def action_goto_help(self) -> None:
+        from mentalmath.help_screen import HelpScreen
+
         self.app.push_screen(HelpScreen())
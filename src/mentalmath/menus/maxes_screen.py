@@ -22,6 +22,7 @@ class InputMaxes(Vertical, can_focus=False):
     def __init__(self, selected_operations: list[str]) -> None:
         self.selected_operations = selected_operations
         self.operation_maxes: dict[str, int] = {}
+        self.operation_weights: dict[str, float] = {}
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -37,6 +38,14 @@ class InputMaxes(Vertical, can_focus=False):
                     valid_empty=False,
                     validate_on=("changed",),
                 )
+                yield Input(
+                    type="number",
+                    placeholder="Weight (1)",
+                    classes="input_weights",
+                    id=f"{operation}_weight",
+                    validators=[Number(minimum=0)],
+                    validate_on=("changed",),
+                )
 
 
 class InputMaxesScreen(Screen):
@@ -90,6 +99,16 @@ class InputMaxesScreen(Screen):
                 self.vanish_input,
                 id="vanish_container",
             )
+            yield Horizontal(
+                Label("Auto submit"),
+                Switch(animate=False, id="auto_submit_switch"),
+                id="auto_submit_container",
+            )
+            yield Horizontal(
+                Label("Review facts"),
+                Switch(animate=False, id="review_switch"),
+                id="review_container",
+            )
             yield Horizontal(
                 self.back_button,
                 Container(),
@@ -104,31 +123,17 @@ class InputMaxesScreen(Screen):
         self.vanish = self.vanish_input.value
 
     def check_ready(self) -> None:
-        all_inputs = self.query(Input)
         timer_switch = self.query_one("#timer_switch", Switch)
         vanish_switch = self.query_one("#vanish_switch", Switch)
-        if timer_switch.value and vanish_switch.value:
-            self.submit_button.disabled = not all(
-                i.value and i.is_valid for i in all_inputs
-            )
-        elif timer_switch.value:
-            self.submit_button.disabled = not all(
-                i.value and i.is_valid for i in all_inputs if i.id != "vanish_input"
-            )
-        elif vanish_switch.value:
-            self.submit_button.disabled = not all(
-                i.value and i.is_valid for i in all_inputs if i.id != "timer_input"
-            )
-        elif timer_switch.value and vanish_switch.value:
-            self.submit_button.disabled = not all(
-                i.value and i.is_valid for i in all_inputs
-            )
-        else:
-            self.submit_button.disabled = not all(
-                i.value and i.is_valid
-                for i in all_inputs
-                if i.id not in ["timer_input", "vanish_input"]
-            )
+        optional = {"timer_input": not timer_switch.value}
+        optional["vanish_input"] = not vanish_switch.value
+        ready = True
+        for i in self.query(Input):
+            if i.has_class("input_weights"):
+                ready = ready and (not i.value or i.is_valid)
+            elif not optional.get(i.id, False):
+                ready = ready and bool(i.value) and i.is_valid
+        self.submit_button.disabled = not ready
 
     def on_switch_changed(self, event: Switch.Changed) -> None:
         if event.switch.id == "timer_switch":
@@ -158,12 +163,30 @@ class InputMaxesScreen(Screen):
             input_value = self.query_one(f"#{operation}", Input)
             value = input_value.value
             self.input_maxes.operation_maxes[operation] = int(value)
-        self.dismiss((self.input_maxes.operation_maxes, self.timer, self.vanish))
+            weight = self.query_one(f"#{operation}_weight", Input).value
+            if weight:
+                self.input_maxes.operation_weights[operation] = float(weight)
+        weights = self.input_maxes.operation_weights
+        if not any(weights.get(op, 1.0) for op in self.selected_operations):
+            # Nothing would ever be asked, so fall back to the even mix.
+            weights = {}
+        auto_submit = self.query_one("#auto_submit_switch", Switch).value
+        review = self.query_one("#review_switch", Switch).value
+        self.dismiss(
+            (
+                self.input_maxes.operation_maxes,
+                weights or None,
+                self.timer,
+                self.vanish,
+                auto_submit,
+                review,
+            )
+        )
 
 
 class MainMenuTestApp(App):
     def compose(self) -> ComposeResult:
-        yield InputMaxes(list(CONFIG.QUESTIONDATA.keys()))
+        yield InputMaxes(CONFIG.OPERATIONS.menu_names())
 
 
 if __name__ == "__main__":
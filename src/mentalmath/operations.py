@@ -1,9 +1,20 @@
 import datetime
 import random
-import re
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
-from math import ceil, floor, gcd, sqrt
+from functools import cache
+from math import ceil, floor, gcd, isqrt, sqrt
+from typing import ClassVar
+
+from mentalmath.parsing import (
+    scan_decimal,
+    scan_fraction,
+    scan_gaussian,
+    scan_integer,
+    scan_remainder,
+)
 
 
 def in_bounds(test: float, bounds: tuple[float, float]) -> bool:
@@ -15,14 +26,10 @@ class NotAComplexNumberError(Exception): ...
 
 
 def complex_number_parser(cnum: str) -> tuple[int, int]:
-    ex = r"^([+-]?)\s*(\d*)\s*([+-])\s*(\d*)\s*\*?\s*[iIjJ]"
-    numbers = re.match(ex, cnum)
-    if numbers:
-        real = int(numbers.group(1) + numbers.group(2))
-        imag = int(numbers.group(3) + numbers.group(4))
-    else:
+    numbers = scan_gaussian(cnum)
+    if numbers is None:
         raise NotAComplexNumberError
-    return (real, imag)
+    return numbers
 
 
 def print_complex_number(a: int, b: int) -> str:
@@ -42,14 +49,10 @@ def simplify_fraction(num: int, denom: int) -> tuple[int, int]:
 
 
 def parse_fraction(fraction: str) -> tuple[int, int]:
-    ex = r"([0-9]*)\s*/\s*([0-9]*)"
-    numbers = re.match(ex, fraction)
-    if numbers:
-        num = int(numbers.group(1))
-        denom = int(numbers.group(2))
-    else:
+    numbers = scan_fraction(fraction)
+    if numbers is None:
         raise NotAFractionError
-    return (num, denom)
+    return numbers
 
 
 def display_fraction(num: float | str, denom: float | str) -> str:
@@ -57,36 +60,163 @@ def display_fraction(num: float | str, denom: float | str) -> str:
 
 
 def parse_division(ans: str) -> tuple[int, int]:
-    ex = r"(\d+)(?:\s*[rR]\s*(\d+))?"
-    numbers = re.match(ex, ans)
-    if numbers:
-        quotient = int(numbers.group(1))
-        remainder = int(numbers.group(2)) if numbers.group(2) else 0
-    else:
+    numbers = scan_remainder(ans)
+    if numbers is None:
         raise ValueError
-    return (quotient, remainder)
+    return numbers
 
 
 def display_text(text: str) -> str:
     return text.replace("_", " ").title()
 
 
+# Above this span, float-scaled draws lose uniformity, so fall back to randint.
+EXACT_DRAW_SPAN: int = 1 << 32
+
+
+def randint_column(rng: random.Random, low: int, high: int, n: int) -> list[int]:
+    """Draw n integers in [low, high] in a single call."""
+    if high - low >= EXACT_DRAW_SPAN:
+        return [rng.randint(low, high) for _ in range(n)]
+    return rng.choices(range(low, high + 1), k=n)
+
+
+def randint_upto_column(rng: random.Random, highs: Sequence[int]) -> list[int]:
+    """Draw one integer in [1, high] for every high in highs."""
+    if max(highs, default=0) >= EXACT_DRAW_SPAN:
+        return [rng.randint(1, high) for high in highs]
+    rand = rng.random
+    return [1 + int(rand() * high) for high in highs]
+
+
+def pack_column(values: list) -> Sequence:
+    """Store a column in a typed array when every value fits in one."""
+    if values and isinstance(values[0], float):
+        return array("d", values)
+    try:
+        return array("q", values)
+    except OverflowError, TypeError:
+        return values
+
+
+@dataclass
+class QuestionBatch:
+    """A block of questions of one operation, stored column by column."""
+
+    operation: type[QuestionInfo]
+    symbol: str
+    left: Sequence
+    right: Sequence | None
+    correct: Sequence
+    special: dict[str, int]
+    displays: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self.left)
+
+    def display(self, i: int) -> str:
+        if self.displays is not None:
+            return self.displays[i]
+        right = self.right[i] if self.right is not None else ""
+        return self.operation.display_format.format(self.left[i], right)
+
+    def question(self, i: int) -> QuestionInfo:
+        """Build the scalar question for row i so it can be verified."""
+        question = self.operation(**self.special)
+        question.symbol = self.symbol
+        question.display = self.display(i)
+        right = self.right[i] if self.right is not None else None
+        question.restore(self.left[i], right, self.correct[i])
+        return question
+
+
 class QuestionInfo(ABC):
     textual_input_type: str | None = None
     input_restrictions: str | None = None
+    display_format: str | None = None
+    # Whether ask() can set up a question again from its operands.
+    repeatable: ClassVar[bool] = False
 
-    def __init__(self, **kwargs: int) -> None:
+    def __init__(self, rng: random.Random | None = None, **kwargs: int) -> None:
         self.left: float | str = ""
         self.right: float | str = ""
         self.symbol: str = ""
         self.correct: float | complex | tuple[int, int] | None = None
         self.display: str = ""
         self.special: dict[str, int] | None = kwargs
+        self.rng = random if rng is None else rng
 
     @abstractmethod
     def new(self, top: int) -> None:
         """Generate a new question."""
 
+    def ask(self, left: int, right: int | str) -> None:
+        """Set up the question with the given operands, to repeat a fact.
+
+        Operations whose questions are fixed by their operands implement this
+        and set repeatable, and the fact scheduler brings their facts back.
+        Fraction and complex questions keep their operands as display text,
+        and calendar questions their date, so they are not repeatable.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't be repeated")
+
+    def could_ask(self, left: int, right: int | str, top: int) -> bool:
+        """Whether new(top) could have produced these operands."""
+        return left <= top and right <= top
+
+    @classmethod
+    def answer_text(cls, correct: object) -> str:
+        """How an answer key writes a correct answer."""
+        return f"{correct:.2f}" if isinstance(correct, float) else str(correct)
+
+    @classmethod
+    def encode_correct(cls, correct: object) -> object:
+        """A correct answer as a JSON value, read back by decode_correct."""
+        return correct
+
+    @classmethod
+    def decode_correct(cls, value: object) -> object:
+        return tuple(value) if isinstance(value, list) else value
+
+    def restore(
+        self, left: float | str, right: float | str | None, correct: object
+    ) -> None:
+        """Set up a stored question again so verify_correct can check it."""
+        self.left = left
+        if right is not None:
+            self.right = right
+        self.correct = correct
+        self.build_acceptance()
+
+    def build_acceptance(self) -> None:
+        """Precompute what verify_correct accepts for the current question."""
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        """Generate n questions at once.
+
+        Subclasses override this with column-wise draws, which take numbers
+        from the RNG in a different order than new() does: a batch follows
+        the same distribution as n scalar calls, but for the same seed it
+        holds different questions. The default repeats new(), so it produces
+        exactly what n scalar calls would.
+        """
+        left, right, correct, displays = [], [], [], []
+        for _ in range(n):
+            self.new(top)
+            left.append(self.left)
+            right.append(self.right)
+            correct.append(self.correct)
+            displays.append(self.display)
+        return QuestionBatch(
+            type(self),
+            self.symbol,
+            pack_column(left),
+            pack_column(right),
+            pack_column(correct),
+            self.special,
+            displays,
+        )
+
     @abstractmethod
     def verify_correct(self, usr_input: str) -> bool:
         """Check correctness."""
@@ -96,6 +226,14 @@ DIVISOR_MAX: int = 2
 TOLERANCE: float = 0.01
 
 
+def tolerance_bounds(approx: float, exact: float, tol: float) -> tuple[int, int]:
+    """Whole-number bounds covering both the exact answer and its approximation."""
+    return (
+        floor(min(approx - tol, exact - tol)),
+        ceil(max(approx + tol, exact + tol)),
+    )
+
+
 @dataclass
 class QuestionData:
     name: str
@@ -118,43 +256,81 @@ class AnswerData:
 class TimesTables(QuestionInfo):
     textual_input_type = "integer"
     input_restrictions = None
+    display_format = "{} × {}"
+    repeatable = True
 
     def new(self, top: int) -> None:
-        self.symbol = "×"
         num = self.special["num"]
-        other_num = random.randint(1, top)
-        if random.random() < 0.5:
-            left, right = (num, other_num)
+        other_num = self.rng.randint(1, top)
+        if self.rng.random() < 0.5:
+            self.ask(num, other_num)
         else:
-            left, right = (other_num, num)
+            self.ask(other_num, num)
+
+    def ask(self, left: int, right: int) -> None:
+        self.symbol = "×"
         self.left = left
         self.right = right
-        self.correct = self.left * self.right
-        self.display = f"{self.left} × {self.right}"
+        self.correct = left * right
+        self.display = self.display_format.format(left, right)
+
+    def could_ask(self, left: int, right: int, top: int) -> bool:
+        num = self.special["num"]
+        return (left == num and right <= top) or (right == num and left <= top)
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        num = self.special["num"]
+        others = randint_column(self.rng, 1, top, n)
+        rand = self.rng.random
+        num_first = [rand() < 0.5 for _ in range(n)]
+        left = [num if first else other for first, other in zip(num_first, others)]
+        right = [other if first else num for first, other in zip(num_first, others)]
+        return QuestionBatch(
+            type(self),
+            "×",
+            pack_column(left),
+            pack_column(right),
+            pack_column([num * other for other in others]),
+            self.special,
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            return int(usr_input) == self.correct
-        except ValueError:
-            return False
+        return scan_integer(usr_input) == self.correct
 
 
 class Powers(QuestionInfo):
     textual_input_type = "integer"
     input_restrictions = None
+    display_format = "{}^{}"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.special["num"], self.rng.randint(1, top))
+
+    def ask(self, left: int, right: int) -> None:
         self.symbol = "^"
-        self.left = self.special["num"]
-        self.right = random.randint(1, top)
-        self.correct = self.left**self.right
-        self.display = f"{self.left}^{self.right}"
+        self.left = left
+        self.right = right
+        self.correct = left**right
+        self.display = self.display_format.format(left, right)
+
+    def could_ask(self, left: int, right: int, top: int) -> bool:
+        return left == self.special["num"] and right <= top
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        num = self.special["num"]
+        right = randint_column(self.rng, 1, top, n)
+        return QuestionBatch(
+            type(self),
+            "^",
+            pack_column([num] * n),
+            pack_column(right),
+            pack_column([num**b for b in right]),
+            self.special,
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            return int(usr_input) == self.correct
-        except ValueError:
-            return False
+        return scan_integer(usr_input) == self.correct
 
 
 default = {
@@ -169,153 +345,290 @@ default = {
 class Addition(QuestionInfo):
     textual_input_type = "integer"
     input_restrictions = None
+    display_format = "{} + {}"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), self.rng.randint(1, top))
+
+    def ask(self, left: int, right: int) -> None:
         self.symbol = "+"
-        self.left = random.randint(1, top)
-        self.right = random.randint(1, top)
-        self.correct = self.left + self.right
-        self.display = f"{self.left} + {self.right}"
+        self.left = left
+        self.right = right
+        self.correct = left + right
+        self.display = self.display_format.format(left, right)
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        right = randint_column(self.rng, 1, top, n)
+        correct = [a + b for a, b in zip(left, right, strict=True)]
+        return QuestionBatch(
+            type(self),
+            "+",
+            pack_column(left),
+            pack_column(right),
+            pack_column(correct),
+            self.special,
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            return int(usr_input) == self.correct
-        except ValueError:
-            return False
+        return scan_integer(usr_input) == self.correct
 
 
 class Subtraction(QuestionInfo):
     textual_input_type = "integer"
     input_restrictions = None
+    display_format = "{} − {}"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        left = self.rng.randint(1, top)
+        self.ask(left, self.rng.randint(1, left))
+
+    def ask(self, left: int, right: int) -> None:
         self.symbol = "−"
-        self.left = random.randint(1, top)
-        self.right = random.randint(1, self.left)
-        self.correct = self.left - self.right
-        self.display = f"{self.left} − {self.right}"
+        self.left = left
+        self.right = right
+        self.correct = left - right
+        self.display = self.display_format.format(left, right)
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        right = randint_upto_column(self.rng, left)
+        correct = [a - b for a, b in zip(left, right, strict=True)]
+        return QuestionBatch(
+            type(self),
+            "−",
+            pack_column(left),
+            pack_column(right),
+            pack_column(correct),
+            self.special,
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            return int(usr_input) == self.correct
-        except ValueError:
-            return False
+        return scan_integer(usr_input) == self.correct
 
 
 class Multiplication(QuestionInfo):
     textual_input_type = "integer"
     input_restrictions = None
+    display_format = "{} × {}"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), self.rng.randint(1, top))
+
+    def ask(self, left: int, right: int) -> None:
         self.symbol = "×"
-        self.left = random.randint(1, top)
-        self.right = random.randint(1, top)
-        self.correct = self.left * self.right
-        self.display = f"{self.left} × {self.right}"
+        self.left = left
+        self.right = right
+        self.correct = left * right
+        self.display = self.display_format.format(left, right)
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        right = randint_column(self.rng, 1, top, n)
+        correct = [a * b for a, b in zip(left, right, strict=True)]
+        return QuestionBatch(
+            type(self),
+            "×",
+            pack_column(left),
+            pack_column(right),
+            pack_column(correct),
+            self.special,
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            return int(usr_input) == self.correct
-        except ValueError:
-            return False
+        return scan_integer(usr_input) == self.correct
 
 
 class Division(QuestionInfo):
     textual_input_type = "text"
     input_restrictions = "[0123456789rR\\s]*"
+    display_format = "{} ÷ {}"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        left = self.rng.randint(1, top)
+        self.ask(left, self.rng.randint(1, max(floor(left / DIVISOR_MAX), 1)))
+
+    def ask(self, left: int, right: int) -> None:
         self.symbol = "÷"
-        self.left = random.randint(1, top)
-        self.right = random.randint(1, max(floor(self.left / DIVISOR_MAX), 1))
-        self.correct = divmod(self.left, self.right)
-        self.display = f"{self.left} ÷ {self.right}"
+        self.left = left
+        self.right = right
+        self.correct = divmod(left, right)
+        self.display = self.display_format.format(left, right)
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        right = randint_upto_column(
+            self.rng, [max(floor(a / DIVISOR_MAX), 1) for a in left]
+        )
+        correct = [divmod(a, b) for a, b in zip(left, right, strict=True)]
+        return QuestionBatch(
+            type(self),
+            "÷",
+            pack_column(left),
+            pack_column(right),
+            pack_column(correct),
+            self.special,
+        )
+
+    @classmethod
+    def answer_text(cls, correct: tuple[int, int]) -> str:
+        quotient, remainder = correct
+        return f"{quotient} r {remainder}" if remainder else str(quotient)
 
     def verify_correct(self, usr_input: str) -> bool:
-        correct_quotient, correct_remainder = self.correct
-        try:
-            usr_quotient, usr_remainder = parse_division(usr_input)
-        except ValueError:
-            return False
-        return usr_quotient == correct_quotient and usr_remainder == correct_remainder
+        return scan_remainder(usr_input) == self.correct
 
 
 class Square(QuestionInfo):
     textual_input_type = "integer"
     input_restrictions = None
+    display_format = "{}^2"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), 2)
+
+    def ask(self, left: int, right: int) -> None:
         self.symbol = "^"
-        self.left = random.randint(1, top)
-        self.right = 2
-        self.correct = self.left**2
-        self.display = f"{self.left}^2"
+        self.left = left
+        self.right = right
+        self.correct = left**right
+        self.display = self.display_format.format(left, right)
+
+    def could_ask(self, left: int, right: int, top: int) -> bool:
+        return left <= top and right == 2
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        return QuestionBatch(
+            type(self),
+            "^",
+            pack_column(left),
+            pack_column([2] * n),
+            pack_column([a**2 for a in left]),
+            self.special,
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            return int(usr_input) == self.correct
-        except ValueError:
-            return False
+        return scan_integer(usr_input) == self.correct
 
 
 class Mod(QuestionInfo):
     textual_input_type = "integer"
     input_restrictions = None
+    display_format = "{} mod {}"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        left = self.rng.randint(1, top)
+        self.ask(left, self.rng.randint(1, max(floor(left / DIVISOR_MAX), 1)))
+
+    def ask(self, left: int, right: int) -> None:
         self.symbol = "mod"
-        self.left = random.randint(1, top)
-        self.right = random.randint(1, max(floor(self.left / DIVISOR_MAX), 1))
-        self.correct = self.left % self.right
-        self.display = f"{self.left} mod {self.right}"
+        self.left = left
+        self.right = right
+        self.correct = left % right
+        self.display = self.display_format.format(left, right)
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        right = randint_upto_column(
+            self.rng, [max(floor(a / DIVISOR_MAX), 1) for a in left]
+        )
+        correct = [a % b for a, b in zip(left, right, strict=True)]
+        return QuestionBatch(
+            type(self),
+            "mod",
+            pack_column(left),
+            pack_column(right),
+            pack_column(correct),
+            self.special,
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            return int(usr_input) == self.correct
-        except ValueError:
-            return False
+        return scan_integer(usr_input) == self.correct
 
 
 class SquareRoot(QuestionInfo):
     textual_input_type = "number"
     input_restrictions = None
+    display_format = "√{}"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), "")
+
+    def ask(self, left: int, right: str) -> None:
         self.symbol = "sqrt"
-        self.left = random.randint(1, top)
-        self.display = f"√{self.left}"
-        self.correct = sqrt(self.left)
+        self.left = left
+        self.right = right
+        self.display = self.display_format.format(left, right)
+        self.correct = sqrt(left)
+        self.build_acceptance()
+
+    def could_ask(self, left: int, right: str, top: int) -> bool:
+        return left <= top
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        correct = [sqrt(a) for a in left]
+        return QuestionBatch(
+            type(self),
+            "sqrt",
+            pack_column(left),
+            None,
+            pack_column(correct),
+            self.special,
+        )
+
+    def build_acceptance(self) -> None:
+        rounded = round(self.correct)
+        best_answer = rounded - (rounded**2 - self.left) / (2 * rounded)
+        self.bounds = tolerance_bounds(
+            best_answer, self.correct, best_answer * TOLERANCE
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            rounded = round(self.correct)
-            best_answer = rounded - (rounded**2 - self.left) / (2 * rounded)
-            tol = best_answer * TOLERANCE
-            correct_bounds = (
-                floor(min(self.correct - tol, best_answer - tol)),
-                ceil(max(self.correct + tol, best_answer + tol)),
-            )
-            return in_bounds(float(usr_input), correct_bounds)
-        except ValueError, TypeError:
-            return False
+        value = scan_decimal(usr_input)
+        return value is not None and in_bounds(value, self.bounds)
 
 
 class PerfectSquareRoot(QuestionInfo):
     textual_input_type = "integer"
     input_restrictions = None
+    display_format = "√{}"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, floor(sqrt(top))) ** 2, "")
+
+    def ask(self, left: int, right: str) -> None:
         self.symbol = "sqrt"
-        num = floor(sqrt(top))
-        self.correct = random.randint(1, num)
-        self.left = self.correct**2
-        self.display = f"√{self.left}"
+        self.left = left
+        self.right = right
+        self.correct = isqrt(left)
+        self.display = self.display_format.format(left, right)
+
+    def could_ask(self, left: int, right: str, top: int) -> bool:
+        return left <= top and isqrt(left) ** 2 == left
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        correct = randint_column(self.rng, 1, floor(sqrt(top)), n)
+        return QuestionBatch(
+            type(self),
+            "sqrt",
+            pack_column([c**2 for c in correct]),
+            None,
+            pack_column(correct),
+            self.special,
+        )
 
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            return int(usr_input) == self.correct
-        except ValueError:
-            return False
+        return scan_integer(usr_input) == self.correct
 
 
 class ComplexMultiplication(QuestionInfo):
@@ -324,10 +637,10 @@ class ComplexMultiplication(QuestionInfo):
 
     def new(self, top: int) -> None:
         self.symbol = "×"
-        a = random.randint(-top, top)
-        b = random.randint(-top, top)
-        c = random.randint(-top, top)
-        d = random.randint(-top, top)
+        a = self.rng.randint(-top, top)
+        b = self.rng.randint(-top, top)
+        c = self.rng.randint(-top, top)
+        d = self.rng.randint(-top, top)
         first = complex(a, b)
         second = complex(c, d)
         self.left = print_complex_number(a, b)
@@ -337,11 +650,23 @@ class ComplexMultiplication(QuestionInfo):
             f"({print_complex_number(a, b)}) × ({print_complex_number(c, d)})"
         )
 
+    @classmethod
+    def answer_text(cls, correct: complex) -> str:
+        return print_complex_number(int(correct.real), int(correct.imag))
+
+    @classmethod
+    def encode_correct(cls, correct: complex) -> list[float]:
+        return [correct.real, correct.imag]
+
+    @classmethod
+    def decode_correct(cls, value: list[float]) -> complex:
+        return complex(*value)
+
     def verify_correct(self, usr_input: str) -> bool:
-        try:
-            usr_real, usr_imag = complex_number_parser(usr_input)
-        except ValueError, NotAComplexNumberError:
+        numbers = scan_gaussian(usr_input)
+        if numbers is None:
             return False
+        usr_real, usr_imag = numbers
         return usr_real == self.correct.real and usr_imag == self.correct.imag
 
 
@@ -351,10 +676,10 @@ class FractionAddition(QuestionInfo):
 
     def new(self, top: int) -> None:
         self.symbol = "+"
-        a = random.randint(1, top)
-        b = random.randint(1, top)
-        c = random.randint(1, top)
-        d = random.randint(1, top)
+        a = self.rng.randint(1, top)
+        b = self.rng.randint(1, top)
+        c = self.rng.randint(1, top)
+        d = self.rng.randint(1, top)
         a, b = simplify_fraction(a, b)
         c, d = simplify_fraction(c, d)
         self.left = display_fraction(a, b)
@@ -362,13 +687,12 @@ class FractionAddition(QuestionInfo):
         self.correct = simplify_fraction(a * d + b * c, b * d)
         self.display = f"{display_fraction(a, b)} + {display_fraction(c, d)}"
 
+    @classmethod
+    def answer_text(cls, correct: tuple[int, int]) -> str:
+        return display_fraction(*correct)
+
     def verify_correct(self, usr_input: str) -> bool:
-        correct_num, correct_denom = self.correct
-        try:
-            usr_num, usr_denom = parse_fraction(usr_input)
-        except ValueError, NotAFractionError:
-            return False
-        return usr_num == correct_num and usr_denom == correct_denom
+        return scan_fraction(usr_input) == self.correct
 
 
 class FractionMultiplication(QuestionInfo):
@@ -377,10 +701,10 @@ class FractionMultiplication(QuestionInfo):
 
     def new(self, top: int) -> None:
         self.symbol = "×"
-        a = random.randint(1, top)
-        b = random.randint(1, top)
-        c = random.randint(1, top)
-        d = random.randint(1, top)
+        a = self.rng.randint(1, top)
+        b = self.rng.randint(1, top)
+        c = self.rng.randint(1, top)
+        d = self.rng.randint(1, top)
         a, b = simplify_fraction(a, b)
         c, d = simplify_fraction(c, d)
         self.left = display_fraction(a, b)
@@ -388,190 +712,403 @@ class FractionMultiplication(QuestionInfo):
         self.correct = simplify_fraction(a * c, b * d)
         self.display = f"{display_fraction(a, b)} * {display_fraction(c, d)}"
 
+    @classmethod
+    def answer_text(cls, correct: tuple[int, int]) -> str:
+        return display_fraction(*correct)
+
     def verify_correct(self, usr_input: str) -> bool:
-        correct_num, correct_denom = self.correct
-        try:
-            usr_num, usr_denom = parse_fraction(usr_input)
-        except ValueError, NotAFractionError:
-            return False
-        return usr_num == correct_num and usr_denom == correct_denom
+        return scan_fraction(usr_input) == self.correct
 
 
 class CelsiusToFahrenheit(QuestionInfo):
     textual_input_type = "number"
     input_restrictions = None
+    display_format = "{}° Celsius to Fahrenheit"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), "")
+
+    def ask(self, left: int, right: str) -> None:
         self.symbol = "C -> F"
-        self.left = random.randint(1, top)
-        self.correct = self.left * 1.8 + 32
-        self.display = f"{self.left}° Celsius to Fahrenheit"
+        self.left = left
+        self.right = right
+        self.correct = left * 1.8 + 32
+        self.display = self.display_format.format(left, right)
+        self.build_acceptance()
+
+    def could_ask(self, left: int, right: str, top: int) -> bool:
+        return left <= top
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        correct = [a * 1.8 + 32 for a in left]
+        return QuestionBatch(
+            type(self),
+            "C -> F",
+            pack_column(left),
+            None,
+            pack_column(correct),
+            self.special,
+        )
 
-    def verify_correct(self, usr_input: str) -> bool:
+    def build_acceptance(self) -> None:
         approx = self.left * 2 + 30
-        tol = self.correct * TOLERANCE
-        lower_bound = floor(min(approx - tol, self.correct - tol))
-        upper_bound = ceil(max(approx + tol, self.correct + tol))
-        try:
-            return in_bounds(float(usr_input), (lower_bound, upper_bound))
-        except ValueError:
-            return False
+        self.bounds = tolerance_bounds(approx, self.correct, self.correct * TOLERANCE)
+
+    def verify_correct(self, usr_input: str) -> bool:
+        value = scan_decimal(usr_input)
+        return value is not None and in_bounds(value, self.bounds)
 
 
 class FahrenheitToCelsius(QuestionInfo):
     textual_input_type = "number"
     input_restrictions = None
+    display_format = "{}° Celsius to Fahrenheit"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), "")
+
+    def ask(self, left: int, right: str) -> None:
         self.symbol = "F -> C"
-        self.left = random.randint(1, top)
-        self.correct = self.left - 32 / 1.8
-        self.display = f"{self.left}° Celsius to Fahrenheit"
+        self.left = left
+        self.right = right
+        self.correct = left - 32 / 1.8
+        self.display = self.display_format.format(left, right)
+        self.build_acceptance()
+
+    def could_ask(self, left: int, right: str, top: int) -> bool:
+        return left <= top
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        correct = [a - 32 / 1.8 for a in left]
+        return QuestionBatch(
+            type(self),
+            "F -> C",
+            pack_column(left),
+            None,
+            pack_column(correct),
+            self.special,
+        )
 
-    def verify_correct(self, usr_input: str) -> bool:
+    def build_acceptance(self) -> None:
         approx = (self.left - 30) / 2
-        tol = self.correct * TOLERANCE
-        lower_bound = floor(min(approx - tol, self.correct - tol))
-        upper_bound = ceil(max(approx + tol, self.correct + tol))
-        try:
-            return in_bounds(float(usr_input), (lower_bound, upper_bound))
-        except ValueError:
-            return False
+        self.bounds = tolerance_bounds(approx, self.correct, self.correct * TOLERANCE)
+
+    def verify_correct(self, usr_input: str) -> bool:
+        value = scan_decimal(usr_input)
+        return value is not None and in_bounds(value, self.bounds)
 
 
 class PoundsToKilograms(QuestionInfo):
     textual_input_type = "number"
     input_restrictions = None
+    display_format = "{} pounds to kilograms"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), "")
+
+    def ask(self, left: int, right: str) -> None:
         self.symbol = "lb -> kg"
-        self.left = random.randint(1, top)
-        self.correct = self.left * 0.45359237
-        self.display = f"{self.left} pounds to kilograms"
+        self.left = left
+        self.right = right
+        self.correct = left * 0.45359237
+        self.display = self.display_format.format(left, right)
+        self.build_acceptance()
+
+    def could_ask(self, left: int, right: str, top: int) -> bool:
+        return left <= top
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        correct = [a * 0.45359237 for a in left]
+        return QuestionBatch(
+            type(self),
+            "lb -> kg",
+            pack_column(left),
+            None,
+            pack_column(correct),
+            self.special,
+        )
 
-    def verify_correct(self, usr_input: str) -> bool:
+    def build_acceptance(self) -> None:
         approx = self.left * 0.45
-        tol = self.correct * TOLERANCE
-        lower_bound = floor(min(approx - tol, self.correct - tol))
-        upper_bound = ceil(max(approx + tol, self.correct + tol))
-        try:
-            return in_bounds(float(usr_input), (lower_bound, upper_bound))
-        except ValueError:
-            return False
+        self.bounds = tolerance_bounds(approx, self.correct, self.correct * TOLERANCE)
+
+    def verify_correct(self, usr_input: str) -> bool:
+        value = scan_decimal(usr_input)
+        return value is not None and in_bounds(value, self.bounds)
 
 
 class KilogramsToPounds(QuestionInfo):
     textual_input_type = "number"
     input_restrictions = None
+    display_format = "{} kilograms to pounds"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), "")
+
+    def ask(self, left: int, right: str) -> None:
         self.symbol = "kg -> lb"
-        self.left = random.randint(1, top)
-        self.correct = self.left * 2.20462
-        self.display = f"{self.left} kilograms to pounds"
+        self.left = left
+        self.right = right
+        self.correct = left * 2.20462
+        self.display = self.display_format.format(left, right)
+        self.build_acceptance()
+
+    def could_ask(self, left: int, right: str, top: int) -> bool:
+        return left <= top
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        correct = [a * 2.20462 for a in left]
+        return QuestionBatch(
+            type(self),
+            "kg -> lb",
+            pack_column(left),
+            None,
+            pack_column(correct),
+            self.special,
+        )
 
-    def verify_correct(self, usr_input: str) -> bool:
+    def build_acceptance(self) -> None:
         approx = self.left * 2.2
-        tol = self.correct * TOLERANCE
-        lower_bound = floor(min(approx - tol, self.correct - tol))
-        upper_bound = ceil(max(approx + tol, self.correct + tol))
-        try:
-            return in_bounds(float(usr_input), (lower_bound, upper_bound))
-        except ValueError:
-            return False
+        self.bounds = tolerance_bounds(approx, self.correct, self.correct * TOLERANCE)
+
+    def verify_correct(self, usr_input: str) -> bool:
+        value = scan_decimal(usr_input)
+        return value is not None and in_bounds(value, self.bounds)
 
 
 class MilesToKilometers(QuestionInfo):
     textual_input_type = "number"
     input_restrictions = None
+    display_format = "{} miles to kilometers"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), "")
+
+    def ask(self, left: int, right: str) -> None:
         self.symbol = "mi -> km"
-        self.left = random.randint(1, top)
-        self.correct = self.left * 1.609344
-        self.display = f"{self.left} miles to kilometers"
+        self.left = left
+        self.right = right
+        self.correct = left * 1.609344
+        self.display = self.display_format.format(left, right)
+        self.build_acceptance()
+
+    def could_ask(self, left: int, right: str, top: int) -> bool:
+        return left <= top
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        correct = [a * 1.609344 for a in left]
+        return QuestionBatch(
+            type(self),
+            "mi -> km",
+            pack_column(left),
+            None,
+            pack_column(correct),
+            self.special,
+        )
 
-    def verify_correct(self, usr_input: str) -> bool:
+    def build_acceptance(self) -> None:
         approx = self.left * 1.6
-        tol = self.correct * TOLERANCE
-        lower_bound = floor(min(approx - tol, self.correct - tol))
-        upper_bound = ceil(max(approx + tol, self.correct + tol))
-        try:
-            return in_bounds(float(usr_input), (lower_bound, upper_bound))
-        except ValueError:
-            return False
+        self.bounds = tolerance_bounds(approx, self.correct, self.correct * TOLERANCE)
+
+    def verify_correct(self, usr_input: str) -> bool:
+        value = scan_decimal(usr_input)
+        return value is not None and in_bounds(value, self.bounds)
 
 
 class KilometersToMiles(QuestionInfo):
     textual_input_type = "number"
     input_restrictions = None
+    display_format = "{} kilometers to miles"
+    repeatable = True
 
     def new(self, top: int) -> None:
+        self.ask(self.rng.randint(1, top), "")
+
+    def ask(self, left: int, right: str) -> None:
         self.symbol = "km -> mi"
-        self.left = random.randint(1, top)
-        self.correct = self.left * 0.621371
-        self.display = f"{self.left} kilometers to miles"
+        self.left = left
+        self.right = right
+        self.correct = left * 0.621371
+        self.display = self.display_format.format(left, right)
+        self.build_acceptance()
+
+    def could_ask(self, left: int, right: str, top: int) -> bool:
+        return left <= top
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        left = randint_column(self.rng, 1, top, n)
+        correct = [a * 0.621371 for a in left]
+        return QuestionBatch(
+            type(self),
+            "km -> mi",
+            pack_column(left),
+            None,
+            pack_column(correct),
+            self.special,
+        )
 
-    def verify_correct(self, usr_input: str) -> bool:
+    def build_acceptance(self) -> None:
         approx = self.left * 0.625
-        tol = self.correct * TOLERANCE
-        lower_bound = floor(min(approx - tol, self.correct - tol))
-        upper_bound = ceil(max(approx + tol, self.correct + tol))
-        try:
-            return in_bounds(float(usr_input), (lower_bound, upper_bound))
-        except ValueError:
-            return False
+        self.bounds = tolerance_bounds(approx, self.correct, self.correct * TOLERANCE)
+
+    def verify_correct(self, usr_input: str) -> bool:
+        value = scan_decimal(usr_input)
+        return value is not None and in_bounds(value, self.bounds)
+
+
+WEEKDAYS: dict[str, int] = {
+    "sunday": 0,
+    "sun": 0,
+    "0": 0,
+    "monday": 1,
+    "mon": 1,
+    "m": 1,
+    "1": 1,
+    "tuesday": 2,
+    "tue": 2,
+    "tues": 2,
+    "t": 2,
+    "2": 2,
+    "wednesday": 3,
+    "wed": 3,
+    "w": 3,
+    "3": 3,
+    "thursday": 4,
+    "thu": 4,
+    "th": 4,
+    "thurs": 4,
+    "4": 4,
+    "friday": 5,
+    "fri": 5,
+    "f": 5,
+    "5": 5,
+    "saturday": 6,
+    "sat": 6,
+    "6": 6,
+}
+
+DAY_NAMES: tuple[str, ...] = (
+    "Sunday",
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+)
 
+MONTH_NAMES: tuple[str, ...] = (
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+FIRST_YEAR: int = 1600
+LAST_YEAR: int = 2099
 
-def random_date() -> datetime.date:
-    start = datetime.date(1600, 1, 1)
-    end = datetime.date(2099, 12, 31)
-    return datetime.date.fromordinal(random.randint(start.toordinal(), end.toordinal()))
+
+class DateRange:
+    """Every day from the start of first_year to the end of last_year.
+
+    Days are drawn as proleptic Gregorian ordinals, so sampling is a single
+    randint, and the weekday of ordinal n is n % 7 counting from Sunday.
+    """
+
+    def __init__(self, first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR):
+        if last_year < first_year:
+            raise ValueError(f"empty year range {first_year}-{last_year}")
+        self.first_year = first_year
+        self.last_year = last_year
+        self.low = datetime.date(first_year, 1, 1).toordinal()
+        self.high = datetime.date(last_year, 12, 31).toordinal()
+
+    def ordinal(self, rng: random.Random) -> int:
+        return rng.randint(self.low, self.high)
+
+    def ordinals(self, rng: random.Random, n: int) -> list[int]:
+        return randint_column(rng, self.low, self.high, n)
+
+
+@cache
+def date_range(first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR) -> DateRange:
+    return DateRange(first_year, last_year)
+
+
+def weekday(ordinal: int) -> int:
+    """Day of the week of a date ordinal, with Sunday as 0."""
+    return ordinal % 7
+
+
+def format_ordinal(ordinal: int) -> str:
+    date = datetime.date.fromordinal(ordinal)
+    return f"{MONTH_NAMES[date.month]} {date.day}, {date.year}"
+
+
+def random_date(
+    rng: random.Random = random,
+    first_year: int = FIRST_YEAR,
+    last_year: int = LAST_YEAR,
+) -> datetime.date:
+    return datetime.date.fromordinal(date_range(first_year, last_year).ordinal(rng))
 
 
 class Calendar(QuestionInfo):
+    """Day of the week of a random date.
+
+    The year range comes from the first_year and last_year keyword arguments
+    and can cover anything from 1 to 9999.
+    """
+
     textual_input_type = "text"
     input_restrictions = None
+    display_format = "The day of the week of {}"
+
+    def __init__(self, rng: random.Random | None = None, **kwargs: int) -> None:
+        super().__init__(rng, **kwargs)
+        self.dates = date_range(
+            kwargs.get("first_year", FIRST_YEAR), kwargs.get("last_year", LAST_YEAR)
+        )
 
     def new(self, top: int) -> None:
         self.symbol = "cal"
-        date_question = random_date()
-        self.left = date_question.strftime("%B %d, %Y")
-        self.correct = (date_question.weekday() + 1) % 7
-        day = date_question.day
-        self.display = (
-            f"The day of the week of {date_question.strftime('%B {}, %Y').format(day)}"
+        ordinal = self.dates.ordinal(self.rng)
+        self.left = format_ordinal(ordinal)
+        self.correct = weekday(ordinal)
+        self.display = self.display_format.format(self.left)
+
+    def new_batch(self, top: int, n: int) -> QuestionBatch:
+        ordinals = self.dates.ordinals(self.rng, n)
+        return QuestionBatch(
+            type(self),
+            "cal",
+            list(map(format_ordinal, ordinals)),
+            None,
+            array("q", map(weekday, ordinals)),
+            self.special,
         )
 
+    @classmethod
+    def answer_text(cls, correct: int) -> str:
+        return DAY_NAMES[correct]
+
     def verify_correct(self, usr_input: str) -> bool:
-        week_dict: dict[str, int] = {
-            "sunday": 0,
-            "sun": 0,
-            "0": 0,
-            "monday": 1,
-            "mon": 1,
-            "m": 1,
-            "1": 1,
-            "tuesday": 2,
-            "tue": 2,
-            "tues": 2,
-            "t": 2,
-            "2": 2,
-            "wednesday": 3,
-            "wed": 3,
-            "w": 3,
-            "3": 3,
-            "thursday": 4,
-            "thu": 4,
-            "th": 4,
-            "thurs": 4,
-            "4": 4,
-            "friday": 5,
-            "fri": 5,
-            "f": 5,
-            "5": 5,
-            "saturday": 6,
-            "sat": 6,
-            "6": 6,
-        }
-        return week_dict.get(usr_input.lower()) == self.correct
+        return WEEKDAYS.get(usr_input.lower()) == self.correct
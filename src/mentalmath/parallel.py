@@ -0,0 +1,95 @@
+import warnings
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+    from concurrent.futures.interpreter import BrokenInterpreterPool
+    from concurrent.interpreters import ExecutionFailed, NotShareableError
+except ImportError:  # Python built without subinterpreters
+    InterpreterPoolExecutor = None
+
+BACKENDS: tuple[str, ...] = ("interpreter", "process", "serial")
+# Errors raised inside a subinterpreter that mean it can't run the work at
+# all, such as an extension module that doesn't support subinterpreters. The
+# pool raises them again as they are, or wrapped in ExecutionFailed when they
+# can't be passed back.
+UNSUPPORTED_ERRORS: frozenset[str] = frozenset({"ImportError", "ModuleNotFoundError"})
+# Items waiting on each worker, enough to keep it busy while results are used.
+ITEMS_PER_WORKER: int = 2
+
+
+def start_pool(
+    fn: Callable[[Any], Any], first: object, workers: int, backend: str
+) -> tuple[Executor, Any]:
+    """A pool of workers for the backend, and fn(first) worked out on it.
+
+    The interpreter backend runs each worker in a subinterpreter of this
+    process. If that isn't available, or the first item can't run in one (an
+    extension module that can't be loaded in a subinterpreter, say), a
+    process pool is used instead. Any other error from fn is raised as is.
+    """
+    if backend == "interpreter" and InterpreterPoolExecutor is not None:
+        pool = InterpreterPoolExecutor(workers)
+        try:
+            return pool, pool.submit(fn, first).result()
+        except (
+            BrokenInterpreterPool,
+            NotShareableError,
+            ExecutionFailed,
+            ImportError,
+        ) as error:
+            pool.shutdown(cancel_futures=True)
+            if (
+                isinstance(error, ExecutionFailed)
+                and error.excinfo.type.__name__ not in UNSUPPORTED_ERRORS
+            ):
+                raise
+            warnings.warn(
+                f"subinterpreters failed ({error!r}), using processes instead",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+    pool = ProcessPoolExecutor(workers)
+    try:
+        return pool, pool.submit(fn, first).result()
+    except BaseException:
+        pool.shutdown(cancel_futures=True)
+        raise
+
+
+def ordered_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[object],
+    workers: int = 1,
+    backend: str = "interpreter",
+) -> Iterator[Any]:
+    """fn over items, in order, spread over workers of the given backend.
+
+    Only ITEMS_PER_WORKER items per worker are submitted ahead of the result
+    being used, so however many items there are, memory stays flat. fn and
+    the items are pickled to reach the workers, so fn must be a module-level
+    function; anything random should be seeded from the item, not a worker.
+    """
+    if workers <= 1 or backend == "serial":
+        yield from map(fn, items)
+        return
+    items = iter(items)
+    for first in items:
+        break
+    else:
+        return
+    pool, result = start_pool(fn, first, workers, backend)
+    with pool:
+        pending: deque[Future[Any]] = deque(
+            pool.submit(fn, item) for item in islice(items, workers * ITEMS_PER_WORKER)
+        )
+        yield result
+        for item in items:
+            yield pending.popleft().result()
+            pending.append(pool.submit(fn, item))
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,148 @@
+import sys
+
+ASCII_DIGITS = frozenset("0123456789")
+
+
+def to_int(digits: str) -> int | None:
+    """int() of a run of decimal digits, or None past the digit limit."""
+    if len(digits) > sys.int_info.str_digits_check_threshold:
+        limit = sys.get_int_max_str_digits()
+        if limit and len(digits) > limit:
+            return None
+    return int(digits)
+
+
+def is_grouped_digits(text: str) -> bool:
+    """Decimal digits, optionally split by single underscores as int() allows."""
+    return (
+        text[:1] != "_"
+        and text[-1:] != "_"
+        and "__" not in text
+        and text.replace("_", "").isdecimal()
+    )
+
+
+def skip_space(text: str, i: int) -> int:
+    n = len(text)
+    while i < n and text[i].isspace():
+        i += 1
+    return i
+
+
+def skip_digits(text: str, i: int) -> int:
+    n = len(text)
+    while i < n and text[i].isdecimal():
+        i += 1
+    return i
+
+
+def scan_integer(text: str) -> int | None:
+    """Parse text the way int() does."""
+    if text.isdecimal():
+        return to_int(text)
+    body = text.strip()
+    digits = body[1:] if body[:1] in ("+", "-") else body
+    if not digits.isdecimal():
+        if not is_grouped_digits(digits):
+            return None
+        digits = digits.replace("_", "")
+    value = to_int(digits)
+    if value is None:
+        return None
+    return -value if body[0] == "-" else value
+
+
+def scan_decimal(text: str) -> float | None:
+    """Parse text the way float() does."""
+    if text.replace(".", "", 1).isdecimal():
+        return float(text)
+    body = text.strip()
+    unsigned = body[1:] if body[:1] in ("+", "-") else body
+    if unsigned.isascii() and unsigned.lower() in ("inf", "infinity", "nan"):
+        return float(body)
+    mantissa, e, exponent = unsigned.replace("E", "e").partition("e")
+    if e:
+        exponent = exponent[1:] if exponent[:1] in ("+", "-") else exponent
+        if not is_grouped_digits(exponent):
+            return None
+    whole, _, fraction = mantissa.partition(".")
+    if not (whole or fraction):
+        return None
+    if whole and not is_grouped_digits(whole):
+        return None
+    if fraction and not is_grouped_digits(fraction):
+        return None
+    return float(body)
+
+
+def scan_fraction(text: str) -> tuple[int, int] | None:
+    """Parse 'a / b' at the start of text; anything after it is ignored."""
+    n = len(text)
+    end = 0
+    while end < n and text[end] in ASCII_DIGITS:
+        end += 1
+    if not end:
+        return None
+    i = skip_space(text, end)
+    if i == n or text[i] != "/":
+        return None
+    start = skip_space(text, i + 1)
+    i = start
+    while i < n and text[i] in ASCII_DIGITS:
+        i += 1
+    if i == start:
+        return None
+    num, denom = to_int(text[:end]), to_int(text[start:i])
+    if num is None or denom is None:
+        return None
+    return (num, denom)
+
+
+def scan_remainder(text: str) -> tuple[int, int] | None:
+    """Parse 'q' or 'q r r' at the start of text; the remainder defaults to 0."""
+    end = skip_digits(text, 0)
+    if not end:
+        return None
+    quotient = to_int(text[:end])
+    remainder = 0
+    i = skip_space(text, end)
+    if i < len(text) and text[i] in ("r", "R"):
+        start = skip_space(text, i + 1)
+        i = skip_digits(text, start)
+        if i > start:
+            remainder = to_int(text[start:i])
+    if quotient is None or remainder is None:
+        return None
+    return (quotient, remainder)
+
+
+def scan_gaussian(text: str) -> tuple[int, int] | None:
+    """Parse 'a + bi' (or 'a - b*j' and similar) at the start of text."""
+    n = len(text)
+    i = 0
+    real_sign = ""
+    if i < n and text[i] in ("+", "-"):
+        real_sign = text[i]
+        i += 1
+    start = skip_space(text, i)
+    i = skip_digits(text, start)
+    real = text[start:i]
+    i = skip_space(text, i)
+    if not real or i == n or text[i] not in ("+", "-"):
+        return None
+    imag_sign = text[i]
+    start = skip_space(text, i + 1)
+    i = skip_digits(text, start)
+    imag = text[start:i]
+    i = skip_space(text, i)
+    if i < n and text[i] == "*":
+        i = skip_space(text, i + 1)
+    if not imag or i == n or text[i] not in ("i", "I", "j", "J"):
+        return None
+    real_part, imag_part = to_int(real), to_int(imag)
+    if real_part is None or imag_part is None:
+        return None
+    return (
+        -real_part if real_sign == "-" else real_part,
+        -imag_part if imag_sign == "-" else imag_part,
+    )
@@ -0,0 +1,111 @@
+import json
+import os
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+
+from mentalmath.config import CONFIG
+
+# Questions in a quiz started with --ops and no -n.
+DEFAULT_QUESTIONS: int = 20
+# Operations built around the number picked on the special screen.
+NUMBERED_OPERATIONS: frozenset[str] = frozenset({"times_tables", "powers"})
+
+
+def parse_operations(text: str) -> dict[str, int]:
+    """Read 'multiplication=99,division=999' into operation maximums."""
+    op_maxes = {}
+    for part in text.split(","):
+        name, _, top = part.strip().partition("=")
+        if name not in CONFIG.OPERATIONS:
+            raise ValueError(f"no operation called {name!r}")
+        if not top.strip().isdecimal() or int(top) < 1:
+            raise ValueError(f"{name} needs a maximum of at least 1, like {name}=99")
+        op_maxes[name] = int(top)
+    return op_maxes
+
+
+@dataclass
+class QuizSettings:
+    """What the menus would have asked for, to start a quiz without them."""
+
+    op_maxes: dict[str, int]
+    number_of_questions: int
+    timer: float | None = None
+    vanish: float | None = None
+    auto_submit: bool = False
+    review: bool = False
+    special: int | None = None
+
+    def check(self) -> None:
+        """Raise ValueError if a quiz couldn't start with these settings."""
+        if not self.op_maxes:
+            raise ValueError("no operations given")
+        for name, top in self.op_maxes.items():
+            # A membership test finds built-in operations without scanning
+            # entry points for plugins.
+            if name not in CONFIG.OPERATIONS:
+                raise ValueError(f"no operation called {name!r}")
+            if not isinstance(top, int) or top < 1:
+                raise ValueError(f"{name} needs a maximum of at least 1")
+        if self.number_of_questions < 1:
+            raise ValueError("a quiz needs at least 1 question")
+        for name, seconds in (("timer", self.timer), ("vanish", self.vanish)):
+            if seconds is not None and seconds <= 0:
+                raise ValueError(f"the {name} needs a positive number of seconds")
+        if self.special is None and NUMBERED_OPERATIONS & self.op_maxes.keys():
+            raise ValueError("times_tables and powers need --special, like --special 7")
+
+    def updated(self, **changes: object) -> QuizSettings:
+        """A copy with the changes that aren't None."""
+        return replace(self, **{k: v for k, v in changes.items() if v is not None})
+
+
+def presets_path() -> Path:
+    """$MMATH_PRESETS, or presets.json in the user's config directory."""
+    if path := os.environ.get("MMATH_PRESETS"):
+        return Path(path)
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config_home) / "mentalmath" / "presets.json"
+
+
+def load_presets(path: Path | None = None) -> dict[str, QuizSettings]:
+    """Every saved preset by name, or none if nothing has been saved yet."""
+    path = presets_path() if path is None else path
+    try:
+        with open(path) as file:
+            saved = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{path} isn't valid JSON: {error}") from None
+    names = {field.name for field in fields(QuizSettings)}
+    try:
+        presets = {
+            name: QuizSettings(**{k: v for k, v in settings.items() if k in names})
+            for name, settings in saved.items()
+        }
+        for settings in presets.values():
+            settings.check()
+    except (AttributeError, TypeError, ValueError) as error:
+        raise ValueError(f"{path} doesn't hold valid presets: {error}") from None
+    return presets
+
+
+def load_preset(name: str, path: Path | None = None) -> QuizSettings:
+    presets = load_presets(path)
+    if name not in presets:
+        known = ", ".join(sorted(presets)) or "none saved yet"
+        raise ValueError(f"no preset called {name!r} ({known})")
+    return presets[name]
+
+
+def save_preset(name: str, settings: QuizSettings, path: Path | None = None) -> None:
+    """Save settings under name, replacing any preset already called that."""
+    path = presets_path() if path is None else path
+    presets = {key: asdict(value) for key, value in load_presets(path).items()}
+    presets[name] = asdict(settings)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    with open(temporary, "w") as file:
+        json.dump(presets, file, indent=2)
+    temporary.replace(path)
@@ -0,0 +1,83 @@
+import random
+from collections.abc import Iterable, Mapping, Sequence
+
+
+class AliasTable:
+    """Draws index i with probability weights[i] / sum(weights) in O(1).
+
+    This is Vose's alias method: every slot holds its own index with some
+    probability and an alias otherwise, so a draw is one random number, one
+    slot and one comparison however many weights there are. Building the
+    table is O(n).
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        if any(weight < 0 for weight in weights):
+            raise ValueError("weights can't be negative")
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("at least one weight must be positive")
+        n = len(weights)
+        scaled = [weight * n / total for weight in weights]
+        self.probabilities = [1.0] * n
+        self.aliases = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            less, more = small.pop(), large[-1]
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1 - scaled[less]
+            if scaled[more] < 1:
+                small.append(large.pop())
+        # Whatever is left is 1 up to rounding error and keeps its own index.
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    def sample(self, rng: random.Random) -> int:
+        position = rng.random() * len(self.probabilities)
+        slot = int(position)
+        if position - slot < self.probabilities[slot]:
+            return slot
+        return self.aliases[slot]
+
+
+class OperationMix:
+    """Weighted choice between a session's operations.
+
+    Weights are relative and default to 1, which is the uniform mix. Changing
+    a weight only marks the alias table stale; it is rebuilt on the next
+    choice, so several changes in a row cost one rebuild.
+    """
+
+    def __init__(
+        self, operations: Iterable[str], weights: Mapping[str, float] | None = None
+    ) -> None:
+        self.operations = list(operations)
+        self.positions = {name: i for i, name in enumerate(self.operations)}
+        self.weights = [1.0] * len(self.operations)
+        self.table: AliasTable | None = None
+        if weights:
+            self.update(weights)
+
+    def update(self, weights: Mapping[str, float]) -> None:
+        """Set the weights of the named operations, leaving the rest alone."""
+        updated = self.weights.copy()
+        for name, weight in weights.items():
+            if weight < 0:
+                raise ValueError(f"{name} can't have a negative weight")
+            updated[self.positions[name]] = float(weight)
+        if not any(updated):
+            raise ValueError("at least one weight must be positive")
+        self.weights = updated
+        self.table = None
+
+    def share(self, name: str) -> float:
+        """The fraction of questions expected to be name."""
+        return self.weights[self.positions[name]] / sum(self.weights)
+
+    def choose(self, rng: random.Random) -> str:
+        if self.table is None:
+            self.table = AliasTable(self.weights)
+        return self.operations[self.table.sample(rng)]
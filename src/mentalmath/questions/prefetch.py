@@ -0,0 +1,90 @@
+import random
+import threading
+from collections import deque
+
+from mentalmath.config import CONFIG
+from mentalmath.operations import QuestionInfo
+from mentalmath.questions.mix import OperationMix
+
+PREFETCH_SIZE: int = 8
+
+
+class QuestionPrefetcher:
+    """Bounded queue of ready-made questions for one quiz session.
+
+    A worker thread runs fill() to keep the queue topped up, so answering a
+    question only has to take the next one off the queue. The session owns
+    its RNG, and generating and queueing happen under one lock, so questions
+    come out in the order they were drawn whether the worker or a cache miss
+    on the UI thread made them: a seeded session asks the same questions
+    however the threads interleave. Operations are drawn from an
+    OperationMix, uniform unless weights are given.
+    """
+
+    def __init__(
+        self,
+        op_maxes: dict[str, int],
+        special: int | None = None,
+        size: int = PREFETCH_SIZE,
+        rng: random.Random | None = None,
+        weights: dict[str, float] | None = None,
+    ) -> None:
+        self.op_maxes = op_maxes
+        self.mix = OperationMix(op_maxes, weights)
+        self.special = special
+        self.rng = random.Random() if rng is None else rng
+        self.size = size
+        self.ready: deque[QuestionInfo] = deque()
+        self.lock = threading.Lock()
+        self.space = threading.Condition(self.lock)
+        self.stopped = False
+
+    @property
+    def full(self) -> bool:
+        return len(self.ready) >= self.size
+
+    def generate(self) -> QuestionInfo:
+        """Draw the next question. The caller holds the lock."""
+        operation = self.mix.choose(self.rng)
+        cls = CONFIG.OPERATIONS[operation]
+        question = cls(rng=self.rng, num=self.special)
+        question.new(self.op_maxes[operation])
+        return question
+
+    def fill(self) -> None:
+        """Generate questions until stopped, waiting while the queue is full."""
+        while True:
+            # Take the lock for one question at a time, so get() never waits
+            # for more than the question being drawn.
+            with self.space:
+                while self.full and not self.stopped:
+                    self.space.wait()
+                if self.stopped:
+                    return
+                self.ready.append(self.generate())
+
+    def get(self) -> QuestionInfo:
+        with self.space:
+            self.space.notify()
+            if self.ready:
+                return self.ready.popleft()
+            return self.generate()
+
+    def set_weights(self, weights: dict[str, float]) -> None:
+        """Change the mix, dropping questions drawn from the old one."""
+        with self.space:
+            self.mix.update(weights)
+            self.ready.clear()
+            self.space.notify()
+
+    def reseed(self, rng: random.Random) -> None:
+        """Draw from rng from now on, dropping questions drawn before."""
+        with self.space:
+            self.rng = rng
+            self.ready.clear()
+            self.space.notify()
+
+    def stop(self) -> None:
+        with self.space:
+            self.stopped = True
+            self.space.notify()
@@ -3,7 +3,6 @@ from typing import TYPE_CHECKING, ClassVar
 from textual.screen import Screen
 from textual.widgets import Footer
 
-from mentalmath.data.data_screen import EndScreen
 from mentalmath.questions.question_widgets import QuestionUI
 
 if TYPE_CHECKING:
@@ -22,9 +21,12 @@ class QuestionScreen(Screen):
         self,
         question_maxes: dict[str, int],
         number_of_questions: int,
-        timer: str | None,
-        vanish: str | None = None,
+        timer: str | float | None,
+        vanish: str | float | None = None,
         special: int | None = None,
+        auto_submit: bool = False,
+        weights: dict[str, float] | None = None,
+        review: bool = False,
     ) -> None:
         super().__init__()
         self.question_maxes = question_maxes
@@ -32,6 +34,9 @@ class QuestionScreen(Screen):
         self.timer = timer
         self.vanish = vanish
         self.special = special
+        self.auto_submit = auto_submit
+        self.weights = weights
+        self.review = review
 
     CSS_PATH = "../styles/questionui.tcss"
 
@@ -42,18 +47,27 @@ class QuestionScreen(Screen):
             self.timer,
             vanish=self.vanish,
             special=self.special,
+            auto_submit=self.auto_submit,
+            history=self.app.history,
+            weights=self.weights,
+            review=self.review,
+            seed=self.app.session_seed(),
         )
         yield self.qui
         yield Footer()
 
     async def on_question_ui_finished(self) -> None:
+        from mentalmath.data.data_screen import EndScreen
+
         selected = await self.app.push_screen_wait(
-            EndScreen(self.qui.answer_data, bool(self.qui.question_timer))
+            EndScreen(
+                self.qui.answer_data,
+                bool(self.qui.question_timer),
+                seed=self.qui.session.seed,
+            )
         )
         if selected == "yes_repeat":
-            self.qui.question_number.current = 0
-            self.qui.new_question()
-            self.qui.update_timer.resume()
+            self.qui.restart()
         else:
             self.app.pop_screen()
 
@@ -1,8 +1,7 @@
-import random
 import time
 from typing import TYPE_CHECKING
 
-from textual import on
+from textual import on, work
 from textual.containers import Center
 from textual.message import Message
 from textual.reactive import reactive
@@ -12,10 +11,13 @@ from textual.widgets import Button, Digits, Input, ProgressBar, Static
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
+    from mentalmath.data.history import HistoryStore
 
-from mentalmath.config import CONFIG
-from mentalmath.operations import AnswerData
+
+from mentalmath.questions.scheduler import FactScheduler
+from mentalmath.questions.session import QuizSession
 
 
 class QuestionNumber(Widget):
@@ -78,113 +80,183 @@ def in_bounds(test: float, bounds: tuple[float, float]) -> bool:
     return test >= lower and test <= upper
 
 
+# The bar is 32 cells wide and draws half cells, so finer updates are invisible.
+PROGRESS_STEPS: int = 64
+FLASH_DURATION: float = 0.15
+
+
 class QuestionUI(Widget):
-    timer = reactive(0.0)
-    start_time = reactive(time.monotonic)
-    time_at_last_err = reactive(time.monotonic)
-    time_since_last_err = reactive(0.0)
+    timer = reactive(0.0, repaint=False)
 
     def __init__(
         self,
         op_maxes: dict[str, int],
         number_of_questions: int,
-        timer: str | None,
-        vanish: str | None = None,
+        timer: str | float | None,
+        vanish: str | float | None = None,
         special: int | None = None,
+        auto_submit: bool = False,
+        history: HistoryStore | None = None,
+        weights: dict[str, float] | None = None,
+        review: bool = False,
+        seed: int | None = None,
     ) -> None:
         super().__init__()
         self.op_maxes = op_maxes
         self.number_of_questions = number_of_questions
         self.question_timer = float(timer) if timer else None
         self.vanish = float(vanish) if vanish else None
-        self.answer_data: dict[int, AnswerData] = {}
         self.special = special
+        self.auto_submit = auto_submit
+        self.session = QuizSession(
+            op_maxes,
+            number_of_questions,
+            self.question_timer,
+            special,
+            history=history,
+            weights=weights,
+            scheduler=FactScheduler(op_maxes, special, history) if review else None,
+            seed=seed,
+        )
+        self.answer_data = self.session.answer_data
+        self.timeout_timer: Timer | None = None
+        self.progress_timer: Timer | None = None
+        self.vanish_timer: Timer | None = None
+        self.flash_timer: Timer | None = None
+        self.shown_text = ""
+        self.bar_state = ""
         self.add_class("question-ui")
 
     def compose(self) -> ComposeResult:
         self.question_number = QuestionNumber()
         self.question_display = QuestionDisplay()
         self.answer_box = AnswerBox()
+        self.progress_bar = ProgressBar(
+            total=self.question_timer,
+            show_eta=False,
+            show_percentage=False,
+        )
         yield self.question_number
         yield Center(self.question_display)
-        with Center():
-            yield ProgressBar(
-                total=self.question_timer,
-                show_eta=False,
-                show_percentage=False,
-            )
+        yield Center(self.progress_bar)
         yield self.answer_box
 
     def on_mount(self) -> None:
         if not self.question_timer:
-            self.query_one(ProgressBar).visible = False
+            self.progress_bar.visible = False
+        self.run_worker(self.session.prefetch.fill, thread=True, group="prefetch")
+        if self.session.scheduler is not None:
+            self.load_facts()
         self.new_question()
-        self.update_timer = self.set_interval(1 / 100, self.update_time)
+
+    @work(thread=True, group="facts", exit_on_error=False)
+    def load_facts(self) -> None:
+        """Read saved facts on a worker; fresh questions are asked meanwhile."""
+        scheduler = self.session.scheduler
+        saved = scheduler.saved_facts()
+        self.app.call_from_thread(scheduler.add, saved)
 
     def update_time(self) -> None:
         """Method to update time to current."""
-        self.timer = time.monotonic() - self.start_time
-        self.time_since_last_err = time.monotonic() - self.time_at_last_err
+        self.timer = self.session.elapsed(time.monotonic())
 
     def reset_timer(self) -> None:
-        """Method to update time to current."""
+        """Restart the deadlines for the new question."""
+        self.stop_timers()
         self.timer = 0.0
-        self.start_time = time.monotonic()
-        self.time_since_last_err = 0.0
-        self.time_at_last_err = time.monotonic()
+        if self.question_timer:
+            self.timeout_timer = self.set_timer(self.question_timer, self.out_of_time)
+            self.progress_timer = self.set_interval(
+                self.question_timer / PROGRESS_STEPS, self.update_time
+            )
+        self.reset_vanish()
+
+    def reset_vanish(self) -> None:
+        """Show the question and hide it again once the vanish time is up."""
+        if not self.vanish:
+            return
+        if self.vanish_timer:
+            self.vanish_timer.stop()
+        self.show_text(self.question.display)
+        self.vanish_timer = self.set_timer(self.vanish, self.hide_question)
+
+    def hide_question(self) -> None:
+        self.show_text("")
+
+    def show_text(self, text: str) -> None:
+        """Update the question display only when its text changes."""
+        if text != self.shown_text:
+            self.shown_text = text
+            self.question_display.update(text)
+
+    def set_bar_state(self, state: str) -> None:
+        """Swap the progress bar's colour class only when it changes."""
+        if state != self.bar_state:
+            if self.bar_state:
+                self.progress_bar.remove_class(self.bar_state)
+            self.progress_bar.add_class(state)
+            self.bar_state = state
+
+    def stop_timers(self) -> None:
+        for timer in (self.timeout_timer, self.progress_timer, self.vanish_timer):
+            if timer:
+                timer.stop()
+        self.timeout_timer = self.progress_timer = self.vanish_timer = None
 
     def watch_timer(self, time: float) -> None:
-        """If the user set a timer, move to the next question when time is up."""
-        bar = self.query_one(ProgressBar)
-        bar.update(progress=time)
+        """Show how much of the question's time has been used."""
+        self.progress_bar.update(progress=time)
         if self.question_timer:
             if time < 0.75 * self.question_timer:
-                bar.remove_class("ending")
-                bar.add_class("normal")
-            elif time < self.question_timer:
-                bar.remove_class("normal")
-                bar.add_class("ending")
-            elif time > self.question_timer:
-                bar.remove_class(*["normal", "ending"])
-                self.out_of_time()
-        if self.vanish:
-            if self.time_since_last_err > self.vanish:
-                self.question_display.update("")
+                self.set_bar_state("normal")
             else:
-                self.question_display.update(self.question.display)
+                self.set_bar_state("ending")
+
+    def on_unmount(self) -> None:
+        self.stop_timers()
+        self.session.prefetch.stop()
 
     def new_question_data(self) -> None:
-        operation = random.choice(list(self.op_maxes.keys()))
-        top = self.op_maxes[operation]
-        cls = CONFIG.ALLOPERATIONS[operation]
-        self.question = cls(num=self.special)
-        self.question.new(top)
+        self.question = self.session.next_question(time.monotonic())
         self.answer_box.answer_box.restrict = self.question.input_restrictions
         self.answer_box.answer_box.type = self.question.textual_input_type
 
     class Finished(Message): ...
 
     def check_finished(self) -> bool:
-        if self.question_number.current == self.number_of_questions:
+        if self.session.finished:
             self.post_message(self.Finished())
-            self.update_timer.pause()
+            self.stop_timers()
             return True
         return False
 
     def new_question(self) -> None:
         if self.check_finished():
             return
-        self.question_number.next()
-        self.n_err = 0
         self.new_question_data()
-        self.question_display.update(self.question.display)
+        self.question_number.current = self.session.question_number
+        self.show_text(self.question.display)
         self.reset_timer()
 
-    def flash_class(
-        self, widget: Widget, class_name: str, duration: float = 0.15
-    ) -> None:
-        widget.add_class(class_name)
-        self.set_timer(duration, lambda: widget.remove_class(class_name))
+    def restart(self) -> None:
+        self.session.restart(self.app.session_seed())
+        self.new_question()
+
+    def flash(self, class_name: str) -> None:
+        """Flash the quiz as correct or incorrect, replacing any flash in progress.
+
+        The stylesheet colours the input, question and number through their
+        QuestionUI ancestor, so one class change restyles them all together.
+        """
+        if self.flash_timer:
+            self.flash_timer.stop()
+        self.remove_class("correct", "incorrect", update=False)
+        self.add_class(class_name)
+        self.flash_timer = self.set_timer(FLASH_DURATION, self.clear_flash)
+
+    def clear_flash(self) -> None:
+        self.remove_class("correct", "incorrect")
+        self.flash_timer = None
 
     @on(Input.Submitted)
     @on(Button.Pressed)
@@ -193,46 +265,23 @@ class QuestionUI(Widget):
         if not submission:
             self.answer_box.answer_box.clear()
             return
-        if self.question.verify_correct(submission):
-            self.flash_class(self.answer_box.answer_box, "correct")
-            self.flash_class(self.question_display, "correct")
-            self.flash_class(self.question_number, "correct")
-            self.flash_class(self, "correct")
+        if self.session.submit(submission, time.monotonic()):
+            self.flash("correct")
             self.answer_box.answer_box.clear()
-            qdata = self.question
-            answerdata = AnswerData(
-                qdata.symbol,
-                qdata.left,
-                qdata.right,
-                self.timer,
-                self.n_err,
-                out_of_time=False,
-            )
-            self.answer_data[self.question_number.current] = answerdata
             self.new_question()
         else:
             self.answer_box.answer_box.clear()
-            self.time_at_last_err = time.monotonic()
-            self.flash_class(self.answer_box.answer_box, "incorrect")
-            self.flash_class(self.question_display, "incorrect")
-            self.flash_class(self.question_number, "incorrect")
-            self.flash_class(self, "incorrect")
-            self.n_err += 1
+            self.flash("incorrect")
+            self.reset_vanish()
+
+    @on(Input.Changed)
+    def check_as_typed(self, event: Input.Changed) -> None:
+        """In auto submit mode, move on as soon as the answer is right."""
+        if self.auto_submit and self.question.verify_correct(event.value):
+            self.check_submission()
 
     def out_of_time(self) -> None:
         self.answer_box.answer_box.clear()
-        self.flash_class(self.answer_box.answer_box, "incorrect")
-        self.flash_class(self.question_display, "incorrect")
-        self.flash_class(self.question_number, "incorrect")
-        self.flash_class(self, "incorrect")
-        qdata = self.question
-        answerdata = AnswerData(
-            qdata.symbol,
-            qdata.left,
-            qdata.right,
-            min(self.timer, self.question_timer),
-            self.n_err,
-            out_of_time=True,
-        )
-        self.answer_data[self.question_number.current] = answerdata
+        self.flash("incorrect")
+        self.session.timeout(time.monotonic())
         self.new_question()
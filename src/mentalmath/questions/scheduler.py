@@ -0,0 +1,174 @@
+import heapq
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import count
+from typing import TYPE_CHECKING
+
+from mentalmath.config import CONFIG
+from mentalmath.operations import QuestionInfo
+
+if TYPE_CHECKING:
+    from mentalmath.data.history import HistoryStore
+
+# Seconds before a missed fact comes back, short enough to see it again soon.
+RELEARN_INTERVAL: float = 30.0
+# Seconds before a fact answered right for the first time comes back.
+FIRST_INTERVAL: float = 600.0
+STARTING_EASE: float = 2.5
+MIN_EASE: float = 1.3
+MAX_EASE: float = 3.0
+# Right answers faster than FAST_ANSWER seconds make a fact easier, and ones
+# slower than SLOW_ANSWER make it harder.
+FAST_ANSWER: float = 3.0
+SLOW_ANSWER: float = 8.0
+# Stale heap entries allowed per tracked fact before the heap is rebuilt.
+STALE_ENTRIES: int = 2
+
+FactKey = tuple[str, object, object]
+
+
+@dataclass(slots=True)
+class Fact:
+    """When a fact is next due, and how its reviews have gone so far."""
+
+    due: float
+    interval: float = 0.0
+    ease: float = STARTING_EASE
+    reviews: int = 0
+    lapses: int = 0
+
+    def review(
+        self, time: float, number_of_errors: int, out_of_time: bool, now: float
+    ) -> None:
+        """Reschedule after an answer, in the manner of SM-2.
+
+        A miss brings the fact back after RELEARN_INTERVAL and makes it
+        harder; a right answer multiplies the interval by the ease, which
+        rises for fast answers and falls for slow ones.
+        """
+        if number_of_errors or out_of_time:
+            self.lapses += 1
+            self.ease = max(MIN_EASE, self.ease - 0.2)
+            self.interval = RELEARN_INTERVAL
+        else:
+            self.reviews += 1
+            if time <= FAST_ANSWER:
+                self.ease = min(MAX_EASE, self.ease + 0.1)
+            elif time > SLOW_ANSWER:
+                self.ease = max(MIN_EASE, self.ease - 0.15)
+            if self.interval < FIRST_INTERVAL:
+                self.interval = FIRST_INTERVAL
+            else:
+                self.interval *= self.ease
+        self.due = now + self.interval
+
+
+class FactScheduler:
+    """Brings back individual facts, such as 7 × 8 or 17², when they are due.
+
+    Every answer to a repeatable operation (see QuestionInfo.ask) reschedules
+    its fact. Due times go in a heap, so the next due fact is found in
+    O(log n) however many facts are tracked. Rescheduling pushes a new entry
+    and leaves the old one to be skipped when it surfaces. With a
+    history store, facts are saved after every answer and can be loaded back
+    with load(), so they carry over between sessions. Only facts that fit
+    the session's maximums are loaded.
+    """
+
+    def __init__(
+        self,
+        op_maxes: dict[str, int],
+        special: int | None = None,
+        history: HistoryStore | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.op_maxes = op_maxes
+        self.special = special
+        self.history = history
+        self.clock = clock
+        self.operations = {
+            name: CONFIG.OPERATIONS[name]
+            for name in op_maxes
+            if CONFIG.OPERATIONS[name].repeatable
+        }
+        self.names = {cls: name for name, cls in self.operations.items()}
+        self.facts: dict[FactKey, Fact] = {}
+        self.heap: list[tuple[float, int, FactKey]] = []
+        self.order = count()
+
+    def load(self) -> None:
+        """Load the saved facts now, on this thread."""
+        self.add(self.saved_facts())
+
+    def saved_facts(self) -> list[tuple[FactKey, Fact]]:
+        """The history's facts that fit the session's maximums.
+
+        Only reads, so it can run on a worker thread while questions are
+        asked; hand what it returns to add() on the thread asking them.
+        """
+        if self.history is None or not self.operations:
+            return []
+        probes = {name: cls(num=self.special) for name, cls in self.operations.items()}
+        saved = []
+        for operation, left, right, *state in self.history.load_facts(self.operations):
+            if probes[operation].could_ask(left, right, self.op_maxes[operation]):
+                saved.append(((operation, left, right), Fact(*state)))
+        return saved
+
+    def add(self, saved: list[tuple[FactKey, Fact]]) -> None:
+        """Track saved facts, keeping any answered since they were read."""
+        for key, fact in saved:
+            if key not in self.facts:
+                self.facts[key] = fact
+                self.heap.append((fact.due, next(self.order), key))
+        heapq.heapify(self.heap)
+
+    def next_due(self) -> QuestionInfo | None:
+        """The question for the most overdue fact, or None if nothing is due.
+
+        The fact stays in the heap until review() reschedules it, so a
+        question that is never answered is asked again next time.
+        """
+        heap = self.heap
+        now = self.clock()
+        while heap and heap[0][0] <= now:
+            due, _, key = heap[0]
+            if self.facts[key].due != due:
+                heapq.heappop(heap)
+                continue
+            operation, left, right = key
+            question = self.operations[operation](num=self.special)
+            question.ask(left, right)
+            return question
+        return None
+
+    def review(
+        self,
+        question: QuestionInfo,
+        time: float,
+        number_of_errors: int,
+        out_of_time: bool,
+    ) -> None:
+        """Reschedule the question's fact after it has been answered."""
+        operation = self.names.get(type(question))
+        if operation is None:
+            return
+        key = (operation, question.left, question.right)
+        now = self.clock()
+        fact = self.facts.get(key)
+        if fact is None:
+            fact = self.facts[key] = Fact(now)
+        fact.review(time, number_of_errors, out_of_time, now)
+        heapq.heappush(self.heap, (fact.due, next(self.order), key))
+        if len(self.heap) > STALE_ENTRIES * len(self.facts) + 64:
+            self.compact()
+        if self.history is not None:
+            self.history.save_fact(operation, question.left, question.right, fact)
+
+    def compact(self) -> None:
+        """Rebuild the heap with one entry per fact."""
+        self.heap = [
+            (fact.due, next(self.order), key) for key, fact in self.facts.items()
+        ]
+        heapq.heapify(self.heap)
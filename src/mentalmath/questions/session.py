@@ -0,0 +1,117 @@
+from typing import TYPE_CHECKING
+
+from mentalmath.data.session_log import SessionLog
+from mentalmath.operations import QuestionInfo
+from mentalmath.questions.prefetch import QuestionPrefetcher
+from mentalmath.seeding import new_seed, stream
+
+if TYPE_CHECKING:
+    from mentalmath.data.history import HistoryStore
+    from mentalmath.questions.scheduler import FactScheduler
+
+
+class QuizSession:
+    """The quiz loop without any widgets.
+
+    Times are passed in by the caller (time.monotonic() in the app), so a
+    session can be driven by a script as fast as questions can be checked.
+    With a history store, every run through the questions is saved as its
+    own session there. With a fact scheduler, due facts are asked before
+    fresh questions and every answer reschedules its fact.
+
+    Questions come from an RNG stream derived from seed, so the same seed and
+    settings give the same quiz. Without a seed a new one is drawn.
+    """
+
+    def __init__(
+        self,
+        op_maxes: dict[str, int],
+        number_of_questions: int,
+        question_timer: float | None = None,
+        special: int | None = None,
+        prefetch: QuestionPrefetcher | None = None,
+        history: HistoryStore | None = None,
+        weights: dict[str, float] | None = None,
+        scheduler: FactScheduler | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.op_maxes = op_maxes
+        self.number_of_questions = number_of_questions
+        self.question_timer = question_timer
+        self.seed = new_seed() if seed is None else seed
+        self.prefetch = (
+            QuestionPrefetcher(
+                op_maxes, special, rng=stream(self.seed, "questions"), weights=weights
+            )
+            if prefetch is None
+            else prefetch
+        )
+        self.question: QuestionInfo | None = None
+        self.question_number = 0
+        self.n_err = 0
+        self.start_time = 0.0
+        self.time_at_last_err = 0.0
+        self.answer_data = SessionLog()
+        self.history = history
+        self.session_id: str | None = None
+        self.scheduler = scheduler
+
+    @property
+    def finished(self) -> bool:
+        return self.question_number == self.number_of_questions
+
+    def elapsed(self, t: float) -> float:
+        return t - self.start_time
+
+    def next_question(self, t: float) -> QuestionInfo | None:
+        """Move to the next question, or return None once the quiz is over."""
+        if self.finished:
+            return None
+        if self.history is not None and self.question_number == 0:
+            self.session_id = self.history.new_session(
+                self.op_maxes, self.number_of_questions, self.question_timer
+            )
+        self.question_number += 1
+        self.n_err = 0
+        question = None if self.scheduler is None else self.scheduler.next_due()
+        self.question = self.prefetch.get() if question is None else question
+        self.start_time = t
+        self.time_at_last_err = t
+        return self.question
+
+    def submit(self, answer: str, t: float) -> bool:
+        """Check an answer, recording it if correct and counting it if not."""
+        if self.question.verify_correct(answer):
+            self.record(self.elapsed(t), out_of_time=False)
+            return True
+        self.n_err += 1
+        self.time_at_last_err = t
+        return False
+
+    def timeout(self, t: float) -> None:
+        self.record(min(self.elapsed(t), self.question_timer), out_of_time=True)
+
+    def record(self, time: float, out_of_time: bool) -> None:
+        qdata = self.question
+        answer = self.answer_data.append(
+            qdata.symbol, qdata.left, qdata.right, time, self.n_err, out_of_time
+        )
+        if self.history is not None:
+            self.history.append(self.session_id, self.question_number, answer)
+        if self.scheduler is not None:
+            self.scheduler.review(qdata, time, self.n_err, out_of_time)
+
+    def set_weights(self, weights: dict[str, float]) -> None:
+        """Reweight the operations from the next question on."""
+        self.prefetch.set_weights(weights)
+
+    def restart(self, seed: int | None = None) -> None:
+        """Start over with questions from seed, or from a new seed if None.
+
+        The questions already drawn from the old seed are dropped, so the
+        new run is the quiz that seed gives from the start.
+        """
+        self.seed = new_seed() if seed is None else seed
+        self.prefetch.reseed(stream(self.seed, "questions"))
+        self.question_number = 0
+        self.answer_data.clear()
@@ -0,0 +1,104 @@
+import importlib
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mentalmath.operations import QuestionInfo
+
+ENTRY_POINT_GROUP: str = "mentalmath.operations"
+
+
+@cache
+def load_generator(path: str) -> type[QuestionInfo]:
+    """Import a generator class from a 'package.module:Class' path."""
+    module, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module), attribute)
+
+
+@dataclass(frozen=True)
+class OperationSpec:
+    """What the menus need to know about an operation, without importing it.
+
+    Special operations get their own button on the special screen instead of
+    a place in the main menu. Everything else about an operation, such as
+    its input type, is read from the generator class once it is imported.
+    """
+
+    name: str
+    generator: str
+    special: bool = False
+
+    def load(self) -> type[QuestionInfo]:
+        return load_generator(self.generator)
+
+
+class OperationRegistry(Mapping[str, "type[QuestionInfo]"]):
+    """Operation generator classes by name, each imported on first lookup.
+
+    Other packages add operations with an entry point in the
+    "mentalmath.operations" group, named after the operation and pointing at
+    its QuestionInfo subclass; an entry point with the extra [special] goes
+    on the special screen. Entry points are only scanned by discover(),
+    which runs the first time a name is missing or the whole registry is
+    iterated, so startup never pays for plugins it doesn't show.
+    """
+
+    def __init__(
+        self, specs: Iterable[OperationSpec], group: str = ENTRY_POINT_GROUP
+    ) -> None:
+        self.specs = {spec.name: spec for spec in specs}
+        self.group = group
+        self.discovered = False
+        self.lock = threading.Lock()
+
+    def register(self, spec: OperationSpec) -> None:
+        # Replace the dict rather than mutate it, so readers on other threads
+        # always see a complete one.
+        self.specs = {**self.specs, spec.name: spec}
+
+    def discover(self) -> list[OperationSpec]:
+        """Register operations from entry points, once, returning the new ones."""
+        with self.lock:
+            if self.discovered:
+                return []
+            self.discovered = True
+            from importlib.metadata import entry_points
+
+            found = [
+                OperationSpec(
+                    entry_point.name,
+                    f"{entry_point.module}:{entry_point.attr}",
+                    special="special" in entry_point.extras,
+                )
+                for entry_point in entry_points(group=self.group)
+                if entry_point.name not in self.specs
+            ]
+            for spec in found:
+                self.register(spec)
+            return found
+
+    def menu_names(self) -> list[str]:
+        return [name for name, spec in self.specs.items() if not spec.special]
+
+    def special_names(self) -> list[str]:
+        return [name for name, spec in self.specs.items() if spec.special]
+
+    def __getitem__(self, name: str) -> type[QuestionInfo]:
+        spec = self.specs.get(name)
+        if spec is None:
+            self.discover()
+            spec = self.specs.get(name)
+            if spec is None:
+                raise KeyError(name)
+        return spec.load()
+
+    def __iter__(self) -> Iterator[str]:
+        self.discover()
+        return iter(self.specs)
+
+    def __len__(self) -> int:
+        self.discover()
+        return len(self.specs)
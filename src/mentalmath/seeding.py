@@ -0,0 +1,26 @@
+import hashlib
+import random
+import secrets
+
+SEED_BITS: int = 64
+
+
+def new_seed() -> int:
+    """A fresh root seed for a session that wasn't given one."""
+    return secrets.randbits(SEED_BITS)
+
+
+def derive_seed(root: int, *path: object) -> int:
+    """The seed of the stream named by path under root.
+
+    Streams are found by hashing, not by drawing from a parent generator, so
+    every stream can be made on its own, in any order or process, and two
+    different paths give unrelated streams.
+    """
+    key = repr((root, *path)).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=SEED_BITS // 8).digest())
+
+
+def stream(root: int, *path: object) -> random.Random:
+    """A generator of its own for the stream named by path under root."""
+    return random.Random(derive_seed(root, *path))
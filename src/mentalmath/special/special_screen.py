@@ -27,8 +27,15 @@ class SelectSpecialScreen(Screen):
     BINDINGS: ClassVar[list[BindingType]] = [("escape", "go_back", "Back")]
 
     def compose(self) -> ComposeResult:
+        CONFIG.OPERATIONS.discover()
+        specials = CONFIG.OPERATIONS.special_names()
+        self.plain_specials = {
+            f"{special}_button"
+            for special in specials
+            if special not in ("times_tables", "powers")
+        }
         with Grid(id="special_grid"):
-            for special in list(CONFIG.SPECIAL.keys()):
+            for special in [*specials, "default"]:
                 title = convert_snake_case(special)
                 yield Button(
                     title,
@@ -50,14 +57,14 @@ class SelectSpecialScreen(Screen):
                 NumberOfQuestionsScreen()
             )
             self.app.push_screen(QuestionScreen(default, num_q, timer, vanish=vanish))
-        if event.button.id == "calendar_button":
+        elif event.button.id in self.plain_specials:
+            # Calendar and plugin specials only need a number of questions.
             num_q, timer, vanish = await self.app.push_screen_wait(
                 NumberOfQuestionsScreen()
             )
+            name = event.button.id.removesuffix("_button")
             self.app.push_screen(
-                QuestionScreen(
-                    {"calendar": 1}, num_q, timer, vanish=vanish, special=None
-                )
+                QuestionScreen({name: 1}, num_q, timer, vanish=vanish, special=None)
             )
         elif "back_button" in event.button.classes:
             self.app.pop_screen()
@@ -0,0 +1,136 @@
+import os
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from dataclasses import dataclass
+
+STARTUP_MODULE: str = "mentalmath.main"
+SLOWEST_MODULES: int = 15
+# Milliseconds a cold start may take to the main menu or a first question.
+STARTUP_BUDGET_MS: float = 1000.0
+# Modules importing the app must not pull in; each is loaded when first used.
+DEFERRED_MODULES: tuple[str, ...] = (
+    "importlib.metadata",
+    "sqlite3",
+    "mentalmath.data.data_screen",
+    "mentalmath.help_screen",
+    "mentalmath.menus.maxes_screen",
+    "mentalmath.questions.question_screen",
+    "mentalmath.special.special_screen",
+)
+
+# Run in a fresh interpreter: import the app, then run it headless until the
+# main menu has been painted, printing both times in seconds.
+READY_SCRIPT = f"""
+import time
+
+start = time.perf_counter()
+from {STARTUP_MODULE} import MentalMathApp
+
+imported = time.perf_counter() - start
+
+
+async def exit_when_ready(pilot):
+    await pilot.pause()
+    pilot.app.exit(time.perf_counter() - start)
+
+
+ready = MentalMathApp().run(headless=True, auto_pilot=exit_when_ready)
+print(imported, ready)
+"""
+# The same for `mmath --ops multiplication=99,division=999 -n 50`: run until
+# the first question is on screen, skipping the menus.
+FIRST_QUESTION_SCRIPT = f"""
+import time
+
+start = time.perf_counter()
+from {STARTUP_MODULE} import MentalMathApp
+from mentalmath.presets import QuizSettings
+
+imported = time.perf_counter() - start
+quiz = QuizSettings({{"multiplication": 99, "division": 999}}, 50)
+
+
+def question_shown(app):
+    qui = getattr(app.screen, "qui", None)
+    return qui is not None and qui.shown_text
+
+
+async def exit_when_asked(pilot):
+    await pilot.pause()
+    while not question_shown(pilot.app):
+        await pilot.pause()
+    pilot.app.exit(time.perf_counter() - start)
+
+
+asked = MentalMathApp(quiz=quiz).run(headless=True, auto_pilot=exit_when_asked)
+print(imported, asked)
+"""
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run a fresh interpreter with the history kept out of the user's data."""
+    with tempfile.TemporaryDirectory() as directory:
+        env = {**os.environ, "MMATH_HISTORY": os.path.join(directory, "history")}
+        return subprocess.run(
+            [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+        )
+
+
+def import_times(module: str = STARTUP_MODULE) -> list[ImportTime]:
+    """What `python -X importtime` reports for importing module."""
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdecimal():
+            continue
+        times.append(ImportTime(name.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def time_to_main_menu() -> tuple[float, float]:
+    """Seconds to import the app and to paint the main menu, from a cold start."""
+    imported, ready = run_python("-c", READY_SCRIPT).stdout.split()
+    return float(imported), float(ready)
+
+
+def time_to_first_question() -> tuple[float, float]:
+    """Seconds to import the app and to show a --ops quiz's first question."""
+    imported, asked = run_python("-c", FIRST_QUESTION_SCRIPT).stdout.split()
+    return float(imported), float(asked)
+
+
+def print_startup_profile() -> None:
+    times = import_times()
+    total = sum(t.self_us for t in times)
+    by_package: defaultdict[str, int] = defaultdict(int)
+    for t in times:
+        by_package[t.module.partition(".")[0]] += t.self_us
+    print(f"Importing {STARTUP_MODULE}: {total / 1e3:.1f} ms in {len(times)} modules")
+    print("\nBy package (own time):")
+    for package, us in sorted(by_package.items(), key=lambda p: -p[1])[:10]:
+        print(f"  {package:<32}{us / 1e3:>8.1f} ms")
+    print("\nSlowest modules (including their imports):")
+    for t in sorted(times, key=lambda t: -t.cumulative_us)[:SLOWEST_MODULES]:
+        print(f"  {t.module:<32}{t.cumulative_us / 1e3:>8.1f} ms")
+    imported, ready = time_to_main_menu()
+    print(
+        f"\nMain menu painted after {ready * 1e3:.0f} ms "
+        f"({imported * 1e3:.0f} ms of it importing)."
+    )
+    imported, asked = time_to_first_question()
+    print(
+        f"First question of a --ops quiz shown after {asked * 1e3:.0f} ms "
+        f"({imported * 1e3:.0f} ms of it importing)."
+    )
@@ -0,0 +1,197 @@
+import csv
+import io
+import json
+import sys
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from mentalmath.config import CONFIG
+from mentalmath.parallel import ordered_map
+from mentalmath.presets import NUMBERED_OPERATIONS, parse_operations
+from mentalmath.questions.mix import OperationMix
+from mentalmath.seeding import stream
+
+if TYPE_CHECKING:
+    from mentalmath.operations import QuestionBatch
+
+# Questions generated and written at a time; memory use is a few chunks.
+CHUNK_SIZE: int = 4096
+FORMATS: dict[str, str] = {".csv": "csv", ".jsonl": "jsonl", ".txt": "text"}
+CSV_HEADER: tuple[str, ...] = ("number", "operation", "question", "answer")
+
+
+@dataclass
+class Chunk:
+    """One block of a worksheet, enough to generate and render it anywhere."""
+
+    op_maxes: dict[str, int]
+    seed: int
+    index: int
+    count: int
+    output_format: str
+    split_answers: bool
+    special: int | None = None
+
+    @property
+    def first_number(self) -> int:
+        return self.index * CHUNK_SIZE + 1
+
+
+def chunk_rows(chunk: Chunk) -> Iterator[tuple[int, str, QuestionBatch, int]]:
+    """(number, operation, batch, row in batch) for every question in a chunk.
+
+    Each chunk draws from its own stream of the seed, so a worksheet comes
+    out the same however its chunks are spread over workers.
+    """
+    rng = stream(chunk.seed, "worksheet", chunk.index)
+    mix = OperationMix(chunk.op_maxes)
+    operations = [mix.choose(rng) for _ in range(chunk.count)]
+    batches = {}
+    for name, count in Counter(operations).items():
+        question = CONFIG.OPERATIONS[name](rng=rng, num=chunk.special)
+        batches[name] = question.new_batch(chunk.op_maxes[name], count)
+    positions = dict.fromkeys(batches, 0)
+    for number, name in enumerate(operations, chunk.first_number):
+        i = positions[name]
+        positions[name] = i + 1
+        yield number, name, batches[name], i
+
+
+def text_rows(chunk: Chunk) -> Iterator[tuple[int, str, str, str]]:
+    """(number, operation, question, answer) for every question in a chunk."""
+    for number, name, batch, i in chunk_rows(chunk):
+        answer = batch.operation.answer_text(batch.correct[i])
+        yield number, name, batch.display(i), answer
+
+
+def record(number: int, name: str, batch: QuestionBatch, i: int) -> dict[str, object]:
+    """A question as a JSON Lines record, with what grading needs to check it."""
+    operation = batch.operation
+    return {
+        "number": number,
+        "operation": name,
+        "question": batch.display(i),
+        "left": batch.left[i],
+        "right": batch.right[i] if batch.right is not None else None,
+        "correct": operation.encode_correct(batch.correct[i]),
+    }
+
+
+def render_chunk(chunk: Chunk) -> tuple[str, str]:
+    """A chunk's questions and, if split_answers, its answer key, as text."""
+    questions, answers = io.StringIO(), io.StringIO()
+    if chunk.output_format == "csv":
+        question_writer, answer_writer = csv.writer(questions), csv.writer(answers)
+        for number, name, question, answer in text_rows(chunk):
+            if chunk.split_answers:
+                question_writer.writerow((number, name, question))
+                answer_writer.writerow((number, answer))
+            else:
+                question_writer.writerow((number, name, question, answer))
+    elif chunk.output_format == "jsonl":
+        for number, name, batch, i in chunk_rows(chunk):
+            row = record(number, name, batch, i)
+            answer = batch.operation.answer_text(batch.correct[i])
+            if chunk.split_answers:
+                answers.write(
+                    json.dumps({"number": number, "answer": answer}, ensure_ascii=False)
+                    + "\n"
+                )
+            else:
+                row["answer"] = answer
+            questions.write(json.dumps(row, ensure_ascii=False) + "\n")
+    else:
+        for number, _, question, answer in text_rows(chunk):
+            if chunk.split_answers:
+                questions.write(f"{number:>8}.  {question}\n")
+                answers.write(f"{number:>8}.  {answer}\n")
+            else:
+                questions.write(f"{number:>8}.  {question} = {answer}\n")
+    return questions.getvalue(), answers.getvalue()
+
+
+def chunks(
+    op_maxes: dict[str, int],
+    number_of_questions: int,
+    seed: int,
+    output_format: str,
+    split_answers: bool,
+    special: int | None = None,
+) -> Iterator[Chunk]:
+    for index, start in enumerate(range(0, number_of_questions, CHUNK_SIZE)):
+        count = min(CHUNK_SIZE, number_of_questions - start)
+        yield Chunk(op_maxes, seed, index, count, output_format, split_answers, special)
+
+
+def output_format_for(path: str | None, requested: str | None) -> str:
+    if requested is not None:
+        return requested
+    if path is None:
+        return "text"
+    return FORMATS.get(Path(path).suffix.lower(), "text")
+
+
+def write_worksheet(
+    op_maxes: dict[str, int],
+    number_of_questions: int,
+    seed: int,
+    output: TextIO,
+    answers: TextIO | None = None,
+    output_format: str = "text",
+    workers: int = 1,
+    special: int | None = None,
+    backend: str = "interpreter",
+) -> None:
+    """Stream a worksheet to output, with the answer key in answers if given."""
+    split_answers = answers is not None
+    if output_format == "csv":
+        header = CSV_HEADER[:3] if split_answers else CSV_HEADER
+        csv.writer(output).writerow(header)
+        if split_answers:
+            csv.writer(answers).writerow((CSV_HEADER[0], CSV_HEADER[3]))
+    work = chunks(
+        op_maxes, number_of_questions, seed, output_format, split_answers, special
+    )
+    for questions, key in ordered_map(render_chunk, work, workers, backend):
+        output.write(questions)
+        if split_answers:
+            answers.write(key)
+
+
+def run_worksheet(
+    operations: str,
+    number_of_questions: int,
+    seed: int,
+    output: str | None = None,
+    answers: str | None = None,
+    output_format: str | None = None,
+    workers: int = 1,
+    special: int | None = None,
+    backend: str = "interpreter",
+) -> None:
+    """The `mmath worksheet` command: open the files and write the worksheet."""
+    op_maxes = parse_operations(operations)
+    if special is None and NUMBERED_OPERATIONS & op_maxes.keys():
+        raise ValueError("times_tables and powers need --special, like --special 7")
+    with ExitStack() as stack:
+        out = sys.stdout
+        if output is not None:
+            out = stack.enter_context(open(output, "w", newline=""))
+        key = None
+        if answers is not None:
+            key = stack.enter_context(open(answers, "w", newline=""))
+        write_worksheet(
+            op_maxes,
+            number_of_questions,
+            seed,
+            out,
+            key,
+            output_format_for(output, output_format),
+            workers,
+            special,
+            backend,
+        )
@@ -0,0 +1,58 @@
+import ast
+import csv
+import json
+from array import array
+
+import pytest
+
+from mentalmath.data.export import (
+    NPY_HEADER_SIZE,
+    NUMERIC_COLUMNS,
+    SESSION_COLUMNS,
+    session_chunks,
+    write_export,
+)
+from mentalmath.data.session_log import SessionLog
+
+
+def session(n: int) -> SessionLog:
+    log = SessionLog()
+    for i in range(n):
+        log.append("+" if i % 3 else "×", i, i + 1, i / 4, i % 2, i % 5 == 0)
+    return log
+
+
+def read_npy(path) -> tuple[dict, array]:
+    data = path.read_bytes()
+    header = ast.literal_eval(data[10:NPY_HEADER_SIZE].decode("latin1"))
+    typecode = NUMERIC_COLUMNS.get(path.stem, "i")
+    return header, array(typecode, data[NPY_HEADER_SIZE:])
+
+
+def test_npy_columns_match_csv(tmp_path):
+    log = session(10_000)
+    write_export(session_chunks(log), SESSION_COLUMNS, str(tmp_path / "a.csv"))
+    write_export(session_chunks(log), SESSION_COLUMNS, str(tmp_path / "columns"))
+    with open(tmp_path / "a.csv", newline="") as file:
+        rows = list(csv.DictReader(file))
+    for name in SESSION_COLUMNS:
+        header, values = read_npy(tmp_path / "columns" / f"{name}.npy")
+        assert header["shape"] == (len(rows),)
+        if name in NUMERIC_COLUMNS:
+            assert [str(value) for value in values] == [
+                row[name].replace("True", "1").replace("False", "0") for row in rows
+            ]
+        else:
+            categories_path = tmp_path / "columns" / f"{name}.categories.json"
+            categories = json.loads(categories_path.read_text())
+            assert [str(categories[code]) for code in values] == [
+                row[name] for row in rows
+            ]
+
+
+def test_failed_npy_export_leaves_no_files(tmp_path):
+    directory = tmp_path / "columns"
+    (directory / "time.npy").mkdir(parents=True)
+    with pytest.raises(OSError):
+        write_export(session_chunks(session(10)), SESSION_COLUMNS, str(directory))
+    assert [path.name for path in directory.iterdir()] == ["time.npy"]
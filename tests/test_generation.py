@@ -0,0 +1,72 @@
+import random
+from statistics import fmean
+
+import pytest
+
+from mentalmath.config import BUILTIN_OPERATIONS, CONFIG
+from mentalmath.operations import QuestionInfo
+
+NAMES = [spec.name for spec in BUILTIN_OPERATIONS]
+TOP = 99
+SPECIAL = 7
+
+
+def make(name: str, seed: int = 0) -> QuestionInfo:
+    return CONFIG.OPERATIONS[name](rng=random.Random(seed), num=SPECIAL)
+
+
+def overrides_new_batch(name: str) -> bool:
+    return CONFIG.OPERATIONS[name].new_batch is not QuestionInfo.new_batch
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_batches_repeat_for_a_seed(name):
+    first, second = make(name).new_batch(TOP, 200), make(name).new_batch(TOP, 200)
+    assert [first.display(i) for i in range(200)] == [
+        second.display(i) for i in range(200)
+    ]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_batch_questions_accept_their_answers(name):
+    batch = make(name).new_batch(TOP, 500)
+    assert len(batch) == 500
+    for i in range(len(batch)):
+        question = batch.question(i)
+        assert question.verify_correct(question.answer_text(question.correct))
+
+
+@pytest.mark.parametrize(
+    "name", [name for name in NAMES if not overrides_new_batch(name)]
+)
+def test_default_batches_match_scalar_questions(name):
+    batch = make(name).new_batch(TOP, 200)
+    question = make(name)
+    for i in range(200):
+        question.new(TOP)
+        assert batch.display(i) == question.display
+        assert batch.correct[i] == question.correct
+
+
+@pytest.mark.parametrize("name", [name for name in NAMES if overrides_new_batch(name)])
+def test_column_draws_follow_the_scalar_distribution(name):
+    """Column-wise draws use the RNG differently from new(), so the questions
+    differ for the same seed, but each operand column keeps the same range and
+    close to the same mean."""
+    n = 20_000
+    batch = make(name).new_batch(TOP, n)
+    question = make(name, seed=1)
+    scalar = {"left": [], "right": []}
+    for _ in range(n):
+        question.new(TOP)
+        scalar["left"].append(question.left)
+        scalar["right"].append(question.right)
+    columns = {"left": batch.left, "right": batch.right}
+    for side, values in scalar.items():
+        column = columns[side]
+        if not isinstance(values[0], int) or column is None:
+            continue
+        assert min(column) >= min(values) - 1
+        assert max(column) <= max(values) + 1
+        spread = max(values) - min(values)
+        assert abs(fmean(column) - fmean(values)) <= 0.02 * spread + 0.5
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+
+import pytest
+
+from mentalmath.config import BUILTIN_OPERATIONS
+from mentalmath.grading import Grades, write_grades
+from mentalmath.worksheet import write_worksheet
+
+NAMES = [spec.name for spec in BUILTIN_OPERATIONS]
+TOP = 99
+SPECIAL = 7
+
+
+def worksheet(op_maxes: dict[str, int], n: int) -> tuple[str, list[dict]]:
+    """A JSON Lines worksheet and its answer key."""
+    questions, key = io.StringIO(), io.StringIO()
+    write_worksheet(op_maxes, n, 0, questions, key, "jsonl", special=SPECIAL)
+    return questions.getvalue(), [
+        json.loads(line) for line in key.getvalue().splitlines()
+    ]
+
+
+def answer_sheet(rows: list[tuple[int, str, object]]) -> str:
+    sheet = io.StringIO()
+    writer = csv.writer(sheet)
+    writer.writerow(("number", "answer", "time"))
+    writer.writerows(rows)
+    return sheet.getvalue()
+
+
+def grade(questions: str, answers: str) -> tuple[list[dict], Grades]:
+    output = io.StringIO()
+    grades = write_grades(io.StringIO(questions), io.StringIO(answers), output)
+    return list(csv.DictReader(io.StringIO(output.getvalue()))), grades
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_answer_key_grades_right(name):
+    questions, key = worksheet({name: TOP}, 300)
+    rows, grades = grade(
+        questions, answer_sheet([(a["number"], a["answer"], "") for a in key])
+    )
+    assert [row["result"] for row in rows] == ["right"] * 300
+    assert [row["correct_answer"] for row in rows] == [a["answer"] for a in key]
+    assert grades.results["right"] == grades.count == 300
+
+
+def test_wrong_and_unanswered_rows():
+    questions, key = worksheet({"multiplication": TOP}, 10)
+    answers = [
+        (1, key[0]["answer"], 2.5),
+        (2, key[1]["answer"] + "1", 4.0),
+        (3, " ", ""),
+    ]
+    rows, grades = grade(questions, answer_sheet(answers))
+    assert [row["result"] for row in rows] == ["right", "wrong"] + ["unanswered"] * 8
+    assert grades.results == {"right": 1, "wrong": 1, "unanswered": 8}
+    assert grades.by_operation["multiplication"]["right"] == 1
+    assert grades.stats.count == 2
+    assert grades.summary().startswith("Graded 10 questions: 1 right (10.0%)")
+
+
+def test_out_of_order_answers_raise():
+    questions, key = worksheet({"addition": TOP}, 5)
+    answers = [(2, key[1]["answer"], ""), (1, key[0]["answer"], "")]
+    with pytest.raises(ValueError, match="out of order"):
+        grade(questions, answer_sheet(answers))
+
+
+@pytest.mark.parametrize(
+    ("bad_line", "error"),
+    [
+        ('{"number": 2', "line 2: Expecting"),
+        ('{"number": 2}, {"number": 3}', "line 2: Extra data"),
+        ("[1]", "line 2: not a JSON object"),
+    ],
+)
+def test_bad_worksheet_lines_are_named(bad_line, error):
+    questions, _ = worksheet({"addition": TOP}, 3)
+    lines = questions.splitlines()
+    lines[1] = bad_line
+    with pytest.raises(ValueError, match=error):
+        grade("\n".join(lines) + "\n", answer_sheet([]))
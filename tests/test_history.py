@@ -0,0 +1,43 @@
+import threading
+
+from mentalmath.data.history import HistoryStore
+from mentalmath.data.session_log import SessionLog
+from mentalmath.questions.scheduler import Fact
+
+
+def test_operands_past_64_bits_are_kept(tmp_path):
+    history = HistoryStore(tmp_path / "history.sqlite3")
+    history.start()
+    log = SessionLog()
+    log.append("multiplication", 10**20, 3, 1.0, 0, False)
+    session_id = history.new_session({"multiplication": 10**21}, 1)
+    history.append(session_id, 1, log[1])
+    history.save_fact("multiplication", -(10**20), 3, Fact(1.0))
+    facts = history.load_facts(["multiplication"])
+    answers = [row for rows in history.answer_chunks() for row in rows]
+    history.close()
+    assert history.error is None
+    assert facts == [("multiplication", -(10**20), 3, 1.0, 0.0, 2.5, 0, 0)]
+    assert answers[0][3] == str(10**20)
+
+
+def test_writer_survives_values_it_cannot_store(tmp_path):
+    history = HistoryStore(tmp_path / "history.sqlite3")
+    history.start()
+    history.save_fact("multiplication", object(), 3, Fact(1.0))
+    history.flush()
+    history.save_fact("multiplication", 7, 8, Fact(1.0))
+    facts = history.load_facts(["multiplication"])
+    history.close()
+    assert history.error is not None
+    assert [fact[1:3] for fact in facts] == [(7, 8)]
+
+
+def test_flush_returns_when_the_writer_stops(tmp_path):
+    history = HistoryStore(tmp_path / "history.sqlite3")
+    stop = threading.Event()
+    history.writer = threading.Thread(target=stop.wait)
+    history.writer.start()
+    threading.Timer(0.2, stop.set).start()
+    history.flush()
+    assert not history.writer.is_alive()
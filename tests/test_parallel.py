@@ -0,0 +1,51 @@
+import sys
+import warnings
+
+import pytest
+
+from mentalmath.parallel import BACKENDS, InterpreterPoolExecutor, ordered_map
+
+
+def square(n: int) -> int:
+    return n * n
+
+
+def fail_on_three(n: int) -> int:
+    if n == 3:
+        raise ValueError(n)
+    return n
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_results_keep_their_order(backend):
+    assert list(ordered_map(square, range(50), 2, backend)) == [
+        n * n for n in range(50)
+    ]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_errors_in_the_work_are_not_retried(backend):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        with pytest.raises(Exception, match="3"):
+            list(ordered_map(fail_on_three, [3, 4, 5], 2, backend))
+
+
+def needs_the_main_interpreter(n: int) -> int:
+    from concurrent import interpreters
+
+    if interpreters.get_current() != interpreters.get_main():
+        raise ImportError("not in a subinterpreter")
+    return n
+
+
+@pytest.mark.skipif(sys.version_info < (3, 14), reason="no subinterpreter pools")
+def test_interpreter_backend_is_available():
+    assert InterpreterPoolExecutor is not None
+
+
+@pytest.mark.skipif(InterpreterPoolExecutor is None, reason="no subinterpreters")
+def test_work_that_cannot_load_in_a_subinterpreter_uses_processes():
+    with pytest.warns(RuntimeWarning, match="using processes"):
+        results = list(ordered_map(needs_the_main_interpreter, range(10), 2))
+    assert results == list(range(10))
@@ -0,0 +1,100 @@
+import random
+import re
+from collections.abc import Callable
+from math import isnan
+
+import pytest
+
+from mentalmath.parsing import (
+    scan_decimal,
+    scan_fraction,
+    scan_gaussian,
+    scan_integer,
+    scan_remainder,
+)
+
+# Fuzzed strings per scanner, checked against the regex and int()/float()
+# parsing that verify_correct used before mentalmath.parsing, which
+# benchmarks/bench_parsing.py also times the scanners against.
+CASES = 20_000
+ALPHABET = "0123456789  +-*/._eEiIjJrRnaf\t١٢ x"
+SAMPLES = {
+    "integer": ["4356", " -12 ", "1_000", "12a"],
+    "decimal": ["7.35", "-0.5e2", "1_0.5", "inf", "7."],
+    "fraction": ["161 / 27", "3/4", "12 /", "/4"],
+    "remainder": ["2 r 12", "17", "5R3", "r3"],
+    "gaussian": ["2434 + 4192i", "-74 - 12*j", "5+i", "3 + 4"],
+}
+
+
+def regex_gaussian(text: str) -> tuple[int, int]:
+    ex = r"^([+-]?)\s*(\d*)\s*([+-])\s*(\d*)\s*\*?\s*[iIjJ]"
+    numbers = re.match(ex, text)
+    if not numbers:
+        raise ValueError
+    return (
+        int(numbers.group(1) + numbers.group(2)),
+        int(numbers.group(3) + numbers.group(4)),
+    )
+
+
+def regex_fraction(text: str) -> tuple[int, int]:
+    numbers = re.match(r"([0-9]*)\s*/\s*([0-9]*)", text)
+    if not numbers:
+        raise ValueError
+    return (int(numbers.group(1)), int(numbers.group(2)))
+
+
+def regex_remainder(text: str) -> tuple[int, int]:
+    numbers = re.match(r"(\d+)(?:\s*[rR]\s*(\d+))?", text)
+    if not numbers:
+        raise ValueError
+    remainder = int(numbers.group(2)) if numbers.group(2) else 0
+    return (int(numbers.group(1)), remainder)
+
+
+PAIRS: dict[str, tuple[Callable, Callable]] = {
+    "integer": (int, scan_integer),
+    "decimal": (float, scan_decimal),
+    "fraction": (regex_fraction, scan_fraction),
+    "remainder": (regex_remainder, scan_remainder),
+    "gaussian": (regex_gaussian, scan_gaussian),
+}
+
+
+def reference(fn: Callable, text: str) -> object:
+    try:
+        return fn(text)
+    except ValueError:
+        return None
+
+
+def same(a: object, b: object) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and isnan(a):
+        return isnan(b)
+    return a == b
+
+
+def fuzz_case(rng: random.Random, name: str) -> str:
+    if rng.random() < 0.3:
+        text = rng.choice(SAMPLES[name])
+        i = rng.randrange(len(text) + 1)
+        return text[:i] + rng.choice(ALPHABET) + text[i:]
+    return "".join(rng.choices(ALPHABET, k=rng.randrange(12)))
+
+
+@pytest.mark.parametrize("name", PAIRS)
+def test_scanners_match_the_parsing_they_replaced(name):
+    old, new = PAIRS[name]
+    rng = random.Random(0)
+    for _ in range(CASES):
+        text = fuzz_case(rng, name)
+        expected, got = reference(old, text), new(text)
+        assert same(expected, got), f"{text!r} gave {got!r}, expected {expected!r}"
+
+
+@pytest.mark.parametrize("name", PAIRS)
+def test_scanners_read_the_samples(name):
+    old, new = PAIRS[name]
+    for text in SAMPLES[name]:
+        assert same(reference(old, text), new(text)), text
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from mentalmath.presets import (
+    QuizSettings,
+    load_preset,
+    load_presets,
+    parse_operations,
+    save_preset,
+)
+from mentalmath.startup import run_python
+
+
+def test_presets_round_trip(tmp_path):
+    path = tmp_path / "presets.json"
+    daily = QuizSettings({"multiplication": 99, "division": 999}, 50, timer=8.0)
+    save_preset("daily", daily, path)
+    save_preset("tables", QuizSettings({"times_tables": 12}, 20, special=7), path)
+    assert load_preset("daily", path) == daily
+    assert sorted(load_presets(path)) == ["daily", "tables"]
+    assert load_preset("daily", path).updated(number_of_questions=10, timer=None) == (
+        QuizSettings({"multiplication": 99, "division": 999}, 10, timer=8.0)
+    )
+
+
+@pytest.mark.parametrize(
+    "saved",
+    [
+        [],
+        {"daily": []},
+        {"daily": {"op_maxes": ["addition"], "number_of_questions": 5}},
+        {"daily": {"op_maxes": {"addition": "9"}, "number_of_questions": 5}},
+        {"daily": {"op_maxes": {"addition": 9}, "number_of_questions": "5"}},
+        {"daily": {"op_maxes": {"bogus": 9}, "number_of_questions": 5}},
+        {"daily": {"op_maxes": {"addition": 9}}},
+    ],
+)
+def test_malformed_presets_raise_value_error(tmp_path, saved):
+    path = tmp_path / "presets.json"
+    path.write_text(json.dumps(saved))
+    with pytest.raises(ValueError, match="valid presets"):
+        load_presets(path)
+
+
+def test_unknown_operations_are_rejected():
+    with pytest.raises(ValueError, match="bogus"):
+        parse_operations("addition=9,bogus=3")
+    with pytest.raises(ValueError, match="bogus"):
+        QuizSettings({"bogus": 3}, 5).check()
+
+
+def test_quick_start_does_not_scan_plugins():
+    script = (
+        "import sys\n"
+        "from mentalmath.presets import QuizSettings, parse_operations\n"
+        "QuizSettings(parse_operations('multiplication=99,division=999'), 50).check()\n"
+        "print('importlib.metadata' in sys.modules)"
+    )
+    assert run_python("-c", script).stdout.split() == ["False"]
@@ -0,0 +1,69 @@
+import asyncio
+from collections import Counter
+
+from mentalmath.main import MentalMathApp
+from mentalmath.presets import QuizSettings
+from mentalmath.questions.question_widgets import PROGRESS_STEPS
+
+# Long enough that the real timers never fire: the test ticks them itself.
+TIMER = 1000.0
+VANISH = 1000.0
+QUESTIONS = 5
+
+
+def counted(counts: Counter, widget: object, name: str) -> None:
+    """Count calls to one widget's method without changing what it does."""
+    original = getattr(widget, name)
+
+    def counting(*args: object, **kwargs: object) -> object:
+        counts[name] += 1
+        return original(*args, **kwargs)
+
+    setattr(widget, name, counting)
+
+
+async def drive(counts: Counter) -> tuple[Counter, list[str]]:
+    quiz = QuizSettings({"multiplication": 99}, 50, timer=TIMER, vanish=VANISH)
+    app = MentalMathApp(quiz=quiz, seed=0)
+    async with app.run_test() as pilot:
+        while not getattr(app.screen, "qui", None) or not app.screen.qui.shown_text:
+            await pilot.pause()
+        qui = app.screen.qui
+        counted(counts, qui.question_display, "update")
+        counted(counts, qui.progress_bar, "add_class")
+        counted(counts, qui.progress_bar, "remove_class")
+
+        qui.show_text(qui.shown_text)
+        qui.set_bar_state(qui.bar_state)
+        assert not counts, "unchanged state touched the widgets"
+
+        qui.show_text(qui.question.display + "?")
+        qui.set_bar_state("ending" if qui.bar_state == "normal" else "normal")
+        assert counts["update"] == 1
+        assert counts["add_class"] == 1
+        qui.show_text(qui.question.display)
+        qui.set_bar_state("normal")
+        counts.clear()
+
+        # Run each question's deadlines by hand: every progress tick, the
+        # question vanishing, then the time running out.
+        shown = []
+        for _ in range(QUESTIONS):
+            shown.append(qui.question.display)
+            for step in range(1, PROGRESS_STEPS + 1):
+                qui.timer = TIMER * step / PROGRESS_STEPS
+            qui.hide_question()
+            qui.out_of_time()
+        return counts.copy(), shown
+
+
+def test_question_widgets_skip_unchanged_updates(tmp_path, monkeypatch):
+    monkeypatch.setenv("MMATH_HISTORY", str(tmp_path / "history.sqlite3"))
+    counts, shown = asyncio.run(drive(Counter()))
+    assert len(set(shown)) == QUESTIONS
+    # Each question is hidden once and the next one shown, and the bar goes
+    # from normal to ending and back: the progress ticks in between change
+    # nothing and must not touch the widgets.
+    assert counts["update"] == 2 * QUESTIONS
+    assert counts["add_class"] == 2 * QUESTIONS
+    assert counts["remove_class"] == 2 * QUESTIONS
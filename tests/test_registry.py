@@ -0,0 +1,34 @@
+import importlib.metadata
+
+from mentalmath.config import BUILTIN_OPERATIONS
+from mentalmath.operations import Addition, Calendar
+from mentalmath.registry import ENTRY_POINT_GROUP, OperationRegistry
+
+
+def test_plugins_are_found_and_may_be_special(monkeypatch):
+    found = [
+        importlib.metadata.EntryPoint(
+            "doubling", "mentalmath.operations:Addition", ENTRY_POINT_GROUP
+        ),
+        importlib.metadata.EntryPoint(
+            "day_count", "mentalmath.operations:Calendar [special]", ENTRY_POINT_GROUP
+        ),
+    ]
+    monkeypatch.setattr(
+        importlib.metadata, "entry_points", lambda group: found if group else []
+    )
+    registry = OperationRegistry(BUILTIN_OPERATIONS)
+    assert "doubling" not in registry.menu_names()
+    registry.discover()
+    assert "doubling" in registry.menu_names()
+    assert "day_count" in registry.special_names()
+    assert "day_count" not in registry.menu_names()
+    assert registry["doubling"] is Addition
+    assert registry["day_count"] is Calendar
+
+
+def test_built_in_lookups_do_not_scan_entry_points():
+    registry = OperationRegistry(BUILTIN_OPERATIONS)
+    assert "addition" in registry
+    assert registry["calendar"] is Calendar
+    assert not registry.discovered
@@ -0,0 +1,117 @@
+import asyncio
+import random
+
+import pytest
+
+from mentalmath.config import BUILTIN_OPERATIONS, CONFIG
+from mentalmath.data.history import HistoryStore
+from mentalmath.main import MentalMathApp
+from mentalmath.operations import Multiplication
+from mentalmath.presets import QuizSettings
+from mentalmath.questions.scheduler import FactScheduler
+
+OP_MAXES = {"multiplication": 12}
+NAMES = [spec.name for spec in BUILTIN_OPERATIONS]
+# Operations whose operands are display text or a date, not numbers to ask.
+NOT_REPEATABLE = {
+    "complex_multiplication",
+    "fraction_addition",
+    "fraction_multiplication",
+    "calendar",
+}
+
+
+def saved_history(path) -> HistoryStore:
+    """A history with 7 × 8 saved as overdue."""
+    history = HistoryStore(path)
+    history.start()
+    clock = [0.0]
+    scheduler = FactScheduler(OP_MAXES, history=history, clock=lambda: clock[0])
+    question = Multiplication()
+    question.ask(7, 8)
+    scheduler.review(question, 2.0, 1, False)
+    history.flush()
+    return history
+
+
+def test_facts_are_loaded_only_when_asked(tmp_path):
+    history = saved_history(tmp_path / "history.sqlite3")
+    scheduler = FactScheduler(OP_MAXES, history=history, clock=lambda: 1e12)
+    assert scheduler.next_due() is None
+    scheduler.load()
+    history.close()
+    assert scheduler.next_due().display == "7 × 8"
+
+
+def test_facts_answered_before_loading_are_kept(tmp_path):
+    history = saved_history(tmp_path / "history.sqlite3")
+    scheduler = FactScheduler(OP_MAXES, history=history, clock=lambda: 0.0)
+    saved = scheduler.saved_facts()
+    question = Multiplication()
+    question.ask(7, 8)
+    scheduler.review(question, 2.0, 0, False)
+    answered = scheduler.facts[("multiplication", 7, 8)]
+    scheduler.add(saved)
+    history.close()
+    assert scheduler.facts[("multiplication", 7, 8)] is answered
+
+
+async def review_quiz(monkeypatch, tmp_path) -> list[str]:
+    history = saved_history(tmp_path / "history.sqlite3")
+    history.close()
+    monkeypatch.setenv("MMATH_HISTORY", str(tmp_path / "history.sqlite3"))
+    quiz = QuizSettings(OP_MAXES, 50, review=True)
+    app = MentalMathApp(quiz=quiz, seed=0)
+    asked = []
+    async with app.run_test() as pilot:
+        while not getattr(app.screen, "qui", None) or not app.screen.qui.shown_text:
+            await pilot.pause()
+        qui = app.screen.qui
+        while not qui.session.scheduler.facts:
+            await pilot.pause()
+        for _ in range(3):
+            asked.append(qui.question.display)
+            qui.answer_box.answer_box.value = str(qui.question.correct)
+            await pilot.press("enter")
+    return asked
+
+
+def test_quiz_loads_facts_in_the_background(monkeypatch, tmp_path):
+    asked = asyncio.run(review_quiz(monkeypatch, tmp_path))
+    assert "7 × 8" in asked[1:]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_repeatable_questions_can_be_asked_again(name):
+    cls = CONFIG.OPERATIONS[name]
+    question = cls(rng=random.Random(0), num=7)
+    question.new(99)
+    again = cls(num=7)
+    if not cls.repeatable:
+        with pytest.raises(NotImplementedError):
+            again.ask(question.left, question.right)
+        return
+    again.ask(question.left, question.right)
+    assert again.display == question.display
+    assert again.correct == question.correct
+    assert again.could_ask(question.left, question.right, 99)
+    assert again.verify_correct(question.answer_text(question.correct))
+
+
+def test_every_operation_fixed_by_its_operands_is_scheduled():
+    scheduler = FactScheduler(dict.fromkeys(NAMES, 99), special=7)
+    assert set(scheduler.operations) == set(NAMES) - NOT_REPEATABLE
+
+
+def test_unanswered_facts_stay_due():
+    clock = [0.0]
+    scheduler = FactScheduler(OP_MAXES, clock=lambda: clock[0])
+    question = Multiplication()
+    question.ask(7, 8)
+    scheduler.review(question, 2.0, 1, False)
+    clock[0] = 1e6
+    assert scheduler.next_due().display == "7 × 8"
+    assert scheduler.next_due().display == "7 × 8"
+    scheduler.review(scheduler.next_due(), 2.0, 0, False)
+    assert scheduler.next_due() is None
+    assert len(scheduler.heap) == 1
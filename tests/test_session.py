@@ -0,0 +1,42 @@
+import threading
+
+from mentalmath.questions.session import QuizSession
+
+OP_MAXES = {"multiplication": 12, "division": 99}
+
+
+def asked(session: QuizSession) -> list[str]:
+    displays = []
+    t = 0.0
+    while (question := session.next_question(t)) is not None:
+        displays.append(question.display)
+        session.submit(question.answer_text(question.correct), t + 1)
+        t += 2
+    return displays
+
+
+def test_same_seed_same_quiz():
+    assert asked(QuizSession(OP_MAXES, 20, seed=42)) == asked(
+        QuizSession(OP_MAXES, 20, seed=42)
+    )
+
+
+def test_restart_replays_the_seed_it_is_given():
+    session = QuizSession(OP_MAXES, 20, seed=42)
+    worker = threading.Thread(target=session.prefetch.fill)
+    worker.start()
+    first = asked(session)
+    session.restart(42)
+    again = asked(session)
+    session.prefetch.stop()
+    worker.join()
+    assert again == first
+    assert len(session.answer_data) == 20
+
+
+def test_restart_without_a_seed_reproduces_from_the_new_one():
+    session = QuizSession(OP_MAXES, 20, seed=42)
+    asked(session)
+    session.restart()
+    assert session.seed != 42
+    assert asked(session) == asked(QuizSession(OP_MAXES, 20, seed=session.seed))
@@ -0,0 +1,31 @@
+import os
+import statistics
+
+import pytest
+
+from mentalmath.startup import (
+    DEFERRED_MODULES,
+    STARTUP_BUDGET_MS,
+    STARTUP_MODULE,
+    run_python,
+    time_to_main_menu,
+)
+
+RUNS = 3
+
+
+def test_importing_the_app_defers_slow_modules():
+    script = (
+        f"import sys, {STARTUP_MODULE}\n"
+        f"print(*(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    assert run_python("-c", script).stdout.split() == []
+
+
+# Wall-clock timings depend on the machine's load, so only run when asked.
+@pytest.mark.skipif(
+    not os.environ.get("MMATH_PERF_TESTS"), reason="set MMATH_PERF_TESTS to run"
+)
+def test_main_menu_within_budget():
+    ready = statistics.median(time_to_main_menu()[1] for _ in range(RUNS))
+    assert ready * 1e3 <= STARTUP_BUDGET_MS
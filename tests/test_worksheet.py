@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+
+import pytest
+
+from mentalmath.worksheet import (
+    CHUNK_SIZE,
+    output_format_for,
+    run_worksheet,
+    write_worksheet,
+)
+
+OP_MAXES = {"multiplication": 99, "division": 999, "fraction_addition": 12}
+# Enough questions for three chunks, the last one short.
+QUESTIONS = 2 * CHUNK_SIZE + 100
+
+
+def written(output_format: str, workers: int = 1, backend: str = "serial") -> tuple:
+    output, answers = io.StringIO(), io.StringIO()
+    write_worksheet(
+        OP_MAXES, QUESTIONS, 5, output, answers, output_format, workers, None, backend
+    )
+    return output.getvalue(), answers.getvalue()
+
+
+@pytest.mark.parametrize("output_format", ["csv", "jsonl", "text"])
+def test_workers_and_backends_write_the_same_worksheet(output_format):
+    serial = written(output_format)
+    assert written(output_format, 2, "serial") == serial
+    assert written(output_format, 2, "process") == serial
+
+
+def test_numbers_run_on_across_chunks():
+    questions, answers = written("jsonl")
+    numbers = [json.loads(line)["number"] for line in questions.splitlines()]
+    assert numbers == list(range(1, QUESTIONS + 1))
+    numbers = [json.loads(line)["number"] for line in answers.splitlines()]
+    assert numbers == list(range(1, QUESTIONS + 1))
+
+
+def test_answers_split_into_their_own_file(tmp_path):
+    operations = "multiplication=99,complex_multiplication=9"
+    for suffix in (".csv", ".jsonl", ".txt"):
+        whole, questions, answers = (
+            tmp_path / f"{name}{suffix}" for name in ("whole", "questions", "answers")
+        )
+        run_worksheet(operations, 50, 3, str(whole))
+        run_worksheet(operations, 50, 3, str(questions), str(answers))
+        whole, questions, answers = (
+            path.read_text().splitlines() for path in (whole, questions, answers)
+        )
+        assert len(whole) == len(questions) == len(answers)
+        if suffix == ".csv":
+            rows = list(csv.reader(whole))
+            assert list(csv.reader(questions)) == [row[:3] for row in rows]
+            assert list(csv.reader(answers)) == [[row[0], row[3]] for row in rows]
+        elif suffix == ".jsonl":
+            for line, question, answer in zip(whole, questions, answers, strict=True):
+                record = json.loads(line)
+                assert json.loads(answer) == {
+                    "number": record["number"],
+                    "answer": record.pop("answer"),
+                }
+                assert json.loads(question) == record
+        else:
+            for line, question, answer in zip(whole, questions, answers, strict=True):
+                number, answer_text = answer.split(".  ", 1)
+                assert line == f"{question} = {answer_text}"
+                assert question.startswith(number + ".  ")
+
+
+def test_output_format_follows_the_extension():
+    assert output_format_for(None, None) == "text"
+    assert output_format_for("sheet.CSV", None) == "csv"
+    assert output_format_for("sheet.jsonl", None) == "jsonl"
+    assert output_format_for("sheet.txt", None) == "text"
+    assert output_format_for("sheet.pdf", None) == "text"
+    assert output_format_for("sheet.txt", "csv") == "csv"
+
+
+@pytest.mark.parametrize("operation", ["times_tables", "powers"])
+def test_numbered_operations_need_special(operation, tmp_path):
+    with pytest.raises(ValueError, match="--special"):
+        run_worksheet(f"{operation}=12", 10, 0, str(tmp_path / "sheet.txt"))